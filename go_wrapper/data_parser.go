@@ -1380,7 +1380,6 @@ func RunAttacksParse(filePath string, config AttacksConfig) (*AttacksResult, err
 	// Post-process: add game time to events
 	for i := range result.Events {
 		result.Events[i].GameTime = TickToGameTime(uint32(result.Events[i].Tick), gameStartTick)
-		result.Events[i].GameTimeStr = FormatGameTime(result.Events[i].GameTime)
 	}
 
 	result.TotalEvents = len(result.Events)
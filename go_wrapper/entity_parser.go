@@ -787,6 +787,12 @@ func extractTeamState(team *manta.Entity) TeamState {
 
 // extractFullHeroSnapshot extracts complete hero state including abilities, talents, and economy
 func extractFullHeroSnapshot(entity *manta.Entity, playerIdx int, heroID int, parser *manta.Parser, economy *EconomyData) HeroSnapshot {
+	return extractHeroSnapshot(entity, playerIdx, heroID, parser, economy, defaultSnapshotOptions())
+}
+
+// extractHeroSnapshot extracts hero state, skipping abilities/talents and
+// inventory when options disable them
+func extractHeroSnapshot(entity *manta.Entity, playerIdx int, heroID int, parser *manta.Parser, economy *EconomyData, options SnapshotOptions) HeroSnapshot {
 	entityID := int(entity.GetIndex())
 	hero := HeroSnapshot{
 		HeroName:   entityClassToHeroName(entity.GetClassName()),
@@ -904,8 +910,10 @@ func extractFullHeroSnapshot(entity *manta.Entity, playerIdx int, heroID int, pa
 	}
 
 	// Extract abilities and talents
-	if parser != nil {
+	if parser != nil && options.IncludeAbilities {
 		extractAbilitiesForSnapshot(entity, parser, &hero)
+	}
+	if parser != nil && options.IncludeInventory {
 		extractInventoryForSnapshot(entity, parser, &hero)
 	}
 
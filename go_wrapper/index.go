@@ -32,6 +32,18 @@ type DemoIndex struct {
 	Error       string     `json:"error,omitempty"`
 }
 
+// IndexBatchConfig configures building indexes at several intervals in one pass
+type IndexBatchConfig struct {
+	IntervalTicks []int `json:"interval_ticks"`
+}
+
+// IndexBatchResult holds one index per requested interval, in request order
+type IndexBatchResult struct {
+	Indexes []*DemoIndex `json:"indexes"`
+	Success bool         `json:"success"`
+	Error   string       `json:"error,omitempty"`
+}
+
 // EntityStateSnapshot captures entity states at a specific tick
 // Note: HeroSnapshot, AbilitySnapshot, TalentChoice are defined in types.go
 type EntityStateSnapshot struct {
@@ -52,8 +64,34 @@ type EntityStateSnapshot struct {
 
 // SnapshotConfig configures snapshot capture
 type SnapshotConfig struct {
-	TargetTick       int  `json:"target_tick"`
+	TargetTick int `json:"target_tick"`
+	SnapshotOptions
+}
+
+// SnapshotBatchConfig configures capture of several snapshots in one pass
+type SnapshotBatchConfig struct {
+	TargetTicks []int `json:"target_ticks"`
+	SnapshotOptions
+}
+
+// SnapshotOptions selects what each captured snapshot includes
+type SnapshotOptions struct {
 	IncludeIllusions bool `json:"include_illusions"`
+	IncludeAbilities bool `json:"include_abilities"` // Abilities and talents
+	IncludeInventory bool `json:"include_inventory"`
+}
+
+// defaultSnapshotOptions includes abilities and inventory unless a config
+// explicitly disables them
+func defaultSnapshotOptions() SnapshotOptions {
+	return SnapshotOptions{IncludeAbilities: true, IncludeInventory: true}
+}
+
+// SnapshotBatchResult holds one snapshot per requested tick, in request order
+type SnapshotBatchResult struct {
+	Snapshots []*EntityStateSnapshot `json:"snapshots"`
+	Success   bool                   `json:"success"`
+	Error     string                 `json:"error,omitempty"`
 }
 
 // RangeParseConfig configures range-based parsing
@@ -103,30 +141,93 @@ func BuildIndex(filePath *C.char, intervalTicks C.int) (cResult *C.char) {
 	return C.CString(string(jsonResult))
 }
 
-func buildDemoIndex(filePath string, intervalTicks int) *DemoIndex {
-	file, err := os.Open(filePath)
-	if err != nil {
-		return &DemoIndex{
+//export BuildIndexes
+func BuildIndexes(filePath *C.char, configJSON *C.char) (cResult *C.char) {
+	path := C.GoString(filePath)
+	configStr := C.GoString(configJSON)
+
+	// Recover from any panics in manta library
+	defer func() {
+		if r := recover(); r != nil {
+			result := &IndexBatchResult{
+				Success: false,
+				Error:   fmt.Sprintf("panic during parsing: %v", r),
+			}
+			jsonResult, _ := json.Marshal(result)
+			cResult = C.CString(string(jsonResult))
+		}
+	}()
+
+	var config IndexBatchConfig
+	if err := json.Unmarshal([]byte(configStr), &config); err != nil {
+		result := &IndexBatchResult{
 			Success: false,
-			Error:   fmt.Sprintf("Failed to open file: %v", err),
+			Error:   fmt.Sprintf("Invalid config: %v", err),
 		}
+		jsonResult, _ := json.Marshal(result)
+		return C.CString(string(jsonResult))
 	}
-	defer file.Close()
 
-	parser, err := manta.NewStreamParser(file)
+	intervals := make([]int, len(config.IntervalTicks))
+	for i, interval := range config.IntervalTicks {
+		if interval <= 0 {
+			interval = 1800 // Same default as BuildIndex
+		}
+		intervals[i] = interval
+	}
+
+	result := &IndexBatchResult{Success: true}
+	indexes, err := buildDemoIndexes(path, intervals)
+	if err != nil {
+		result.Success = false
+		result.Error = err.Error()
+	} else {
+		result.Indexes = indexes
+	}
+	jsonResult, _ := json.Marshal(result)
+	return C.CString(string(jsonResult))
+}
+
+func buildDemoIndex(filePath string, intervalTicks int) *DemoIndex {
+	indexes, err := buildDemoIndexes(filePath, []int{intervalTicks})
 	if err != nil {
 		return &DemoIndex{
 			Success: false,
-			Error:   fmt.Sprintf("Failed to create parser: %v", err),
+			Error:   err.Error(),
 		}
 	}
+	return indexes[0]
+}
 
-	index := &DemoIndex{
-		Keyframes: make([]Keyframe, 0),
-		Success:   true,
+// buildDemoIndexes builds one keyframe index per interval during a single
+// walk of the demo. Each index keeps its own last-keyframe tick, so the result
+// for an interval is identical to a separate buildDemoIndex call.
+func buildDemoIndexes(filePath string, intervals []int) ([]*DemoIndex, error) {
+	indexes := make([]*DemoIndex, len(intervals))
+	lastKeyframeTicks := make([]int, len(intervals))
+	for i, interval := range intervals {
+		indexes[i] = &DemoIndex{
+			Keyframes: make([]Keyframe, 0),
+			Success:   true,
+		}
+		lastKeyframeTicks[i] = -interval
+	}
+	if len(intervals) == 0 {
+		return indexes, nil
+	}
+
+	file, err := os.Open(filePath)
+	if err != nil {
+		return nil, fmt.Errorf("Failed to open file: %v", err)
 	}
+	defer file.Close()
 
-	lastKeyframeTick := -intervalTicks
+	parser, err := manta.NewStreamParser(file)
+	if err != nil {
+		return nil, fmt.Errorf("Failed to create parser: %v", err)
+	}
+
+	var gameStarted int
 	var gameStartTick uint32
 	var gameStartTime float32
 
@@ -144,7 +245,7 @@ func buildDemoIndex(filePath string, intervalTicks int) *DemoIndex {
 			if gst, ok := e.GetFloat32("m_pGameRules.m_flGameStartTime"); ok && gst > 0 && gameStartTime == 0 {
 				gameStartTime = gst
 				gameStartTick = parser.Tick
-				index.GameStarted = currentTick
+				gameStarted = currentTick
 			}
 		}
 
@@ -153,17 +254,20 @@ func buildDemoIndex(filePath string, intervalTicks int) *DemoIndex {
 			return nil
 		}
 
-		// Add keyframe if enough ticks have passed
-		if currentTick-lastKeyframeTick >= intervalTicks {
+		// Add a keyframe to each index whose interval has elapsed
+		for i, interval := range intervals {
+			if currentTick-lastKeyframeTicks[i] < interval {
+				continue
+			}
 			// Calculate game time using centralized conversion
 			gameTime := TickToGameTime(parser.Tick, gameStartTick)
 
-			index.Keyframes = append(index.Keyframes, Keyframe{
+			indexes[i].Keyframes = append(indexes[i].Keyframes, Keyframe{
 				Tick:     currentTick,
 				NetTick:  int(parser.NetTick),
 				GameTime: gameTime,
 			})
-			lastKeyframeTick = currentTick
+			lastKeyframeTicks[i] = currentTick
 		}
 
 		return nil
@@ -171,15 +275,15 @@ func buildDemoIndex(filePath string, intervalTicks int) *DemoIndex {
 
 	// Parse entire file
 	if err := parser.Start(); err != nil {
-		return &DemoIndex{
-			Success: false,
-			Error:   fmt.Sprintf("Parse failed: %v", err),
-		}
+		return nil, fmt.Errorf("Parse failed: %v", err)
 	}
 
-	index.TotalTicks = int(parser.Tick)
+	for _, index := range indexes {
+		index.GameStarted = gameStarted
+		index.TotalTicks = int(parser.Tick)
+	}
 
-	return index
+	return indexes, nil
 }
 
 //export GetSnapshot
@@ -199,7 +303,7 @@ func GetSnapshot(filePath *C.char, configJSON *C.char) (cResult *C.char) {
 		}
 	}()
 
-	var config SnapshotConfig
+	config := SnapshotConfig{SnapshotOptions: defaultSnapshotOptions()}
 	if err := json.Unmarshal([]byte(configStr), &config); err != nil {
 		result := &EntityStateSnapshot{
 			Success: false,
@@ -214,32 +318,96 @@ func GetSnapshot(filePath *C.char, configJSON *C.char) (cResult *C.char) {
 	return C.CString(string(jsonResult))
 }
 
-func getEntitySnapshot(filePath string, config SnapshotConfig) *EntityStateSnapshot {
-	file, err := os.Open(filePath)
-	if err != nil {
-		return &EntityStateSnapshot{
+//export GetSnapshots
+func GetSnapshots(filePath *C.char, configJSON *C.char) (cResult *C.char) {
+	path := C.GoString(filePath)
+	configStr := C.GoString(configJSON)
+
+	// Recover from any panics in manta library
+	defer func() {
+		if r := recover(); r != nil {
+			result := &SnapshotBatchResult{
+				Success: false,
+				Error:   fmt.Sprintf("panic during parsing: %v", r),
+			}
+			jsonResult, _ := json.Marshal(result)
+			cResult = C.CString(string(jsonResult))
+		}
+	}()
+
+	config := SnapshotBatchConfig{SnapshotOptions: defaultSnapshotOptions()}
+	if err := json.Unmarshal([]byte(configStr), &config); err != nil {
+		result := &SnapshotBatchResult{
 			Success: false,
-			Error:   fmt.Sprintf("Failed to open file: %v", err),
+			Error:   fmt.Sprintf("Invalid config: %v", err),
 		}
+		jsonResult, _ := json.Marshal(result)
+		return C.CString(string(jsonResult))
 	}
-	defer file.Close()
 
-	parser, err := manta.NewStreamParser(file)
+	result := &SnapshotBatchResult{Success: true}
+	snapshots, err := getEntitySnapshots(path, config.TargetTicks, config.SnapshotOptions)
+	if err != nil {
+		result.Success = false
+		result.Error = err.Error()
+	} else {
+		result.Snapshots = snapshots
+	}
+	jsonResult, _ := json.Marshal(result)
+	return C.CString(string(jsonResult))
+}
+
+func getEntitySnapshot(filePath string, config SnapshotConfig) *EntityStateSnapshot {
+	snapshots, err := getEntitySnapshots(filePath, []int{config.TargetTick}, config.SnapshotOptions)
 	if err != nil {
 		return &EntityStateSnapshot{
 			Success: false,
-			Error:   fmt.Sprintf("Failed to create parser: %v", err),
+			Error:   err.Error(),
 		}
 	}
+	return snapshots[0]
+}
+
+// getEntitySnapshots captures a snapshot at each target tick during a single
+// walk of the demo, stopping once the latest target is reached. Snapshots are
+// returned in the order of targetTicks; targets past the end of the demo get
+// an empty snapshot, as a single GetSnapshot call would.
+func getEntitySnapshots(filePath string, targetTicks []int, options SnapshotOptions) ([]*EntityStateSnapshot, error) {
+	snapshots := make([]*EntityStateSnapshot, len(targetTicks))
+	for i := range snapshots {
+		snapshots[i] = &EntityStateSnapshot{
+			Heroes:  make([]HeroSnapshot, 0),
+			Success: true,
+		}
+	}
+	if len(targetTicks) == 0 {
+		return snapshots, nil
+	}
+
+	// Visit targets in tick order; each is captured the first time the
+	// parser reaches it, exactly where a single-target walk would stop
+	order := make([]int, len(targetTicks))
+	for i := range order {
+		order[i] = i
+	}
+	sort.SliceStable(order, func(a, b int) bool {
+		return targetTicks[order[a]] < targetTicks[order[b]]
+	})
+	next := 0
+
+	file, err := os.Open(filePath)
+	if err != nil {
+		return nil, fmt.Errorf("Failed to open file: %v", err)
+	}
+	defer file.Close()
 
-	snapshot := &EntityStateSnapshot{
-		Heroes:  make([]HeroSnapshot, 0),
-		Success: true,
+	parser, err := manta.NewStreamParser(file)
+	if err != nil {
+		return nil, fmt.Errorf("Failed to create parser: %v", err)
 	}
 
 	var gameStartTick uint32
 	var gameStartTime float32
-	reachedTarget := false
 
 	// Track entities by their index (handle)
 	heroByIndex := make(map[uint32]*manta.Entity)
@@ -249,7 +417,7 @@ func getEntitySnapshot(filePath string, config SnapshotConfig) *EntityStateSnaps
 	var gameRulesProxy *manta.Entity
 
 	parser.OnEntity(func(e *manta.Entity, op manta.EntityOp) error {
-		if e == nil || reachedTarget {
+		if e == nil || next >= len(order) {
 			return nil
 		}
 
@@ -304,9 +472,10 @@ func getEntitySnapshot(filePath string, config SnapshotConfig) *EntityStateSnaps
 			}
 		}
 
-		// Check if we've reached target tick
-		if currentTick >= config.TargetTick {
-			reachedTarget = true
+		// Capture every target reached by this tick
+		for next < len(order) && currentTick >= targetTicks[order[next]] {
+			snapshot := snapshots[order[next]]
+			next++
 			snapshot.Tick = currentTick
 			snapshot.NetTick = int(parser.NetTick)
 
@@ -346,13 +515,13 @@ func getEntitySnapshot(filePath string, config SnapshotConfig) *EntityStateSnaps
 					// Extract economy data
 					economy := extractEconomyData(playerResource, dataRadiant, dataDire, playerIdx, team, teamSlot)
 
-					hero := extractFullHeroSnapshot(entity, playerIdx, 0, parser, &economy)
+					hero := extractHeroSnapshot(entity, playerIdx, 0, parser, &economy, options)
 					snapshot.Heroes = append(snapshot.Heroes, hero)
 				}
 			}
 
 			// If include_illusions is enabled, add clones/illusions
-			if config.IncludeIllusions {
+			if options.IncludeIllusions {
 				for idx, entity := range heroByIndex {
 					if entity == nil {
 						continue
@@ -370,7 +539,7 @@ func getEntitySnapshot(filePath string, config SnapshotConfig) *EntityStateSnaps
 						playerID = int(pid) / 2
 					}
 
-					hero := extractFullHeroSnapshot(entity, playerID, 0, parser, nil)
+					hero := extractHeroSnapshot(entity, playerID, 0, parser, nil, options)
 
 					// Check if it's an illusion or clone
 					if isIllusion, ok := entity.GetBool("m_bIsIllusion"); ok && isIllusion {
@@ -405,20 +574,21 @@ func getEntitySnapshot(filePath string, config SnapshotConfig) *EntityStateSnaps
 					snapshot.IsNight = netTOD < 20000
 				}
 			}
-
+		}
+		if next >= len(order) {
 			return fmt.Errorf("target reached") // Stop parsing
 		}
 
 		return nil
 	})
 
-	// Parse until target tick
+	// Parse until the latest target tick
 	parser.Start()
 
-	return snapshot
+	return snapshots, nil
 }
 
-// Note: extractFullHeroSnapshot and extractAbilitiesForSnapshot are defined in entity_parser.go
+// Note: extractHeroSnapshot and extractAbilitiesForSnapshot are defined in entity_parser.go
 
 //export ParseRange
 func ParseRange(filePath *C.char, configJSON *C.char) (cResult *C.char) {
@@ -486,14 +656,6 @@ func parseRange(filePath string, config RangeParseConfig) *RangeParseResult {
 	inRange := false
 	pastRange := false
 
-	// Helper to resolve string indices
-	getName := func(idx uint32) string {
-		if name, ok := parser.LookupStringByIndex("CombatLogNames", int32(idx)); ok {
-			return name
-		}
-		return fmt.Sprintf("unknown_%d", idx)
-	}
-
 	// Combat log callback
 	if config.CombatLog {
 		parser.Callbacks.OnCMsgDOTACombatLogEntry(func(m *dota.CMsgDOTACombatLogEntry) error {
@@ -504,33 +666,7 @@ func parseRange(filePath string, config RangeParseConfig) *RangeParseResult {
 					result.ActualStart = tick
 				}
 
-				// Resolve string names
-				targetName := getName(m.GetTargetName())
-				attackerName := getName(m.GetAttackerName())
-				inflictor := getName(m.GetInflictorName())
-				sourceName := getName(m.GetDamageSourceName())
-
-				entry := map[string]interface{}{
-					"tick":               tick,
-					"type":               m.GetType(),
-					"target_name":        targetName,
-					"attacker_name":      attackerName,
-					"inflictor_name":     inflictor,
-					"damage_source_name": sourceName,
-					"value":              m.GetValue(),
-					"health":             m.GetHealth(),
-					"timestamp":          m.GetTimestamp(),
-				}
-
-				// Add additional fields if present
-				if m.GetIsAttackerIllusion() {
-					entry["is_attacker_illusion"] = true
-				}
-				if m.GetIsTargetIllusion() {
-					entry["is_target_illusion"] = true
-				}
-
-				result.CombatLog = append(result.CombatLog, entry)
+				result.CombatLog = append(result.CombatLog, rangeCombatLogEntry(parser, m, tick))
 			} else if tick > config.EndTick {
 				pastRange = true
 			}
@@ -579,6 +715,40 @@ func parseRange(filePath string, config RangeParseConfig) *RangeParseResult {
 	return result
 }
 
+// rangeCombatLogEntry converts a combat log message into the entry format
+// returned by ParseRange, with string table indices resolved to names.
+func rangeCombatLogEntry(parser *manta.Parser, m *dota.CMsgDOTACombatLogEntry, tick int) map[string]interface{} {
+	// Helper to resolve string indices
+	getName := func(idx uint32) string {
+		if name, ok := parser.LookupStringByIndex("CombatLogNames", int32(idx)); ok {
+			return name
+		}
+		return fmt.Sprintf("unknown_%d", idx)
+	}
+
+	entry := map[string]interface{}{
+		"tick":               tick,
+		"type":               m.GetType(),
+		"target_name":        getName(m.GetTargetName()),
+		"attacker_name":      getName(m.GetAttackerName()),
+		"inflictor_name":     getName(m.GetInflictorName()),
+		"damage_source_name": getName(m.GetDamageSourceName()),
+		"value":              m.GetValue(),
+		"health":             m.GetHealth(),
+		"timestamp":          m.GetTimestamp(),
+	}
+
+	// Add additional fields if present
+	if m.GetIsAttackerIllusion() {
+		entry["is_attacker_illusion"] = true
+	}
+	if m.GetIsTargetIllusion() {
+		entry["is_target_illusion"] = true
+	}
+
+	return entry
+}
+
 //export FindKeyframe
 func FindKeyframe(indexJSON *C.char, targetTick C.int) *C.char {
 	indexStr := C.GoString(indexJSON)
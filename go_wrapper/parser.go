@@ -576,7 +576,6 @@ func RunParse(filePath string, config ParseConfig) (*ParseResult, error) {
 				Dodgeable:       m.GetDodgeable(),
 				LaunchTick:      int(m.GetLaunchTick()),
 				GameTime:        gt,
-				GameTimeStr:     FormatGameTime(gt),
 				IsMelee:         false,
 				AttackerName:    attackerName,
 				TargetName:      targetName,
@@ -638,7 +637,6 @@ func RunParse(filePath string, config ParseConfig) (*ParseResult, error) {
 				SourceIndex:        sourceIndex,
 				TargetIndex:        targetIndex,
 				GameTime:           gt,
-				GameTimeStr:        FormatGameTime(gt),
 				IsMelee:            true,
 				AttackerName:       attackerName,
 				TargetName:         targetName,
@@ -989,7 +987,6 @@ func RunParse(filePath string, config ParseConfig) (*ParseResult, error) {
 		// Post-process: add game time to events
 		for i := range attacksResult.Events {
 			attacksResult.Events[i].GameTime = TickToGameTime(uint32(attacksResult.Events[i].Tick), gameStartTick)
-			attacksResult.Events[i].GameTimeStr = FormatGameTime(attacksResult.Events[i].GameTime)
 		}
 		attacksResult.TotalEvents = len(attacksResult.Events)
 		result.Attacks = attacksResult
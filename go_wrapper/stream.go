@@ -106,6 +106,20 @@ func StreamOpen(filePath *C.char, configJSON *C.char) *C.char {
 		return C.CString(string(jsonResult))
 	}
 
+	return openStream(path, config, runStreamParser)
+}
+
+//export StreamCombatLogRange
+func StreamCombatLogRange(filePath *C.char, startTick C.int, endTick C.int) *C.char {
+	config := StreamConfig{CombatLog: true}
+	return openStream(C.GoString(filePath), config, func(h *StreamHandle) {
+		runCombatLogRangeStream(h, int(startTick), int(endTick))
+	})
+}
+
+// openStream opens path, starts run on a new handle in a goroutine and
+// returns the StreamOpen JSON result with the handle ID.
+func openStream(path string, config StreamConfig, run func(*StreamHandle)) *C.char {
 	// Open file
 	file, err := os.Open(path)
 	if err != nil {
@@ -144,7 +158,7 @@ func StreamOpen(filePath *C.char, configJSON *C.char) *C.char {
 	handleID := storeHandle(handle)
 
 	// Start parsing in goroutine
-	go runStreamParser(handle)
+	go run(handle)
 
 	result := map[string]interface{}{
 		"success":   true,
@@ -154,6 +168,41 @@ func StreamOpen(filePath *C.char, configJSON *C.char) *C.char {
 	return C.CString(string(jsonResult))
 }
 
+// runCombatLogRangeStream yields combat log entries within [startTick, endTick]
+// in the ParseRange entry format, stopping the parser once past endTick.
+func runCombatLogRangeStream(h *StreamHandle, startTick, endTick int) {
+	defer func() {
+		h.completed.Store(true)
+		close(h.events)
+	}()
+
+	h.parser.Callbacks.OnCMsgDOTACombatLogEntry(func(m *dota.CMsgDOTACombatLogEntry) error {
+		tick := int(h.parser.Tick)
+		if tick < startTick {
+			return nil
+		}
+		if tick > endTick {
+			h.parser.Stop()
+			return nil
+		}
+
+		select {
+		case h.events <- StreamEvent{
+			Kind:    "combat_log",
+			Tick:    tick,
+			NetTick: int(h.parser.NetTick),
+			Type:    "CMsgDOTACombatLogEntry",
+			Data:    rangeCombatLogEntry(h.parser, m, tick),
+		}:
+		case <-h.done:
+			return fmt.Errorf("stream closed")
+		}
+		return nil
+	})
+
+	h.err = h.parser.Start()
+}
+
 func runStreamParser(h *StreamHandle) {
 	defer func() {
 		h.completed.Store(true)
@@ -200,8 +200,7 @@ type AttackEvent struct {
 	ProjectileSpeed int     `json:"projectile_speed"`  // Projectile move speed (0 for melee)
 	Dodgeable       bool    `json:"dodgeable"`         // Can be dodged/disjointed
 	LaunchTick      int     `json:"launch_tick"`       // When projectile was launched
-	GameTime        float32 `json:"game_time"`         // Game time in seconds
-	GameTimeStr     string  `json:"game_time_str"`     // Formatted game time
+	GameTime        float32 `json:"game_time"`         // Game time in seconds (formatted on the Python side)
 	// Common fields (populated for both ranged and melee)
 	IsMelee      bool    `json:"is_melee"`       // True if melee attack (from combat log)
 	AttackerName string  `json:"attacker_name"`  // Attacker name
@@ -48,6 +48,7 @@ def run_all_tests():
     cmd = [
         sys.executable, "-m", "pytest",
         "tests/",
+        "-m", "",  # override the pytest.ini default that skips integration
         "-v"
     ]
     return subprocess.run(cmd, cwd=Path(__file__).parent)
@@ -59,6 +60,7 @@ def run_with_coverage():
     cmd = [
         sys.executable, "-m", "pytest",
         "tests/",
+        "-m", "",  # override the pytest.ini default that skips integration
         "--cov=python_manta",
         "--cov-report=html",
         "--cov-report=term-missing",
@@ -8,11 +8,14 @@ import bz2
 import ctypes
 import json
 import os
+import sys
 import tempfile
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Iterator
-from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+from pydantic import BaseModel, Field, computed_field, field_validator
 
 # ============================================================================
 # TIME UTILITIES
@@ -712,10 +715,11 @@ class Hero(int, Enum):
     @classmethod
     def from_id(cls, hero_id: int) -> Optional["Hero"]:
         """Get Hero from integer ID."""
-        for hero in cls:
-            if hero.value == hero_id:
-                return hero
-        return None
+        # Enum's value lookup is a dict hit, not a scan over every hero
+        try:
+            return cls(hero_id)
+        except ValueError:
+            return None
 
     @classmethod
     def from_hero_name(cls, hero_name: str) -> Optional["Hero"]:
@@ -1901,10 +1905,10 @@ class ChatWheelMessage(int, Enum):
     @classmethod
     def from_id(cls, message_id: int) -> Optional["ChatWheelMessage"]:
         """Get ChatWheelMessage from message ID. Returns None for unmapped IDs."""
-        for msg in cls:
-            if msg.value == message_id:
-                return msg
-        return None
+        try:
+            return cls(message_id)
+        except ValueError:
+            return None
 
     @classmethod
     def describe_id(cls, message_id: int) -> str:
@@ -2330,6 +2334,11 @@ class StringTablesResult(BaseModel):
     error: Optional[str] = None
     total_entries: int = 0
 
+    def has(self, name: str) -> bool:
+        """Check if a table was extracted."""
+        # Checked against the current list, so copies and edits are never stale
+        return name in self.table_names
+
 
 # ============================================================================
 # COMBAT LOG MODELS
@@ -2487,7 +2496,6 @@ class AttackEvent(BaseModel):
     dodgeable: bool = False          # Can be disjointed (ranged only)
     launch_tick: int = 0             # Tick when projectile was launched (ranged only)
     game_time: float = 0.0           # Game time in seconds
-    game_time_str: str = ""          # Formatted game time (e.g., "12:34")
     # Common fields (populated for both ranged and melee)
     is_melee: bool = False           # True if melee attack (from combat log)
     attacker_name: str = ""          # Attacker name
@@ -2506,6 +2514,13 @@ class AttackEvent(BaseModel):
     is_target_building: bool = False    # Target is a building (melee only)
     damage_type: int = 0             # 1=physical, 2=magical, 4=pure (melee only)
 
+    # computed_field keeps game_time_str in model_dump()/model_dump_json()
+    @computed_field  # type: ignore[misc]
+    @property
+    def game_time_str(self) -> str:
+        """Formatted game time like '-0:40' or '3:07'."""
+        return format_game_time(self.game_time)
+
 
 class AttacksResult(BaseModel):
     """Result from attacks parsing (ranged + optional melee)."""
@@ -2705,7 +2720,7 @@ def derive_respawn_events(
         )
         respawn_events.append(event)
 
-    return sorted(respawn_events, key=lambda e: e.death_game_time)
+    return sorted(respawn_events, key=attrgetter("death_game_time"))
 
 
 # ============================================================================
@@ -2722,6 +2737,10 @@ class ParserInfo(BaseModel):
     success: bool = True
     error: Optional[str] = None
 
+    def has(self, name: str) -> bool:
+        """Check if the parser knows a string table."""
+        return name in self.string_tables
+
 
 # ============================================================================
 # V2 PARSER TYPES AND CLASS - UNIFIED SINGLE-PASS API
@@ -2850,6 +2869,30 @@ class DemoIndex(BaseModel):
     success: bool = True
     error: Optional[str] = None
 
+    @property
+    def keyframe_ticks(self) -> List[int]:
+        """Keyframe ticks in index order (ascending).
+
+        Built from keyframes on each access, so it always matches them.
+        """
+        return [kf.tick for kf in self.keyframes]
+
+
+# Short names are derived once per distinct (interned) name, not per access
+@lru_cache(maxsize=None)
+def _ability_short_name(name: str) -> str:
+    return sys.intern(name.replace("CDOTA_Ability_", ""))
+
+
+@lru_cache(maxsize=None)
+def _item_short_name(name: str) -> str:
+    return sys.intern(name[5:] if name.startswith("item_") else name)
+
+
+@lru_cache(maxsize=None)
+def _lower_name(name: str) -> str:
+    return name.lower()
+
 
 class AbilitySnapshot(BaseModel):
     """State of a single ability at a specific tick.
@@ -2866,10 +2909,16 @@ class AbilitySnapshot(BaseModel):
     charges: int = 0
     is_ultimate: bool = False
 
+    @field_validator("name")
+    @classmethod
+    def _intern_name(cls, name: str) -> str:
+        # The same names recur in every snapshot; share one string per name
+        return sys.intern(name)
+
     @property
     def short_name(self) -> str:
         """Return ability name without CDOTA_Ability_ prefix."""
-        return self.name.replace("CDOTA_Ability_", "")
+        return _ability_short_name(self.name)
 
     @property
     def is_maxed(self) -> bool:
@@ -2917,12 +2966,16 @@ class ItemSnapshot(BaseModel):
     cooldown: float = 0.0
     max_cooldown: float = 0.0
 
+    @field_validator("name")
+    @classmethod
+    def _intern_name(cls, name: str) -> str:
+        # The same names recur in every snapshot; share one string per name
+        return sys.intern(name)
+
     @property
     def short_name(self) -> str:
         """Return item name without 'item_' prefix (e.g., 'blink' instead of 'item_blink')."""
-        if self.name.startswith("item_"):
-            return self.name[5:]
-        return self.name
+        return _item_short_name(self.name)
 
     @property
     def is_main_inventory(self) -> bool:
@@ -3082,7 +3135,7 @@ class HeroSnapshot(BaseModel):
         """Get ability by name (partial match supported)."""
         name_lower = name.lower()
         for ability in self.abilities:
-            if name_lower in ability.name.lower():
+            if name_lower in _lower_name(ability.name):
                 return ability
         return None
 
@@ -3128,7 +3181,7 @@ class HeroSnapshot(BaseModel):
         """Get item by name (partial match supported)."""
         name_lower = name.lower()
         for item in self.inventory:
-            if name_lower in item.name.lower():
+            if name_lower in _lower_name(item.name):
                 return item
         return None
 
@@ -3152,6 +3205,29 @@ class EntityStateSnapshot(BaseModel):
     is_temporary_day: bool = False
     net_time_of_day: int = 0
 
+    # Derived from heroes on every access rather than cached at construction,
+    # so copies made with model_copy(update=...) and in-place edits never see
+    # a stale view; a snapshot holds ten-odd heroes, so a pass is cheap.
+    @property
+    def heroes_by_name(self) -> Dict[str, HeroSnapshot]:
+        """Real heroes (no illusions/clones) keyed by hero_name, for O(1) lookup."""
+        return {h.hero_name: h for h in self.real_heroes}
+
+    @property
+    def real_heroes(self) -> Tuple[HeroSnapshot, ...]:
+        """Heroes that are neither illusions nor clones."""
+        return tuple(h for h in self.heroes if not h.is_illusion and not h.is_clone)
+
+    @property
+    def illusions(self) -> Tuple[HeroSnapshot, ...]:
+        """Heroes with is_illusion set."""
+        return tuple(h for h in self.heroes if h.is_illusion)
+
+    @property
+    def clones(self) -> Tuple[HeroSnapshot, ...]:
+        """Heroes with is_clone set (e.g. Meepo clones)."""
+        return tuple(h for h in self.heroes if h.is_clone)
+
 
 class RangeParseConfig(BaseModel):
     """Configuration for range parsing."""
@@ -3182,6 +3258,10 @@ class KeyframeResult(BaseModel):
     error: Optional[str] = None
 
 
+# Loaded shared libraries keyed by path, with function signatures configured
+_LIBRARY_CACHE: Dict[str, ctypes.CDLL] = {}
+
+
 class Parser:
     """V2 Parser with unified single-pass parsing.
 
@@ -3216,8 +3296,15 @@ class Parser:
         if not os.path.exists(library_path):
             raise FileNotFoundError(f"Shared library not found: {library_path}")
 
-        self._lib = ctypes.CDLL(str(library_path))
-        self._setup_function_signatures()
+        # dlopen each library once per process and share it across parsers
+        lib_key = str(library_path)
+        lib = _LIBRARY_CACHE.get(lib_key)
+        if lib is None:
+            self._lib = ctypes.CDLL(lib_key)
+            self._setup_function_signatures()
+            _LIBRARY_CACHE[lib_key] = self._lib
+        else:
+            self._lib = lib
 
     def _setup_function_signatures(self):
         """Configure ctypes function signatures."""
@@ -3236,12 +3323,21 @@ class Parser:
         self._lib.StreamClose.argtypes = [ctypes.c_longlong]
         self._lib.StreamClose.restype = ctypes.c_char_p
 
+        self._lib.StreamCombatLogRange.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_int]
+        self._lib.StreamCombatLogRange.restype = ctypes.c_char_p
+
         self._lib.BuildIndex.argtypes = [ctypes.c_char_p, ctypes.c_int]
         self._lib.BuildIndex.restype = ctypes.c_char_p
 
+        self._lib.BuildIndexes.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
+        self._lib.BuildIndexes.restype = ctypes.c_char_p
+
         self._lib.GetSnapshot.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
         self._lib.GetSnapshot.restype = ctypes.c_char_p
 
+        self._lib.GetSnapshots.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
+        self._lib.GetSnapshots.restype = ctypes.c_char_p
+
         self._lib.ParseRange.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
         self._lib.ParseRange.restype = ctypes.c_char_p
 
@@ -3404,14 +3500,50 @@ class Parser:
         config_json = config.model_dump_json().encode('utf-8')
 
         open_result_ptr = self._lib.StreamOpen(path_bytes, config_json)
+        for event in self._stream_events(open_result_ptr, "StreamOpen"):
+            yield StreamEvent(**event)
+
+    def iter_combat_log(
+        self,
+        start_tick: Optional[int] = None,
+        end_tick: Optional[int] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily yield combat log entries within a tick or time range.
+
+        Entries have the same format as parse_range(combat_log=True) but are
+        streamed from the library as it parses, so memory stays flat for
+        large ranges and callers can stop early.
+        """
+        if start_tick is None and start_time is not None:
+            start_tick = self._game_time_to_tick(start_time)
+        if end_tick is None and end_time is not None:
+            end_tick = self._game_time_to_tick(end_time)
+
+        if start_tick is None or end_tick is None:
+            raise ValueError("Must provide start and end (either as tick or time)")
+
+        if not os.path.exists(self._demo_path):
+            raise FileNotFoundError(f"Demo file not found: {self._demo_path}")
+
+        actual_path = self._prepare_demo_file(self._demo_path)
+        path_bytes = actual_path.encode('utf-8')
+
+        open_result_ptr = self._lib.StreamCombatLogRange(path_bytes, start_tick, end_tick)
+        for event in self._stream_events(open_result_ptr, "StreamCombatLogRange"):
+            yield event['data']
+
+    def _stream_events(self, open_result_ptr, open_name: str) -> Iterator[Dict[str, Any]]:
+        """Yield raw event dicts from an opened stream handle, closing it afterwards."""
         if not open_result_ptr:
-            raise ValueError("StreamOpen returned null pointer")
+            raise ValueError(f"{open_name} returned null pointer")
 
         open_result_json = ctypes.string_at(open_result_ptr).decode('utf-8')
         open_result = json.loads(open_result_json)
 
         if not open_result.get('success', False):
-            raise ValueError(f"StreamOpen failed: {open_result.get('error', 'Unknown error')}")
+            raise ValueError(f"{open_name} failed: {open_result.get('error', 'Unknown error')}")
 
         handle_id = open_result['handle_id']
 
@@ -3435,7 +3567,7 @@ class Parser:
                     break
 
                 if next_result.get('event'):
-                    yield StreamEvent(**next_result['event'])
+                    yield next_result['event']
                 else:
                     time.sleep(0.001)
 
@@ -3468,6 +3600,42 @@ class Parser:
 
         return result
 
+    def build_indexes(self, interval_ticks: List[int]) -> List[DemoIndex]:
+        """Build keyframe indexes at several intervals in a single pass.
+
+        Equivalent to calling build_index() once per interval, but the demo
+        is walked once instead of once per index.
+
+        Returns:
+            One DemoIndex per requested interval, in the order requested.
+        """
+        if not os.path.exists(self._demo_path):
+            raise FileNotFoundError(f"Demo file not found: {self._demo_path}")
+
+        actual_path = self._prepare_demo_file(self._demo_path)
+        path_bytes = actual_path.encode('utf-8')
+
+        config_json = json.dumps({"interval_ticks": list(interval_ticks)}).encode('utf-8')
+
+        result_ptr = self._lib.BuildIndexes(path_bytes, config_json)
+
+        if not result_ptr:
+            raise ValueError("BuildIndexes returned null pointer")
+
+        result_json = ctypes.string_at(result_ptr).decode('utf-8')
+        result_dict = json.loads(result_json)
+
+        if not result_dict.get("success"):
+            raise ValueError(f"Index building failed: {result_dict.get('error')}")
+
+        indexes = [DemoIndex(**index) for index in result_dict.get("indexes") or []]
+
+        # Cache game_start_tick for time conversions
+        if indexes and indexes[0].game_started > 0:
+            self._game_start_tick = indexes[0].game_started
+
+        return indexes
+
     def _ensure_game_start_tick(self) -> int:
         """Ensure game_start_tick is cached, building index if needed."""
         if self._game_start_tick is None:
@@ -3491,7 +3659,9 @@ class Parser:
         self,
         target_tick: Optional[int] = None,
         game_time: Optional[float] = None,
-        include_illusions: bool = False
+        include_illusions: bool = False,
+        include_abilities: bool = True,
+        include_inventory: bool = True,
     ) -> EntityStateSnapshot:
         """Get entity state snapshot at a specific tick or game time.
 
@@ -3499,6 +3669,8 @@ class Parser:
             target_tick: Tick number (preferred, faster)
             game_time: Seconds from horn (converted to tick internally)
             include_illusions: Include illusion/clone heroes
+            include_abilities: Extract abilities and talents (left empty if False)
+            include_inventory: Extract inventory items (left empty if False)
 
         Returns:
             EntityStateSnapshot with hero states at the specified time.
@@ -3518,7 +3690,12 @@ class Parser:
         actual_path = self._prepare_demo_file(self._demo_path)
         path_bytes = actual_path.encode('utf-8')
 
-        config = {"target_tick": target_tick, "include_illusions": include_illusions}
+        config = {
+            "target_tick": target_tick,
+            "include_illusions": include_illusions,
+            "include_abilities": include_abilities,
+            "include_inventory": include_inventory,
+        }
         config_json = json.dumps(config).encode('utf-8')
 
         result_ptr = self._lib.GetSnapshot(path_bytes, config_json)
@@ -3535,6 +3712,54 @@ class Parser:
 
         return result
 
+    def snapshots(
+        self,
+        target_ticks: List[int],
+        include_illusions: bool = False,
+        include_abilities: bool = True,
+        include_inventory: bool = True,
+    ) -> List[EntityStateSnapshot]:
+        """Get entity state snapshots at several ticks in a single pass.
+
+        Equivalent to calling snapshot() once per tick, but the demo is walked
+        once up to the latest requested tick instead of once per snapshot.
+
+        Args:
+            target_ticks: Tick numbers, in any order
+            include_illusions: Include illusion/clone heroes
+            include_abilities: Extract abilities and talents (left empty if False)
+            include_inventory: Extract inventory items (left empty if False)
+
+        Returns:
+            One EntityStateSnapshot per requested tick, in the order requested.
+        """
+        if not os.path.exists(self._demo_path):
+            raise FileNotFoundError(f"Demo file not found: {self._demo_path}")
+
+        actual_path = self._prepare_demo_file(self._demo_path)
+        path_bytes = actual_path.encode('utf-8')
+
+        config = {
+            "target_ticks": list(target_ticks),
+            "include_illusions": include_illusions,
+            "include_abilities": include_abilities,
+            "include_inventory": include_inventory,
+        }
+        config_json = json.dumps(config).encode('utf-8')
+
+        result_ptr = self._lib.GetSnapshots(path_bytes, config_json)
+
+        if not result_ptr:
+            raise ValueError("GetSnapshots returned null pointer")
+
+        result_json = ctypes.string_at(result_ptr).decode('utf-8')
+        result_dict = json.loads(result_json)
+
+        if not result_dict.get("success"):
+            raise ValueError(f"Snapshot failed: {result_dict.get('error')}")
+
+        return [EntityStateSnapshot(**snap) for snap in result_dict.get("snapshots") or []]
+
     def parse_range(
         self,
         start_tick: Optional[int] = None,
@@ -3599,22 +3824,26 @@ class Parser:
         return result
 
     def find_keyframe(self, index: DemoIndex, target_tick: int) -> KeyframeResult:
-        """Find the nearest keyframe at or before a target tick."""
-        index_json = index.model_dump_json().encode('utf-8')
-
-        result_ptr = self._lib.FindKeyframe(index_json, target_tick)
-
-        if not result_ptr:
-            raise ValueError("FindKeyframe returned null pointer")
+        """Find the nearest keyframe at or before a target tick.
 
-        result_json = ctypes.string_at(result_ptr).decode('utf-8')
-        result_dict = json.loads(result_json)
-        result = KeyframeResult(**result_dict)
-
-        if not result.success:
-            raise ValueError(f"Keyframe search failed: {result.error}")
-
-        return result
+        Targets before the first keyframe return the first keyframe. The
+        search runs in Python, the same binary search as the library's
+        FindKeyframe without serializing the index to JSON.
+        """
+        keyframes = index.keyframes
+        if not keyframes:
+            raise ValueError("Keyframe search failed: No keyframes in index")
+
+        # bisect_right over keyframes[i].tick; bisect's key= needs Python 3.10
+        lo, hi = 0, len(keyframes)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if target_tick < keyframes[mid].tick:
+                hi = mid
+            else:
+                lo = mid + 1
+        keyframe = keyframes[max(lo - 1, 0)].model_copy()
+        return KeyframeResult(keyframe=keyframe, exact=keyframe.tick == target_tick)
 
 
 
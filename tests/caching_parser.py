@@ -2,16 +2,193 @@
 
 Provides a Parser class that caches parse(), build_index(), and snapshot() results
 for improved test performance. Uses GLOBAL cache shared across all instances.
+
+Results (including the batched build_indexes() and snapshots()) can additionally be persisted
+to disk (see enable_disk_cache) so that subsequent pytest invocations skip
+re-parsing an unchanged demo file.
+When filelock is installed, pytest-xdist workers share that cache: the first
+worker to need a result parses it while the others wait and load its pickle.
 """
 
+import contextlib
+import hashlib
 import json
+import os
+import pickle
+import sys
+from collections import Counter
+from pathlib import Path
+
 from python_manta import Parser as _Parser
 
+try:
+    from filelock import FileLock
+except ImportError:  # Only needed to coordinate pytest-xdist workers
+    FileLock = None
+
 # Global caches shared across all Parser instances
 _PARSE_CACHE = {}
 _INDEX_CACHE = {}
 _SNAPSHOT_CACHE = {}
 _PARSER_CACHE = {}
+# Cached call outcomes: "hit" (in memory), "disk" or "miss" (real parse)
+_CACHE_STATS = Counter()
+
+# Directory for pickled results, None when the disk cache is disabled
+_DISK_CACHE_DIR = None
+# Demo content digests keyed by (path, mtime_ns, size)
+_DEMO_DIGESTS = {}
+# Digest of the python_manta models and Go library, computed on first use
+_CODE_DIGEST = None
+
+
+def enable_disk_cache(cache_dir) -> None:
+    """Persist parse() results under cache_dir across pytest invocations.
+
+    Pass None to disable the disk layer (in-memory caching is unaffected).
+    """
+    global _DISK_CACHE_DIR
+    _DISK_CACHE_DIR = Path(cache_dir) if cache_dir is not None else None
+
+
+def _demo_digest(demo_path: str) -> str:
+    """Content digest of a demo file, re-hashed only when its stat changes.
+
+    Keying on content rather than mtime keeps cache entries valid across
+    re-downloads and copies of the same replay.
+    """
+    stat = os.stat(demo_path)
+    stat_key = (demo_path, stat.st_mtime_ns, stat.st_size)
+    if stat_key not in _DEMO_DIGESTS:
+        # blake2b: fast and built in; collision resistance is not a concern here
+        h = hashlib.blake2b(digest_size=16)
+        with open(demo_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        _DEMO_DIGESTS[stat_key] = h.hexdigest()
+    return _DEMO_DIGESTS[stat_key]
+
+
+def _code_digest() -> str:
+    """Digest of the code that produced cached results.
+
+    Pickles hold python_manta model instances, so a model or library change
+    (new fields, private attributes) must not load results from older code.
+    """
+    global _CODE_DIGEST
+    if _CODE_DIGEST is None:
+        module_path = Path(sys.modules[_Parser.__module__].__file__)
+        h = hashlib.blake2b(digest_size=16)
+        for path in (module_path, module_path.parent / "libmanta_wrapper.so"):
+            if path.is_file():
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        h.update(chunk)
+        _CODE_DIGEST = h.hexdigest()
+    return _CODE_DIGEST
+
+
+def _disk_cache_path(demo_path: str, key: str) -> Path:
+    """Cache file for a demo/kwargs pair, invalidated when the demo or code changes."""
+    raw = f"{_code_digest()}:{_demo_digest(demo_path)}:{key}"
+    digest = hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    return _DISK_CACHE_DIR / f"{digest}.pkl"
+
+
+def _file_lock(path: Path):
+    """Inter-process lock around a cache entry (no-op without filelock)."""
+    if FileLock is None:
+        return contextlib.nullcontext()
+    return FileLock(str(path))
+
+
+def cache_stats() -> Counter:
+    """Counts of cache hits, disk loads, and real parses this session."""
+    return Counter(_CACHE_STATS)
+
+
+def _load_or_parse(demo_path: str, key: str, compute):
+    """Return a pickled result from disk, or compute and store it."""
+    # Invalid paths fall through so the real parser raises its usual errors
+    if _DISK_CACHE_DIR is None or not os.path.isfile(demo_path):
+        _CACHE_STATS["miss"] += 1
+        return compute()
+
+    path = _disk_cache_path(demo_path, key)
+    with _file_lock(path.with_suffix(".lock")):
+        if path.exists():
+            _CACHE_STATS["disk"] += 1
+            return _disk_load(path)
+
+        _CACHE_STATS["miss"] += 1
+        result = compute()
+        _disk_store(path, result)
+    return result
+
+
+def _load_or_parse_batch(demo_path: str, cache: dict, requests: list, compute) -> list:
+    """Batched _load_or_parse over (cache key, disk key) requests.
+
+    Entries found in neither cache are computed together by a single
+    compute(missing_cache_keys) call, e.g. one walk of the demo. Results
+    are returned in request order.
+    """
+    use_disk = _DISK_CACHE_DIR is not None and os.path.isfile(demo_path)
+    disk_keys = dict(requests)
+    pending = []
+    for cache_key in disk_keys:
+        if cache_key in cache:
+            _CACHE_STATS["hit"] += 1
+        else:
+            pending.append(cache_key)
+
+    paths = {}
+    if use_disk:
+        paths = {key: _disk_cache_path(demo_path, disk_keys[key]) for key in pending}
+
+    with contextlib.ExitStack() as locks:
+        # Lock every pending entry, in a fixed order so workers asking for
+        # overlapping batches cannot deadlock; later workers load the pickles
+        for path in sorted(set(paths.values())):
+            locks.enter_context(_file_lock(path.with_suffix(".lock")))
+
+        missing = []
+        for cache_key in pending:
+            path = paths.get(cache_key)
+            if path is not None and path.exists():
+                _CACHE_STATS["disk"] += 1
+                cache[cache_key] = _disk_load(path)
+            else:
+                missing.append(cache_key)
+
+        if missing:
+            _CACHE_STATS["miss"] += len(missing)
+            for cache_key, result in zip(missing, compute(missing)):
+                cache[cache_key] = result
+                if use_disk:
+                    _disk_store(paths[cache_key], result)
+
+    return [cache[cache_key] for cache_key, _ in requests]
+
+
+def _snapshot_disk_key(target_tick, options) -> str:
+    """Disk cache key for a snapshot() result."""
+    return ":".join(map(str, ("snapshot", target_tick, *options)))
+
+
+def _disk_load(path: Path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def _disk_store(path: Path, result) -> None:
+    """Atomically pickle result to path, skipping failed results."""
+    # Never persist failures - they may be transient (missing library, etc.)
+    if getattr(result, "success", True):
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
 
 
 class Parser:
@@ -26,27 +203,77 @@ class Parser:
         self._parser = _PARSER_CACHE[cache_key]
 
     def parse(self, **kwargs):
-        cache_key = (self._demo_path, json.dumps(kwargs, sort_keys=True))
+        kwargs_key = json.dumps(kwargs, sort_keys=True)
+        cache_key = (self._demo_path, kwargs_key)
         if cache_key not in _PARSE_CACHE:
-            _PARSE_CACHE[cache_key] = self._parser.parse(**kwargs)
+            _PARSE_CACHE[cache_key] = _load_or_parse(
+                self._demo_path, kwargs_key, lambda: self._parser.parse(**kwargs)
+            )
+        else:
+            _CACHE_STATS["hit"] += 1
         return _PARSE_CACHE[cache_key]
 
     def build_index(self, interval_ticks: int = 1800):
         cache_key = (self._demo_path, interval_ticks)
         if cache_key not in _INDEX_CACHE:
-            _INDEX_CACHE[cache_key] = self._parser.build_index(interval_ticks)
+            _INDEX_CACHE[cache_key] = _load_or_parse(
+                self._demo_path,
+                f"build_index:{interval_ticks}",
+                lambda: self._parser.build_index(interval_ticks),
+            )
+        else:
+            _CACHE_STATS["hit"] += 1
         return _INDEX_CACHE[cache_key]
 
-    def snapshot(self, target_tick=None, game_time=None, include_illusions=False):
+    def snapshot(self, target_tick=None, game_time=None, include_illusions=False,
+                 include_abilities=True, include_inventory=True):
         if target_tick is None and game_time is not None:
             target_tick = self._parser._game_time_to_tick(game_time)
-        cache_key = (self._demo_path, target_tick, include_illusions)
+        options = (include_illusions, include_abilities, include_inventory)
+        cache_key = (self._demo_path, target_tick, *options)
         if cache_key not in _SNAPSHOT_CACHE:
-            _SNAPSHOT_CACHE[cache_key] = self._parser.snapshot(
-                target_tick=target_tick, include_illusions=include_illusions
+            _SNAPSHOT_CACHE[cache_key] = _load_or_parse(
+                self._demo_path,
+                _snapshot_disk_key(target_tick, options),
+                lambda: self._parser.snapshot(
+                    target_tick=target_tick,
+                    include_illusions=include_illusions,
+                    include_abilities=include_abilities,
+                    include_inventory=include_inventory,
+                ),
             )
+        else:
+            _CACHE_STATS["hit"] += 1
         return _SNAPSHOT_CACHE[cache_key]
 
+    def build_indexes(self, interval_ticks):
+        """Batched build_index() sharing its per-interval cache entries."""
+        return _load_or_parse_batch(
+            self._demo_path,
+            _INDEX_CACHE,
+            [((self._demo_path, interval), f"build_index:{interval}") for interval in interval_ticks],
+            lambda keys: self._parser.build_indexes([key[1] for key in keys]),
+        )
+
+    def snapshots(self, target_ticks, include_illusions=False,
+                  include_abilities=True, include_inventory=True):
+        """Batched snapshot() sharing its per-tick cache entries."""
+        options = (include_illusions, include_abilities, include_inventory)
+        return _load_or_parse_batch(
+            self._demo_path,
+            _SNAPSHOT_CACHE,
+            [
+                ((self._demo_path, tick, *options), _snapshot_disk_key(tick, options))
+                for tick in target_ticks
+            ],
+            lambda keys: self._parser.snapshots(
+                [key[1] for key in keys],
+                include_illusions=include_illusions,
+                include_abilities=include_abilities,
+                include_inventory=include_inventory,
+            ),
+        )
+
     @property
     def game_start_tick(self):
         return self._parser.game_start_tick
@@ -15,6 +15,7 @@ from tests.conftest import DEMO_FILE
 class TestRealCLIFunctionality:
     """Test CLI functionality with real demo file."""
 
+    @pytest.mark.requires_demo
     def test_cli_with_real_demo_file(self):
         """Test CLI processes real demo file correctly."""
         from python_manta.manta_python import _run_cli
@@ -78,6 +79,7 @@ class TestRealCLIFunctionality:
         assert exit_code == 1
         assert "Error:" in output
 
+    @pytest.mark.requires_demo
     def test_cli_as_script_execution(self):
         """Test running the module as a script with real file."""
         script_path = str(Path(__file__).parent.parent.parent / "src" / "python_manta" / "manta_python.py")
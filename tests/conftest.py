@@ -1,39 +1,166 @@
 """Shared pytest fixtures for python_manta tests.
 
-Uses module-scoped fixtures to cache parsed results across tests,
-significantly improving test performance by avoiding redundant parsing.
+Uses module- and session-scoped fixtures to cache parsed results across
+tests, significantly improving test performance by avoiding redundant parsing.
+Cached results are shared objects: tests must treat them as read-only.
 
 Replays are automatically downloaded from GCS on first use and cached
 in the replays/ directory. Similar to dotabuff/manta's test infrastructure.
+
+Parse results are also pickled into pytest's cache directory so repeated
+runs skip re-parsing; pass --no-parse-cache to always parse fresh.
 """
 
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 
 # Add tests directory to path for caching_parser import
 sys.path.insert(0, str(Path(__file__).parent))
 
 import pytest
-from caching_parser import Parser
-from replay_cache import get_primary_demo, get_secondary_demo, PRIMARY_MATCH_ID, SECONDARY_MATCH_ID
+from caching_parser import Parser, cache_stats, enable_disk_cache
+from python_manta import ParseResult, derive_respawn_events
+from replay_cache import ensure_replays, PRIMARY_MATCH_ID, SECONDARY_MATCH_ID
 
-# Demo file paths (downloaded from GCS on first use)
-DEMO_FILE = get_primary_demo()
-DEMO_FILE_SECONDARY = get_secondary_demo()
+# Demo file paths (downloaded from GCS on first use, both at once)
+DEMO_FILE, DEMO_FILE_SECONDARY = map(str, ensure_replays([PRIMARY_MATCH_ID, SECONDARY_MATCH_ID]))
 
 
-@pytest.fixture(scope="module")
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-parse-cache",
+        action="store_true",
+        default=False,
+        help="Disable the on-disk cache of parsed demo results",
+    )
+
+
+def pytest_configure(config):
+    cache = getattr(config, "cache", None)
+    if cache is not None and not config.getoption("--no-parse-cache"):
+        enable_disk_cache(cache.mkdir("manta"))
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report demo cache effectiveness so re-parsing regressions are visible."""
+    stats = cache_stats()
+    if stats:
+        terminalreporter.write_line(
+            f"demo cache: {stats['hit']} hits, {stats['disk']} disk loads, "
+            f"{stats['miss']} parses"
+        )
+
+
+# ============================================================================
+# In-memory views over superset parses
+#
+# Filtered/limited fixtures are derived from one full parse per collector
+# instead of re-walking the demo. Filters are applied in the same order as
+# the Go collectors so the views match what a native parse would return.
+# ============================================================================
+
+
+def _game_events_view(source, event_filter="", max_events=0, capture_types=False):
+    """Slice a full game_events result like a native event_filter/max_events parse.
+
+    Like the Go collector, event_types is only kept when capture_types is set;
+    a parse that does not ask for it returns an empty list.
+    """
+    events = [e for e in source.events if event_filter in e.name]
+    if max_events > 0:
+        events = events[:max_events]
+    update = {"events": events, "total_events": len(events)}
+    if not capture_types:
+        update["event_types"] = []
+    return ParseResult(game_events=source.model_copy(update=update))
+
+
+def _modifiers_view(source, max_modifiers=0):
+    """Slice a modifiers result like a native max_modifiers parse."""
+    modifiers = source.modifiers[:max_modifiers] if max_modifiers > 0 else source.modifiers
+    return ParseResult(modifiers=source.model_copy(
+        update={"modifiers": modifiers, "total_modifiers": len(modifiers)}
+    ))
+
+
+def _is_hero_related(entry):
+    """Mirror of the Go heroes_only filter (flags OR hero name strings)."""
+    return (
+        entry.is_attacker_hero or entry.is_target_hero or
+        "npc_dota_hero_" in entry.attacker_name or
+        "npc_dota_hero_" in entry.target_name
+    )
+
+
+def _combat_log_view(source, types=(), max_entries=0, heroes_only=False):
+    """Slice a full combat log like a native types/max_entries/heroes_only parse.
+
+    The Go collector applies the type filter and max_entries while reading,
+    and heroes_only afterwards during name resolution.
+    """
+    entries = source.entries
+    if types:
+        entries = [e for e in entries if e.type in types]
+    if max_entries > 0:
+        entries = entries[:max_entries]
+    if heroes_only:
+        entries = [e for e in entries if _is_hero_related(e)]
+    return ParseResult(combat_log=source.model_copy(
+        update={"entries": list(entries), "total_entries": len(entries)}
+    ))
+
+
+# parse() kwargs shared by the fixtures below and prewarmed_feature_parses
+COMBAT_LOG_AND_CREEPS_PARSE = {
+    "combat_log": {"max_entries": 0},
+    "entities": {"interval_ticks": 1800, "max_snapshots": 50, "include_creeps": True},
+}
+DEFAULT_ENTITIES_PARSE = {"entities": {"interval_ticks": 1800, "max_snapshots": 50}}
+PREHORN_ENTITIES_PARSE = {"entities": {"interval_ticks": 900, "max_snapshots": 200}}
+# Keyframe intervals used by the index tests, built together in one walk
+INDEX_INTERVALS = (900, 1800, 3600)
+# Every snapshot_* fixture tick, captured together in one walk of the demo
+# Not sorted, so hero_snapshots also checks snapshots() keeps request order
+HERO_SNAPSHOT_TICKS = (100, 30000, 20000, 60000, 80000, 90000)
+
+
+def _heroes_by_name(snapshot):
+    """Map hero_name to hero."""
+    return {h.hero_name: h for h in snapshot.heroes}
+
+
+def _inventory_tuples(snapshot):
+    """Map hero_name to its slot-ordered inventory as (slot, name, charges) tuples."""
+    by_slot = attrgetter("slot")
+    return {
+        h.hero_name: tuple((i.slot, i.name, i.charges) for i in sorted(h.inventory, key=by_slot))
+        for h in snapshot.heroes
+    }
+
+
+@pytest.fixture(scope="session")
 def parser():
     """Shared Parser instance for primary demo file."""
     return Parser(DEMO_FILE)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def parser_secondary():
     """Shared Parser instance for secondary demo file."""
     return Parser(DEMO_FILE_SECONDARY)
 
 
+@pytest.fixture(scope="module")
+def nonexistent_parser():
+    """Shared Parser bound to a demo path that does not exist."""
+    return Parser("/nonexistent/file.dem")
+
+
 @pytest.fixture(scope="module")
 def header_result(parser):
     """Cached header parsing result."""
@@ -46,6 +173,16 @@ def game_info_result(parser):
     return parser.parse(game_info=True)
 
 
+@pytest.fixture(scope="module")
+def draft_picks(game_info_result):
+    """Picked hero_ids per team (2=Radiant, 3=Dire) in draft order, from one pass."""
+    picks = {2: [], 3: []}
+    for event in game_info_result.game_info.picks_bans:
+        if event.is_pick:
+            picks[event.team].append(event.hero_id)
+    return {team: tuple(hero_ids) for team, hero_ids in picks.items()}
+
+
 @pytest.fixture(scope="module")
 def header_and_game_info_result(parser):
     """Cached combined header and game_info parsing result."""
@@ -58,13 +195,42 @@ def messages_result(parser):
     return parser.parse(messages={"max_messages": 20})
 
 
-@pytest.fixture(scope="module")
-def combat_log_result(parser):
+@pytest.fixture(scope="session")
+def prewarmed_feature_parses(parser):
+    """Run the independent test_features.py parses concurrently.
+
+    ctypes releases the GIL around calls into the Go library, so the
+    parses overlap on separate cores. Results land in the caching parser,
+    and the per-feature fixtures then return them without re-parsing.
+    """
+    jobs = [
+        partial(parser.parse, **kwargs)
+        for kwargs in (COMBAT_LOG_AND_CREEPS_PARSE, DEFAULT_ENTITIES_PARSE, PREHORN_ENTITIES_PARSE)
+    ]
+    jobs.append(partial(parser.snapshots, HERO_SNAPSHOT_TICKS))
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        for future in [pool.submit(job) for job in jobs]:
+            future.result()
+
+
+@pytest.fixture(scope="session")
+def combat_log_and_creeps_result(parser):
+    """Single pass collecting the full combat log and creep-inclusive entities.
+
+    The unified parser runs every enabled collector over one walk of the
+    demo, so combat_log_result and entities_with_creeps share this parse.
+    """
+    return parser.parse(**COMBAT_LOG_AND_CREEPS_PARSE)
+
+
+@pytest.fixture(scope="session")
+def combat_log_result(combat_log_and_creeps_result):
     """Cached combat log parsing result (all entries)."""
-    return parser.parse(combat_log={"max_entries": 0})
+    result = combat_log_and_creeps_result
+    return ParseResult(success=result.success, error=result.error, combat_log=result.combat_log)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def combat_log(combat_log_result):
     """Cached combat log entries (extracted from result)."""
     assert combat_log_result.success, f"Failed to parse combat log: {combat_log_result.error}"
@@ -77,16 +243,18 @@ def combat_log_result_secondary(parser_secondary):
     return parser_secondary.parse(combat_log={})
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def entities_result(parser):
     """Cached entities parsing result."""
-    return parser.parse(entities={"interval_ticks": 1800, "max_snapshots": 50})
+    result = parser.parse(**DEFAULT_ENTITIES_PARSE)
+    assert result.success and result.entities is not None, f"Failed to parse entities: {result.error}"
+    return result
 
 
 @pytest.fixture(scope="module")
-def game_events_result(parser):
-    """Cached game events parsing result."""
-    return parser.parse(game_events={"max_events": 100})
+def game_events_result(game_events_with_types):
+    """Cached game events parsing result (first 100 events)."""
+    return _game_events_view(game_events_with_types.game_events, max_events=100)
 
 
 @pytest.fixture(scope="module")
@@ -107,36 +275,151 @@ def parser_info_result(parser):
     return parser.parse(parser_info=True)
 
 
-@pytest.fixture(scope="module")
-def demo_index(parser):
+@pytest.fixture(scope="session")
+def demo_indexes(parser):
+    """Demo indexes for INDEX_INTERVALS keyed by interval, from one batched pass."""
+    return dict(zip(INDEX_INTERVALS, parser.build_indexes(INDEX_INTERVALS)))
+
+
+@pytest.fixture(scope="session")
+def single_walk_index_3600(uncached_parser):
+    """build_index(3600) from its own uncached walk, outside build_indexes()."""
+    return uncached_parser.build_index(interval_ticks=3600)
+
+
+@pytest.fixture(scope="session")
+def demo_index(demo_indexes):
     """Cached demo index with keyframes."""
-    return parser.build_index(interval_ticks=1800)
+    return demo_indexes[1800]
 
 
-@pytest.fixture(scope="module")
-def snapshot_30k(parser):
+@pytest.fixture(scope="session")
+def hero_snapshots(parser):
+    """Hero snapshots for HERO_SNAPSHOT_TICKS keyed by tick, from one batched pass."""
+    return dict(zip(HERO_SNAPSHOT_TICKS, parser.snapshots(HERO_SNAPSHOT_TICKS)))
+
+
+@pytest.fixture(scope="session")
+def uncached_parser(parser):
+    """The library Parser behind the shared caching Parser, for tests that
+    must exercise a real code path instead of a cached result."""
+    return parser._parser
+
+
+@pytest.fixture(scope="session")
+def single_walk_snapshots(uncached_parser):
+    """snapshot() at ticks 20000 and 30000, each from its own uncached walk."""
+    return {
+        tick: uncached_parser.snapshot(target_tick=tick) for tick in (20000, 30000)
+    }
+
+
+@pytest.fixture(scope="session")
+def snapshot_30k(hero_snapshots):
     """Cached hero snapshot at tick 30000."""
-    return parser.snapshot(target_tick=30000)
+    return hero_snapshots[30000]
 
 
-@pytest.fixture(scope="module")
-def snapshot_60k(parser):
+@pytest.fixture(scope="session")
+def snapshot_60k(hero_snapshots):
     """Cached hero snapshot at tick 60000."""
-    return parser.snapshot(target_tick=60000)
+    return hero_snapshots[60000]
 
 
-@pytest.fixture(scope="module")
-def snapshot_90k(parser):
+@pytest.fixture(scope="session")
+def heroes_by_name_30k(snapshot_30k):
+    """Heroes in snapshot_30k keyed by hero_name."""
+    return _heroes_by_name(snapshot_30k)
+
+
+@pytest.fixture(scope="session")
+def heroes_by_name_60k(snapshot_60k):
+    """Heroes in snapshot_60k keyed by hero_name."""
+    return _heroes_by_name(snapshot_60k)
+
+
+@pytest.fixture(scope="session")
+def troll_60k(heroes_by_name_60k):
+    """Troll Warlord in snapshot_60k."""
+    return heroes_by_name_60k["npc_dota_hero_troll_warlord"]
+
+
+@pytest.fixture(scope="session")
+def chen_60k(heroes_by_name_60k):
+    """Chen in snapshot_60k."""
+    return heroes_by_name_60k["npc_dota_hero_chen"]
+
+
+@pytest.fixture(scope="session")
+def bristle_60k(heroes_by_name_60k):
+    """Bristleback in snapshot_60k."""
+    return heroes_by_name_60k["npc_dota_hero_bristleback"]
+
+
+@pytest.fixture(scope="session")
+def inventory_tuples_30k(snapshot_30k):
+    """snapshot_30k inventories as (slot, name, charges) tuples keyed by hero_name."""
+    return _inventory_tuples(snapshot_30k)
+
+
+@pytest.fixture(scope="session")
+def inventory_tuples_60k(snapshot_60k):
+    """snapshot_60k inventories as (slot, name, charges) tuples keyed by hero_name."""
+    return _inventory_tuples(snapshot_60k)
+
+
+@pytest.fixture(scope="session")
+def abilities_60k(snapshot_60k):
+    """Every hero ability in snapshot_60k, flattened into one tuple."""
+    return tuple(chain.from_iterable(h.abilities for h in snapshot_60k.heroes))
+
+
+@pytest.fixture(scope="session")
+def hero_index_set(snapshot_60k):
+    """Entity indices of the heroes in snapshot_60k (immutable, safe to share)."""
+    return frozenset(h.index for h in snapshot_60k.heroes)
+
+
+@pytest.fixture(scope="session")
+def snapshot_90k(hero_snapshots):
     """Cached hero snapshot at tick 90000."""
-    return parser.snapshot(target_tick=90000)
+    return hero_snapshots[90000]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def snapshot_with_illusions(parser):
     """Cached hero snapshot at tick 30000 with illusions included."""
     return parser.snapshot(target_tick=30000, include_illusions=True)
 
 
+@pytest.fixture(scope="session")
+def snapshot_20k(hero_snapshots):
+    """Cached hero snapshot at tick 20000 (early ability progression)."""
+    return hero_snapshots[20000]
+
+
+@pytest.fixture(scope="session")
+def snapshot_80k(hero_snapshots):
+    """Cached hero snapshot at tick 80000 (late ability progression)."""
+    return hero_snapshots[80000]
+
+
+@pytest.fixture(scope="session")
+def snapshot_pregame(hero_snapshots):
+    """Cached hero snapshot at tick 100, before the picking phase."""
+    return hero_snapshots[100]
+
+
+@pytest.fixture(scope="session")
+def snapshot_past_end(parser):
+    """Cached hero snapshot at tick 100000, past the end of the demo.
+
+    Kept out of HERO_SNAPSHOT_TICKS: it walks the whole demo, which the
+    other snapshots would otherwise pay for.
+    """
+    return parser.snapshot(target_tick=100000)
+
+
 @pytest.fixture(scope="module")
 def full_parse_result(parser):
     """Cached full parsing with all collectors enabled."""
@@ -162,27 +445,41 @@ def game_events_with_types(parser):
 
 
 @pytest.fixture(scope="module")
-def game_events_combatlog(parser):
+def game_events_combatlog(game_events_with_types):
     """Cached game events filtered to dota_combatlog."""
-    return parser.parse(game_events={"event_filter": "dota_combatlog", "max_events": 100})
+    return _game_events_view(
+        game_events_with_types.game_events, event_filter="dota_combatlog", max_events=100
+    )
 
 
 @pytest.fixture(scope="module")
-def game_events_dota(parser):
+def game_events_dota(game_events_with_types):
     """Cached game events filtered to dota prefix."""
-    return parser.parse(game_events={"event_filter": "dota", "max_events": 10})
+    return _game_events_view(game_events_with_types.game_events, event_filter="dota", max_events=10)
 
 
 @pytest.fixture(scope="module")
-def game_events_chase_hero(parser):
+def game_events_view(request, game_events_with_types):
+    """Game events view for indirect parametrization.
+
+    request.param holds the game_events kwargs (event_filter/max_events);
+    identical kwargs share one view for the whole module.
+    """
+    return _game_events_view(game_events_with_types.game_events, **request.param)
+
+
+@pytest.fixture(scope="module")
+def game_events_chase_hero(game_events_with_types):
     """Cached dota_chase_hero events."""
-    return parser.parse(game_events={"event_filter": "dota_chase_hero", "max_events": 5})
+    return _game_events_view(
+        game_events_with_types.game_events, event_filter="dota_chase_hero", max_events=5
+    )
 
 
 @pytest.fixture(scope="module")
-def modifiers_50(parser):
+def modifiers_50(modifiers_result):
     """Cached modifiers result with 50 entries."""
-    return parser.parse(modifiers={"max_modifiers": 50})
+    return _modifiers_view(modifiers_result.modifiers, max_modifiers=50)
 
 
 @pytest.fixture(scope="module")
@@ -191,6 +488,35 @@ def modifiers_auras(parser):
     return parser.parse(modifiers={"auras_only": True, "max_modifiers": 50})
 
 
+# Native parses with the same filters as game_events_dota, modifiers_50,
+# combat_log_deaths and combat_log_heroes_only, so the view parity tests cover
+# every filter option against the Go collectors rather than the views above
+
+
+@pytest.fixture(scope="module")
+def native_game_events_dota(parser):
+    """Cached native parse matching game_events_dota."""
+    return parser.parse(game_events={"event_filter": "dota", "max_events": 10})
+
+
+@pytest.fixture(scope="module")
+def native_modifiers_50(parser):
+    """Cached native parse matching modifiers_50."""
+    return parser.parse(modifiers={"max_modifiers": 50})
+
+
+@pytest.fixture(scope="module")
+def native_combat_log_deaths(parser):
+    """Cached native parse matching combat_log_deaths."""
+    return parser.parse(combat_log={"types": [4], "max_entries": 100})
+
+
+@pytest.fixture(scope="module")
+def native_combat_log_heroes_only(parser):
+    """Cached native parse matching combat_log_heroes_only."""
+    return parser.parse(combat_log={"max_entries": 100, "heroes_only": True})
+
+
 @pytest.fixture(scope="module")
 def string_tables_userinfo(parser):
     """Cached userinfo string table."""
@@ -198,69 +524,69 @@ def string_tables_userinfo(parser):
 
 
 @pytest.fixture(scope="module")
-def combat_log_10(parser):
+def combat_log_10(combat_log):
     """Cached combat log with 10 entries."""
-    return parser.parse(combat_log={"max_entries": 10})
+    return _combat_log_view(combat_log, max_entries=10)
 
 
 @pytest.fixture(scope="module")
-def combat_log_50(parser):
+def combat_log_50(combat_log):
     """Cached combat log with 50 entries."""
-    return parser.parse(combat_log={"max_entries": 50})
+    return _combat_log_view(combat_log, max_entries=50)
 
 
 @pytest.fixture(scope="module")
-def combat_log_100(parser):
+def combat_log_100(combat_log):
     """Cached combat log with 100 entries."""
-    return parser.parse(combat_log={"max_entries": 100})
+    return _combat_log_view(combat_log, max_entries=100)
 
 
 @pytest.fixture(scope="module")
-def combat_log_heroes_only(parser):
+def combat_log_heroes_only(combat_log):
     """Cached combat log heroes only."""
-    return parser.parse(combat_log={"max_entries": 100, "heroes_only": True})
+    return _combat_log_view(combat_log, max_entries=100, heroes_only=True)
 
 
 @pytest.fixture(scope="module")
-def combat_log_damage_only(parser):
+def combat_log_damage_only(combat_log):
     """Cached combat log with only DAMAGE type (type 0)."""
-    return parser.parse(combat_log={"types": [0], "max_entries": 50})
+    return _combat_log_view(combat_log, types=(0,), max_entries=50)
 
 
 @pytest.fixture(scope="module")
-def combat_log_heals(parser):
+def combat_log_heals(combat_log):
     """Cached combat log HEAL events (type 1)."""
-    return parser.parse(combat_log={"types": [1], "max_entries": 100})
+    return _combat_log_view(combat_log, types=(1,), max_entries=100)
 
 
 @pytest.fixture(scope="module")
-def combat_log_deaths(parser):
+def combat_log_deaths(combat_log):
     """Cached combat log DEATH events (type 4)."""
-    return parser.parse(combat_log={"types": [4], "max_entries": 100})
+    return _combat_log_view(combat_log, types=(4,), max_entries=100)
 
 
 @pytest.fixture(scope="module")
-def combat_log_abilities(parser):
+def combat_log_abilities(combat_log):
     """Cached combat log ABILITY events (type 5)."""
-    return parser.parse(combat_log={"types": [5], "max_entries": 100})
+    return _combat_log_view(combat_log, types=(5,), max_entries=100)
 
 
 @pytest.fixture(scope="module")
-def combat_log_items(parser):
+def combat_log_items(combat_log):
     """Cached combat log ITEM events (type 6)."""
-    return parser.parse(combat_log={"types": [6], "max_entries": 100})
+    return _combat_log_view(combat_log, types=(6,), max_entries=100)
 
 
 @pytest.fixture(scope="module")
-def combat_log_gold(parser):
+def combat_log_gold(combat_log):
     """Cached combat log GOLD events (type 8)."""
-    return parser.parse(combat_log={"types": [8], "max_entries": 100})
+    return _combat_log_view(combat_log, types=(8,), max_entries=100)
 
 
 @pytest.fixture(scope="module")
-def combat_log_modifiers(parser):
+def combat_log_modifiers(combat_log):
     """Cached combat log MODIFIER_ADD events (type 2)."""
-    return parser.parse(combat_log={"types": [2], "max_entries": 100})
+    return _combat_log_view(combat_log, types=(2,), max_entries=100)
 
 
 # ============================================================================
@@ -268,23 +594,46 @@ def combat_log_modifiers(parser):
 # ============================================================================
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def entities_with_prehord(parser):
     """Cached entities parsing with pre-horn snapshots included.
 
     Uses small interval to capture early-game ticks before horn.
     """
-    return parser.parse(entities={"interval_ticks": 900, "max_snapshots": 200})
+    result = parser.parse(**PREHORN_ENTITIES_PARSE)
+    assert result.success and result.entities is not None, f"Failed to parse entities: {result.error}"
+    return result
 
 
-@pytest.fixture(scope="module")
-def entities_with_creeps(parser):
+@pytest.fixture(scope="session")
+def horn_split_snapshots(entities_with_prehord):
+    """entities_with_prehord snapshots partitioned into (pre-horn, post-horn) tuples."""
+    prehorn, posthorn = [], []
+    for snap in entities_with_prehord.entities.snapshots:
+        (prehorn if snap.game_time < 0 else posthorn).append(snap)
+    return tuple(prehorn), tuple(posthorn)
+
+
+@pytest.fixture(scope="session")
+def entities_with_creeps(combat_log_and_creeps_result):
     """Cached entities parsing with creep positions included."""
-    return parser.parse(entities={
-        "interval_ticks": 1800,
-        "max_snapshots": 50,
-        "include_creeps": True
-    })
+    result = combat_log_and_creeps_result
+    assert result.success and result.entities is not None, f"Failed to parse entities: {result.error}"
+    return ParseResult(entities=result.entities)
+
+
+@pytest.fixture(scope="session")
+def all_creeps(entities_with_creeps):
+    """Creeps from every entities_with_creeps snapshot, flattened once."""
+    return list(chain.from_iterable(s.creeps for s in entities_with_creeps.entities.snapshots))
+
+
+@pytest.fixture(scope="session")
+def creep_columns(all_creeps):
+    """Numeric creep fields as column tuples, built in one pass over all_creeps."""
+    columns = ("x", "y", "team", "health", "max_health")
+    rows = ((c.x, c.y, c.team, c.health, c.max_health) for c in all_creeps)
+    return dict(zip(columns, zip(*rows))) if all_creeps else dict.fromkeys(columns, ())
 
 
 @pytest.fixture(scope="module")
@@ -298,10 +647,19 @@ def entities_midgame_with_creeps(parser):
     })
 
 
-@pytest.fixture(scope="module")
-def snapshot_lategame(parser):
+@pytest.fixture(scope="session")
+def snapshot_lategame(snapshot_90k):
     """Cached hero snapshot at tick 90000 (~30 min) for camps_stacked testing."""
-    return parser.snapshot(target_tick=90000)
+    return snapshot_90k
+
+
+@pytest.fixture(scope="session")
+def camps_stacked_counts(snapshot_30k, snapshot_lategame):
+    """Per-hero camps_stacked at tick 30000 and 90000, as (early, late) tuples."""
+    return (
+        tuple(h.camps_stacked for h in snapshot_30k.heroes),
+        tuple(h.camps_stacked for h in snapshot_lategame.heroes),
+    )
 
 
 # ============================================================================
@@ -309,7 +667,7 @@ def snapshot_lategame(parser):
 # ============================================================================
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def attacks_result(parser):
     """Cached attacks parsing result (all attack events)."""
     result = parser.parse(attacks={"max_events": 0})
@@ -317,6 +675,12 @@ def attacks_result(parser):
     return result.attacks
 
 
+@pytest.fixture(scope="module")
+def attack_source_counts(attacks_result):
+    """Attack event counts per source entity index, built in one pass."""
+    return Counter(e.source_index for e in attacks_result.events)
+
+
 @pytest.fixture(scope="module")
 def melee_attacks(attacks_result):
     """Filter melee attacks from attacks_result."""
@@ -348,13 +712,60 @@ def wards_result(parser):
 # ============================================================================
 
 
-@pytest.fixture(scope="module")
-def combat_log_hero_deaths(parser):
+@pytest.fixture(scope="session")
+def death_combat_log(combat_log):
+    """Cached hero DEATH combat log capped at 1000 deaths (respawn derivation)."""
+    return _combat_log_view(combat_log, types=(4,), max_entries=1000, heroes_only=True)
+
+
+@pytest.fixture(scope="session")
+def death_respawns(death_combat_log):
+    """Respawn events derived once from death_combat_log (default hero levels)."""
+    return tuple(derive_respawn_events(death_combat_log.combat_log))
+
+
+@pytest.fixture(scope="session")
+def combat_log_hero_deaths(combat_log):
     """Cached combat log with hero DEATH events only."""
-    return parser.parse(combat_log={"types": [4], "heroes_only": True})
+    return _combat_log_view(combat_log, types=(4,), heroes_only=True)
+
+
+@pytest.fixture(scope="session")
+def hero_deaths(combat_log_hero_deaths):
+    """Hero DEATH entries whose target is a hero, as an immutable tuple."""
+    return tuple(e for e in combat_log_hero_deaths.combat_log.entries if e.is_target_hero)
+
+
+@pytest.fixture(scope="session")
+def hero_death_levels(hero_deaths):
+    """(target_hero_level, attacker_hero_level) columns for hero_deaths, in order."""
+    return (
+        tuple(d.target_hero_level for d in hero_deaths),
+        tuple(d.attacker_hero_level for d in hero_deaths),
+    )
+
+
+@pytest.fixture(scope="session")
+def all_entry_levels(combat_log_hero_deaths):
+    """(target, attacker) hero level columns for every combat_log_hero_deaths entry."""
+    entries = combat_log_hero_deaths.combat_log.entries
+    return (
+        tuple(e.target_hero_level for e in entries),
+        tuple(e.attacker_hero_level for e in entries),
+    )
+
+
+@pytest.fixture(scope="session")
+def hero_deaths_by_minute(hero_deaths):
+    """Hero deaths indexed by (hero short name, game minute)."""
+    index = {}
+    for death in hero_deaths:
+        key = (death.target_name.partition("npc_dota_hero_")[2], int(death.game_time) // 60)
+        index.setdefault(key, []).append(death)
+    return index
 
 
 @pytest.fixture(scope="module")
-def combat_log_all_deaths(parser):
+def combat_log_all_deaths(combat_log):
     """Cached combat log with all DEATH events (type 4)."""
-    return parser.parse(combat_log={"types": [4], "max_entries": 0})
+    return _combat_log_view(combat_log, types=(4,))
@@ -8,7 +8,7 @@ from pathlib import Path
 import pytest
 
 # Module-level marker: golang tests requiring Go toolchain (~1min)
-pytestmark = pytest.mark.golang
+pytestmark = [pytest.mark.golang, pytest.mark.requires_demo]
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 SRC_DIR = ROOT_DIR / "src"
@@ -6,7 +6,7 @@ Uses v2 Parser API exclusively.
 import pytest
 import time
 
-pytestmark = pytest.mark.fast
+pytestmark = [pytest.mark.fast, pytest.mark.requires_demo]
 from caching_parser import Parser
 from tests.conftest import DEMO_FILE
 
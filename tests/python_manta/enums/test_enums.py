@@ -13,11 +13,26 @@ pytestmark = pytest.mark.unit
 from python_manta import (
     ChatWheelMessage,
     GameActivity,
+    Hero,
     NeutralCampType,
     Team,
 )
 
 
+class TestHeroEnum:
+    """Test Hero enum ID lookup."""
+
+    def test_from_id_returns_enum(self):
+        """Test from_id returns correct enum for known IDs."""
+        assert Hero.from_id(95) is Hero.TROLL_WARLORD
+        assert Hero.from_id(155) is Hero.LARGO
+
+    def test_from_id_returns_none_for_unknown(self):
+        """Test from_id returns None for unmapped IDs."""
+        assert Hero.from_id(0) is None
+        assert Hero.from_id(99999) is None
+
+
 class TestChatWheelMessageEnum:
     """Test ChatWheelMessage enum with real values."""
 
@@ -184,6 +199,7 @@ class TestNeutralCampTypeEnum:
         assert NeutralCampType.from_value(-1) == NeutralCampType.SMALL
 
 
+@pytest.mark.requires_demo
 class TestNeutralCampTypeIntegration:
     """Integration tests for NeutralCampType with real demo data.
 
@@ -7,6 +7,8 @@ Note: Fixtures from conftest.py provide cached parsed results to avoid
 redundant parsing and improve test performance significantly.
 """
 
+from typing import Final, Tuple
+
 import pytest
 
 pytestmark = pytest.mark.unit
@@ -22,9 +24,55 @@ from python_manta import (
     AbilitySnapshot,
     TalentChoice,
     HeroSnapshot,
+    EntityStateSnapshot,
+    Keyframe,
+    DemoIndex,
+    StringTablesResult,
+    ParserInfo,
+    AttackEvent,
+    TICKS_PER_SECOND,
+    format_game_time,
+    game_time_to_tick,
+    normalize_hero_name,
+    tick_to_game_time,
+)
+
+# Expected draft for the primary demo, resolved once at import time
+EXPECTED_RADIANT_PICKS: Final[Tuple[int, ...]] = (
+    Hero.BRISTLEBACK.value,
+    Hero.HOODWINK.value,
+    Hero.CHEN.value,
+    Hero.MONKEY_KING.value,
+    Hero.TROLL_WARLORD.value,
+)
+EXPECTED_DIRE_PICKS: Final[Tuple[int, ...]] = (
+    Hero.LYCAN.value,
+    Hero.PUGNA.value,
+    Hero.SHADOW_SHAMAN.value,
+    Hero.STORM_SPIRIT.value,
+    Hero.FACELESS_VOID.value,
+)
+EXPECTED_RADIANT_BANS: Final[Tuple[int, ...]] = (
+    Hero.INVOKER.value,
+    Hero.BEASTMASTER.value,
+    Hero.NAGA_SIREN.value,
+    Hero.MARCI.value,
+    Hero.ABADDON.value,
+    Hero.URSA.value,
+    Hero.JUGGERNAUT.value,
+)
+EXPECTED_DIRE_BANS: Final[Tuple[int, ...]] = (
+    Hero.NATURES_PROPHET.value,
+    Hero.SHADOW_FIEND.value,
+    Hero.EARTHSHAKER.value,
+    Hero.SAND_KING.value,
+    Hero.PHOENIX.value,
+    Hero.PUCK.value,
+    Hero.ANTI_MAGE.value,
 )
 
 
+@pytest.mark.requires_demo
 class TestHeaderInfoRealValues:
     """Test HeaderInfo contains EXACT values from real demo file."""
 
@@ -59,6 +107,7 @@ class TestHeaderInfoRealValues:
         assert restored.build_num == 10512
 
 
+@pytest.mark.requires_demo
 class TestDraftEventRealValues:
     """Test DraftEvent with EXACT values from real draft."""
 
@@ -73,14 +122,14 @@ class TestDraftEventRealValues:
         assert result.error is None
 
         # Test first 5 events exact sequence using Hero enum
-        first_5_events = [(e.is_pick, e.team, e.hero_id) for e in game_info.picks_bans[:5]]
-        expected_first_5 = [
+        first_5_events = tuple((e.is_pick, e.team, e.hero_id) for e in game_info.picks_bans[:5])
+        expected_first_5 = (
             (False, 3, Hero.NATURES_PROPHET.value),  # Dire ban
             (False, 2, Hero.INVOKER.value),          # Radiant ban
             (False, 2, Hero.BEASTMASTER.value),      # Radiant ban
             (False, 3, Hero.SHADOW_FIEND.value),     # Dire ban
             (False, 2, Hero.NAGA_SIREN.value),       # Radiant ban
-        ]
+        )
         assert first_5_events == expected_first_5
 
     def test_picks_exact_values(self, game_info_result):
@@ -91,25 +140,13 @@ class TestDraftEventRealValues:
         assert len(picks) == 10  # Standard 5v5 picks
 
         # Exact pick sequences by team using Hero enum
-        radiant_picks = [e.hero_id for e in picks if e.team == 2]
-        dire_picks = [e.hero_id for e in picks if e.team == 3]
+        radiant_picks = tuple(e.hero_id for e in picks if e.team == 2)
+        dire_picks = tuple(e.hero_id for e in picks if e.team == 3)
 
         # Radiant: Bristleback, Hoodwink, Chen, Monkey King, Troll Warlord
-        assert radiant_picks == [
-            Hero.BRISTLEBACK.value,
-            Hero.HOODWINK.value,
-            Hero.CHEN.value,
-            Hero.MONKEY_KING.value,
-            Hero.TROLL_WARLORD.value,
-        ]
+        assert radiant_picks == EXPECTED_RADIANT_PICKS
         # Dire: Lycan, Pugna, Shadow Shaman, Storm Spirit, Faceless Void
-        assert dire_picks == [
-            Hero.LYCAN.value,
-            Hero.PUGNA.value,
-            Hero.SHADOW_SHAMAN.value,
-            Hero.STORM_SPIRIT.value,
-            Hero.FACELESS_VOID.value,
-        ]
+        assert dire_picks == EXPECTED_DIRE_PICKS
 
     def test_bans_exact_values(self, game_info_result):
         """Test bans contain exact hero IDs from real game."""
@@ -119,31 +156,16 @@ class TestDraftEventRealValues:
         assert len(bans) == 14  # Exact number of bans in this game
 
         # Exact ban sequences by team using Hero enum
-        radiant_bans = [e.hero_id for e in bans if e.team == 2]
-        dire_bans = [e.hero_id for e in bans if e.team == 3]
+        radiant_bans = tuple(e.hero_id for e in bans if e.team == 2)
+        dire_bans = tuple(e.hero_id for e in bans if e.team == 3)
 
         # Radiant bans: Invoker, Beastmaster, Naga Siren, Marci, Abaddon, Ursa, Juggernaut
-        assert radiant_bans == [
-            Hero.INVOKER.value,
-            Hero.BEASTMASTER.value,
-            Hero.NAGA_SIREN.value,
-            Hero.MARCI.value,
-            Hero.ABADDON.value,
-            Hero.URSA.value,
-            Hero.JUGGERNAUT.value,
-        ]
+        assert radiant_bans == EXPECTED_RADIANT_BANS
         # Dire bans: Nature's Prophet, Shadow Fiend, Earthshaker, Sand King, Phoenix, Puck, Anti-Mage
-        assert dire_bans == [
-            Hero.NATURES_PROPHET.value,
-            Hero.SHADOW_FIEND.value,
-            Hero.EARTHSHAKER.value,
-            Hero.SAND_KING.value,
-            Hero.PHOENIX.value,
-            Hero.PUCK.value,
-            Hero.ANTI_MAGE.value,
-        ]
+        assert dire_bans == EXPECTED_DIRE_BANS
 
 
+@pytest.mark.requires_demo
 class TestGameInfoRealValues:
     """Test GameInfo with EXACT values from real demo file."""
 
@@ -175,6 +197,7 @@ class TestGameInfoRealValues:
         assert len(restored.picks_bans) == 24
 
 
+@pytest.mark.requires_demo
 class TestMessageEventRealValues:
     """Test MessageEvent with EXACT values from real demo file."""
 
@@ -187,8 +210,8 @@ class TestMessageEventRealValues:
         assert result.error is None
 
         # Test exact message types from real file (specific Manta callback names)
-        message_types = [msg.type for msg in result.messages.messages[:10]]
-        expected_types = [
+        message_types = tuple(msg.type for msg in result.messages.messages[:10])
+        expected_types = (
             'CDemoFileHeader',
             'CNETMsg_Tick',
             'CSVCMsg_ClearAllStringTables',
@@ -199,7 +222,7 @@ class TestMessageEventRealValues:
             'CSVCMsg_CreateStringTable',
             'CSVCMsg_CreateStringTable',
             'CSVCMsg_CreateStringTable',
-        ]
+        )
         assert message_types == expected_types
 
     def test_first_message_exact_values(self, messages_result):
@@ -212,15 +235,16 @@ class TestMessageEventRealValues:
 
     def test_tick_progression_exact_sequence(self, messages_result):
         """Test tick progression follows exact sequence from real file."""
-        ticks = [msg.tick for msg in messages_result.messages.messages[:10]]
+        ticks = tuple(msg.tick for msg in messages_result.messages.messages[:10])
         # First 10 messages are all at tick 0 (header and string table setup)
-        expected_ticks = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+        expected_ticks = (0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
         assert ticks == expected_ticks
 
         # Ticks must be in non-decreasing order
-        assert ticks == sorted(ticks)
+        assert ticks == tuple(sorted(ticks))
 
 
+@pytest.mark.requires_demo
 class TestMessagesResultRealValues:
     """Test MessagesResult with EXACT values from real demo file."""
 
@@ -253,9 +277,9 @@ class TestMessagesResultRealValues:
         assert result.success is True
         assert len(result.messages.messages) >= 1
 
-        # All messages must match the filter
+        # All messages must match the filter exactly
         for message in result.messages.messages:
-            assert "CDemoFileHeader" in message.type
+            assert message.type == "CDemoFileHeader"
 
         # First message should be the file header
         assert result.messages.messages[0].type == "CDemoFileHeader"
@@ -290,6 +314,14 @@ class TestAbilitySnapshotModel:
         no_prefix = AbilitySnapshot(name="SomeOtherAbility")
         assert no_prefix.short_name == "SomeOtherAbility"
 
+    def test_ability_snapshot_names_are_interned(self):
+        """Test equal ability names decoded from JSON share one string object."""
+        payload = '{"name": "CDOTA_Ability_Juggernaut_BladeFury"}'
+        first = AbilitySnapshot.model_validate_json(payload)
+        second = AbilitySnapshot.model_validate_json(payload)
+        assert first.name is second.name
+        assert first.short_name is second.short_name
+
     def test_ability_snapshot_is_maxed_regular(self):
         """Test is_maxed for regular abilities (max level 4)."""
         # Not maxed
@@ -369,7 +401,7 @@ class TestTalentChoiceModel:
 
     def test_talent_choice_valid_tiers(self):
         """Test TalentChoice accepts valid tier values."""
-        for tier in [10, 15, 20, 25]:
+        for tier in (10, 15, 20, 25):
             talent = TalentChoice(tier=tier)
             assert talent.tier == tier
 
@@ -488,40 +520,137 @@ class TestHeroSnapshotAbilityMethods:
         assert not_found is None
 
 
+class TestEntityStateSnapshotHeroesByName:
+    """Test EntityStateSnapshot.heroes_by_name lookup and hero partitions."""
+
+    def test_heroes_by_name_maps_real_heroes(self):
+        """Test heroes_by_name maps hero_name to the real hero, skipping illusions and clones."""
+        troll = HeroSnapshot(hero_name="npc_dota_hero_troll_warlord", player_id=0)
+        monkey = HeroSnapshot(hero_name="npc_dota_hero_monkey_king", player_id=1)
+        snap = EntityStateSnapshot(heroes=[
+            troll,
+            monkey,
+            HeroSnapshot(hero_name="npc_dota_hero_monkey_king", player_id=1, is_clone=True),
+            HeroSnapshot(hero_name="npc_dota_hero_troll_warlord", player_id=0, is_illusion=True),
+        ])
+
+        assert snap.heroes_by_name == {
+            "npc_dota_hero_troll_warlord": troll,
+            "npc_dota_hero_monkey_king": monkey,
+        }
+        assert snap.heroes_by_name["npc_dota_hero_monkey_king"].is_clone is False
+
+    def test_heroes_by_name_survives_json_round_trip(self):
+        """Test heroes_by_name is rebuilt when a snapshot is validated from JSON."""
+        snap = EntityStateSnapshot(heroes=[HeroSnapshot(hero_name="npc_dota_hero_chen")])
+        restored = EntityStateSnapshot.model_validate_json(snap.model_dump_json())
+        assert restored.heroes_by_name.keys() == {"npc_dota_hero_chen"}
+
+    def test_hero_partitions(self):
+        """Test real_heroes, illusions and clones partition heroes by flags."""
+        troll = HeroSnapshot(hero_name="npc_dota_hero_troll_warlord", player_id=0)
+        clone = HeroSnapshot(hero_name="npc_dota_hero_meepo", player_id=1, is_clone=True)
+        illusion = HeroSnapshot(hero_name="npc_dota_hero_troll_warlord", player_id=0, is_illusion=True)
+        snap = EntityStateSnapshot(heroes=[troll, clone, illusion])
+
+        assert snap.real_heroes == (troll,)
+        assert snap.illusions == (illusion,)
+        assert snap.clones == (clone,)
+
+    def test_lookups_follow_model_copy_update(self):
+        """Test heroes_by_name and partitions reflect heroes replaced via model_copy."""
+        snap = EntityStateSnapshot(heroes=[HeroSnapshot(hero_name="npc_dota_hero_chen")])
+        meepo = HeroSnapshot(hero_name="npc_dota_hero_meepo", player_id=1)
+        clone = HeroSnapshot(hero_name="npc_dota_hero_meepo", player_id=1, is_clone=True)
+        copied = snap.model_copy(update={"heroes": [meepo, clone]})
+
+        assert copied.heroes_by_name == {"npc_dota_hero_meepo": meepo}
+        assert copied.real_heroes == (meepo,)
+        assert copied.clones == (clone,)
+        assert snap.heroes_by_name.keys() == {"npc_dota_hero_chen"}
+
+
+class TestDemoIndexKeyframeTicks:
+    """Test DemoIndex.keyframe_ticks stays in step with keyframes."""
+
+    def test_keyframe_ticks_follow_model_copy_update(self):
+        """Test keyframe_ticks reflects keyframes replaced via model_copy."""
+        index = DemoIndex(keyframes=[Keyframe(tick=0), Keyframe(tick=1800)])
+        copied = index.model_copy(update={"keyframes": [Keyframe(tick=3600)]})
+
+        assert index.keyframe_ticks == [0, 1800]
+        assert copied.keyframe_ticks == [3600]
+
+
+class TestStringTableMembership:
+    """Test has() on StringTablesResult and ParserInfo."""
+
+    def test_string_tables_result_has(self):
+        """Test has() reports exactly the extracted table names."""
+        result = StringTablesResult(table_names=["userinfo", "instancebaseline"])
+        assert result.has("userinfo") is True
+        assert result.has("modifiers") is False
+
+    def test_parser_info_has(self):
+        """Test has() reports exactly the parser's string tables."""
+        info = ParserInfo(string_tables=["userinfo"])
+        assert info.has("userinfo") is True
+        assert info.has("instancebaseline") is False
+
+    def test_has_follows_model_copy_update(self):
+        """Test has() reflects names replaced via model_copy."""
+        result = StringTablesResult(table_names=["userinfo"])
+        copied = result.model_copy(update={"table_names": ["instancebaseline"]})
+        assert copied.has("instancebaseline") is True
+        assert copied.has("userinfo") is False
+
+        info = ParserInfo(string_tables=["userinfo"])
+        copied_info = info.model_copy(update={"string_tables": ["modifiers"]})
+        assert copied_info.has("modifiers") is True
+        assert copied_info.has("userinfo") is False
+
+    def test_has_follows_in_place_edits(self):
+        """Test has() sees names appended to the list after construction."""
+        result = StringTablesResult(table_names=["userinfo"])
+        result.table_names.append("modifiers")
+        assert result.has("modifiers") is True
+
+
+class TestAttackEventGameTimeStr:
+    """Test AttackEvent.game_time_str is computed from game_time."""
+
+    def test_game_time_str_included_in_dump(self):
+        """Test game_time_str is formatted and kept in model_dump/model_dump_json."""
+        event = AttackEvent(tick=1000, game_time=187.0)
+        assert event.game_time_str == "3:07"
+        assert event.model_dump()["game_time_str"] == "3:07"
+        assert '"game_time_str":"3:07"' in event.model_dump_json()
+
+
 class TestNormalizeHeroName:
     """Test normalize_hero_name utility function."""
 
     def test_double_underscore_normalized(self):
         """Test double underscores are replaced with single."""
-        from python_manta import normalize_hero_name
-
         assert normalize_hero_name("shadow__demon") == "shadow_demon"
         assert normalize_hero_name("npc_dota_hero_shadow__demon") == "npc_dota_hero_shadow_demon"
 
     def test_triple_underscore_normalized(self):
         """Test triple underscores are also normalized."""
-        from python_manta import normalize_hero_name
-
         assert normalize_hero_name("test___name") == "test_name"
 
     def test_single_underscore_unchanged(self):
         """Test single underscores are not modified."""
-        from python_manta import normalize_hero_name
-
         assert normalize_hero_name("shadow_demon") == "shadow_demon"
         assert normalize_hero_name("npc_dota_hero_troll_warlord") == "npc_dota_hero_troll_warlord"
 
     def test_no_underscore_unchanged(self):
         """Test names without underscores are not modified."""
-        from python_manta import normalize_hero_name
-
         assert normalize_hero_name("axe") == "axe"
         assert normalize_hero_name("juggernaut") == "juggernaut"
 
     def test_empty_string(self):
         """Test empty string returns empty string."""
-        from python_manta import normalize_hero_name
-
         assert normalize_hero_name("") == ""
 
 
@@ -530,8 +659,6 @@ class TestTimeUtilities:
 
     def test_format_game_time_positive(self):
         """Test format_game_time with positive values."""
-        from python_manta import format_game_time
-
         assert format_game_time(0) == "0:00"
         assert format_game_time(30) == "0:30"
         assert format_game_time(60) == "1:00"
@@ -540,15 +667,11 @@ class TestTimeUtilities:
 
     def test_format_game_time_negative(self):
         """Test format_game_time with negative values (pre-horn)."""
-        from python_manta import format_game_time
-
         assert format_game_time(-40) == "-0:40"
         assert format_game_time(-90) == "-1:30"
 
     def test_game_time_to_tick(self):
         """Test game_time_to_tick conversion."""
-        from python_manta import game_time_to_tick, TICKS_PER_SECOND
-
         game_start_tick = 27000
         # 300 seconds = 5:00 = 9000 ticks after game start
         assert game_time_to_tick(300, game_start_tick) == 27000 + 300 * int(TICKS_PER_SECOND)
@@ -559,8 +682,6 @@ class TestTimeUtilities:
 
     def test_tick_to_game_time(self):
         """Test tick_to_game_time conversion."""
-        from python_manta import tick_to_game_time, TICKS_PER_SECOND
-
         game_start_tick = 27000
         # At game start tick, game_time = 0
         assert tick_to_game_time(27000, game_start_tick) == 0.0
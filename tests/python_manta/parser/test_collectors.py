@@ -9,10 +9,13 @@ redundant parsing and improve test performance significantly.
 
 import pytest
 
-pytestmark = pytest.mark.unit
+pytestmark = [pytest.mark.unit, pytest.mark.requires_demo]
 from caching_parser import Parser
 from tests.conftest import DEMO_FILE
 
+HERO_PREFIX = "npc_dota_hero_"
+CHASE_HERO_KEYS = frozenset({"eventtype", "target1"})
+
 
 class TestGameEvents:
     """Test game events parsing with real data."""
@@ -45,13 +48,20 @@ class TestGameEvents:
             assert event.net_tick >= 0
             assert isinstance(event.fields, dict)
 
-    def test_game_events_max_events_respected(self, game_events_result, game_events_dota):
+    @pytest.mark.parametrize(
+        "game_events_view,expected_count",
+        [
+            ({"max_events": 10}, 10),
+            ({"max_events": 100}, 100),
+            ({"event_filter": "dota", "max_events": 10}, 10),
+        ],
+        indirect=["game_events_view"],
+        ids=["max_10", "max_100", "dota_max_10"],
+    )
+    def test_game_events_max_events_respected(self, game_events_view, expected_count):
         """Test max_events parameter limits results."""
-        # game_events_result has 100 events, game_events_dota has 10
-        assert game_events_result.game_events is not None
-        assert game_events_dota.game_events is not None
-        assert len(game_events_result.game_events.events) == 100
-        assert len(game_events_dota.game_events.events) == 10
+        assert game_events_view.game_events is not None
+        assert len(game_events_view.game_events.events) == expected_count
 
     def test_game_events_dota_chase_hero_fields(self, game_events_chase_hero):
         """Test dota_chase_hero events have expected fields."""
@@ -60,7 +70,7 @@ class TestGameEvents:
         assert result.game_events is not None
         if result.game_events.events:
             event = result.game_events.events[0]
-            assert "eventtype" in event.fields or "target1" in event.fields
+            assert not CHASE_HERO_KEYS.isdisjoint(event.fields)
 
 
 class TestModifiers:
@@ -110,18 +120,19 @@ class TestStringTables:
         result = string_tables_result
         assert result.success is True
         assert result.string_tables is not None
-        known_tables = ["instancebaseline", "userinfo", "lightstyles"]
-        for table in known_tables:
-            assert table in result.string_tables.table_names
+        known_tables = frozenset({"instancebaseline", "userinfo", "lightstyles"})
+        missing = {table for table in known_tables if not result.string_tables.has(table)}
+        assert not missing
 
     def test_string_tables_specific_table(self, string_tables_userinfo):
         """Test extracting specific table."""
         result = string_tables_userinfo
         assert result.success is True
         assert result.string_tables is not None
-        assert "userinfo" in result.string_tables.table_names
+        assert result.string_tables.has("userinfo")
 
 
+@pytest.mark.xdist_group("demo_parse")
 class TestCombatLog:
     """Test structured combat log parsing with real data."""
 
@@ -137,12 +148,10 @@ class TestCombatLog:
         result = combat_log_10
         assert result.success is True
         assert result.combat_log is not None
+        # Field types are enforced by CombatLogEntry validation at parse time
         for entry in result.combat_log.entries:
             assert entry.tick >= 0
             assert len(entry.type_name) > 0
-            assert isinstance(entry.game_time, float)
-            assert isinstance(entry.is_attacker_hero, bool)
-            assert isinstance(entry.is_target_hero, bool)
 
     def test_combat_log_heroes_only_filter(self, combat_log_heroes_only):
         """Test filtering for hero-related entries only.
@@ -155,10 +164,11 @@ class TestCombatLog:
         assert result.success is True
         assert result.combat_log is not None
         for entry in result.combat_log.entries:
+            # Cheap boolean flags first; name scans only when both are False
             is_hero_related = (
                 entry.is_attacker_hero or entry.is_target_hero or
-                "npc_dota_hero_" in entry.attacker_name or
-                "npc_dota_hero_" in entry.target_name
+                HERO_PREFIX in entry.attacker_name or
+                HERO_PREFIX in entry.target_name
             )
             assert is_hero_related, f"Entry not hero-related: {entry.type_name}"
 
@@ -175,20 +185,20 @@ class TestCombatLog:
         result = combat_log_100
         assert result.success is True
         assert result.combat_log is not None
-        if len(result.combat_log.entries) > 1:
-            game_times = [e.game_time for e in result.combat_log.entries]
+        entries = result.combat_log.entries
+        if len(entries) > 1:
             # Game times should generally increase (allowing for some variance)
-            assert game_times[-1] >= game_times[0]
+            assert entries[-1].game_time >= entries[0].game_time
 
     def test_combat_log_name_resolution(self, combat_log_heroes_only):
         """Test that names are properly resolved (not unknown_X)."""
         result = combat_log_heroes_only
         assert result.success is True
         assert result.combat_log is not None
-        hero_entries = [e for e in result.combat_log.entries if e.is_attacker_hero or e.is_target_hero]
-        assert len(hero_entries) > 0
+        entries = result.combat_log.entries
+        assert any(e.is_attacker_hero or e.is_target_hero for e in entries)
 
-        for entry in hero_entries:
+        for entry in entries:
             if entry.is_attacker_hero and entry.attacker_name:
                 assert "npc_dota_hero" in entry.attacker_name
             if entry.is_target_hero and entry.target_name:
@@ -212,7 +222,7 @@ class TestParserInfo:
         assert result.success is True
         assert result.parser_info is not None
         assert len(result.parser_info.string_tables) > 0
-        assert "instancebaseline" in result.parser_info.string_tables
+        assert result.parser_info.has("instancebaseline")
 
     def test_parser_info_known_values(self, parser_info_result):
         """Test parser info returns expected known values for test demo."""
@@ -223,6 +233,33 @@ class TestParserInfo:
         assert result.parser_info.entity_count > 3000  # Should have many entities
 
 
+class TestFilteredViewsMatchNativeParse:
+    """The conftest views sliced from superset parses must match native parses."""
+
+    def test_game_events_view_matches_native(
+        self, game_events_dota, native_game_events_dota
+    ):
+        """Test event_filter and max_events views match the Go collector."""
+        assert game_events_dota.game_events == native_game_events_dota.game_events
+
+    def test_modifiers_view_matches_native(self, modifiers_50, native_modifiers_50):
+        """Test the max_modifiers view matches the Go collector."""
+        assert modifiers_50.modifiers == native_modifiers_50.modifiers
+
+    def test_combat_log_types_view_matches_native(
+        self, combat_log_deaths, native_combat_log_deaths
+    ):
+        """Test types and max_entries views match the Go collector."""
+        assert combat_log_deaths.combat_log == native_combat_log_deaths.combat_log
+
+    def test_combat_log_heroes_only_view_matches_native(
+        self, combat_log_heroes_only, native_combat_log_heroes_only
+    ):
+        """Test the heroes_only view applies after max_entries like the Go collector."""
+        native = native_combat_log_heroes_only.combat_log
+        assert combat_log_heroes_only.combat_log == native
+
+
 class TestAdvancedFeaturesCrossFunctional:
     """Cross-functional tests across multiple advanced features."""
 
@@ -239,15 +276,16 @@ class TestAdvancedFeaturesCrossFunctional:
         assert game_events_result.game_events is not None
         assert modifiers_result.modifiers is not None
 
-        # Check events are ordered
-        event_ticks = [e.tick for e in game_events_result.game_events.events]
-        assert event_ticks == sorted(event_ticks)
+        # Check events are ordered (single pass, stops at the first violation)
+        events = game_events_result.game_events.events
+        assert all(a.tick <= b.tick for a, b in zip(events, events[1:]))
 
         # Check modifiers are ordered
-        mod_ticks = [m.tick for m in modifiers_result.modifiers.modifiers]
-        assert mod_ticks == sorted(mod_ticks)
+        mods = modifiers_result.modifiers.modifiers
+        assert all(a.tick <= b.tick for a, b in zip(mods, mods[1:]))
 
 
+@pytest.mark.xdist_group("demo_parse")
 class TestAttacksCollector:
     """Test attacks parsing from TE_Projectile messages.
 
@@ -292,18 +330,15 @@ class TestAttacksCollector:
         assert isinstance(event.dodgeable, bool)
         assert event.game_time_str != ""
 
-    def test_attacks_tower_725_attack_count(self, attacks_result):
+    def test_attacks_tower_725_attack_count(self, attack_source_counts):
         """Test that Dire T1 top tower (entity 725) attacks are captured.
 
         Real data: Entity 725 (npc_dota_badguys_tower1_top) had 276 attacks.
         """
-        assert attacks_result is not None
-
-        tower_attacks = [e for e in attacks_result.events if e.source_index == 725]
         # Exact value from our analysis
-        assert len(tower_attacks) == 276
+        assert attack_source_counts[725] == 276
 
-    def test_attacks_hero_vs_nonhero_ratio(self, attacks_result, snapshot_60k):
+    def test_attacks_hero_vs_nonhero_ratio(self, attacks_result, attack_source_counts, hero_index_set):
         """Test that non-hero attacks outnumber hero attacks.
 
         Real data breakdown:
@@ -312,9 +347,7 @@ class TestAttacksCollector:
         """
         assert attacks_result is not None
 
-        hero_indices = {h.index for h in snapshot_60k.heroes}
-
-        hero_attacks = sum(1 for e in attacks_result.events if e.source_index in hero_indices)
+        hero_attacks = sum(attack_source_counts[i] for i in hero_index_set)
         non_hero_attacks = attacks_result.total_events - hero_attacks
 
         # Exact values from our analysis (ranged + melee)
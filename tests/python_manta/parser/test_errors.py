@@ -20,18 +20,15 @@ class TestParserErrorHandling:
         with pytest.raises(FileNotFoundError, match="Shared library not found"):
             Parser(DEMO_FILE, library_path="/nonexistent/path/libmanta_wrapper.so")
 
-    def test_nonexistent_demo_file_error(self):
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"header": True}, {"game_info": True}, {"messages": True}],
+        ids=["header", "game_info", "messages"],
+    )
+    def test_nonexistent_demo_file_error(self, nonexistent_parser, kwargs):
         """Test Parser raises proper error for nonexistent demo file."""
-        parser = Parser("/nonexistent/file.dem")
-
-        with pytest.raises(FileNotFoundError, match="Demo file not found"):
-            parser.parse(header=True)
-
         with pytest.raises(FileNotFoundError, match="Demo file not found"):
-            parser.parse(game_info=True)
-
-        with pytest.raises(FileNotFoundError, match="Demo file not found"):
-            parser.parse(messages=True)
+            nonexistent_parser.parse(**kwargs)
 
     def test_invalid_file_type_error(self):
         """Test Parser handles invalid file types properly."""
@@ -46,6 +43,7 @@ class TestParserErrorHandling:
             parser.parse(game_info=True)
         assert "is a directory" in str(exc_info.value)
 
+    @pytest.mark.requires_demo
     def test_empty_parse_still_succeeds(self):
         """Test parsing with no collectors still succeeds."""
         parser = Parser(DEMO_FILE)
@@ -126,32 +124,18 @@ class TestRealErrorConditions:
 class TestAdvancedFeaturesErrorHandling:
     """Test error handling for advanced features."""
 
-    def test_game_events_nonexistent_file(self):
-        """Test game events with nonexistent file."""
-        parser = Parser("/nonexistent/file.dem")
-        with pytest.raises(FileNotFoundError):
-            parser.parse(game_events={"max_events": 10})
-
-    def test_modifiers_nonexistent_file(self):
-        """Test modifiers with nonexistent file."""
-        parser = Parser("/nonexistent/file.dem")
-        with pytest.raises(FileNotFoundError):
-            parser.parse(modifiers={"max_modifiers": 10})
-
-    def test_string_tables_nonexistent_file(self):
-        """Test string tables with nonexistent file."""
-        parser = Parser("/nonexistent/file.dem")
-        with pytest.raises(FileNotFoundError):
-            parser.parse(string_tables={"max_entries": 10})
-
-    def test_combat_log_nonexistent_file(self):
-        """Test combat log with nonexistent file."""
-        parser = Parser("/nonexistent/file.dem")
-        with pytest.raises(FileNotFoundError):
-            parser.parse(combat_log={"max_entries": 10})
-
-    def test_parser_info_nonexistent_file(self):
-        """Test parser info with nonexistent file."""
-        parser = Parser("/nonexistent/file.dem")
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"game_events": {"max_events": 10}},
+            {"modifiers": {"max_modifiers": 10}},
+            {"string_tables": {"max_entries": 10}},
+            {"combat_log": {"max_entries": 10}},
+            {"parser_info": True},
+        ],
+        ids=["game_events", "modifiers", "string_tables", "combat_log", "parser_info"],
+    )
+    def test_collector_nonexistent_file(self, nonexistent_parser, kwargs):
+        """Test each advanced collector raises for a nonexistent file."""
         with pytest.raises(FileNotFoundError):
-            parser.parse(parser_info=True)
+            nonexistent_parser.parse(**kwargs)
@@ -10,45 +10,60 @@ redundant parsing and improve test performance significantly.
 import pytest
 
 pytestmark = pytest.mark.unit
+from python_manta import (
+    CreepSnapshot,
+    HeroRespawnEvent,
+    Item,
+    ItemCategory,
+    NeutralItem,
+    derive_respawn_events,
+)
 from caching_parser import Parser
 from tests.conftest import DEMO_FILE
 
-
+HERO_PREFIX = "npc_dota_hero_"
+# 0=unknown, 2=Radiant, 3=Dire, 4=Neutral
+VALID_CREEP_TEAMS = frozenset({0, 2, 3, 4})
+EXPECTED_CREEP_FIELDS = frozenset({
+    "entity_id", "class_name", "name", "team", "x", "y",
+    "health", "max_health", "is_neutral", "is_lane",
+})
+# Neutral item of every hero at tick 60000
+EXPECTED_NEUTRALS_60K = {
+    "npc_dota_hero_troll_warlord": "item_poormansshield",
+    "npc_dota_hero_chen": "item_dormant_curio",
+    "npc_dota_hero_monkey_king": "item_spark_of_courage",
+    "npc_dota_hero_hoodwink": "item_kobold_cup",
+    "npc_dota_hero_bristleback": "item_occult_bracelet",
+    "npc_dota_hero_lycan": "item_ripperslash",
+    "npc_dota_hero_pugna": "item_dormant_curio",
+    "npc_dota_hero_faceless_void": "item_ripperslash",
+    "npc_dota_hero_storm_spirit": "item_dormant_curio",
+    "npc_dota_hero_shadow_shaman": "item_kobold_cup",
+}
+
+
+@pytest.mark.requires_demo
+@pytest.mark.usefixtures("prewarmed_feature_parses")
 class TestRespawnEvents:
     """Test hero respawn event derivation."""
 
-    def test_derive_respawn_events(self, parser):
+    def test_derive_respawn_events(self, death_respawns):
         """Test deriving respawn events from death entries."""
-        from python_manta import derive_respawn_events, HeroRespawnEvent, CombatLogType
-
-        result = parser.parse(combat_log={
-            "types": [CombatLogType.DEATH],
-            "heroes_only": True,
-            "max_entries": 1000
-        })
-        assert result.success is True
+        assert len(death_respawns) > 0
 
-        respawns = derive_respawn_events(result.combat_log)
-        assert len(respawns) > 0
-
-        for event in respawns:
+        for event in death_respawns:
             assert isinstance(event, HeroRespawnEvent)
-            assert "npc_dota_hero_" in event.hero_name
+            assert event.hero_name.startswith(HERO_PREFIX)
             assert len(event.hero_display_name) > 0
             assert event.death_tick > 0
             assert event.respawn_duration >= 0
             assert event.respawn_tick >= event.death_tick
 
-    def test_respawn_event_uses_combat_log_level(self, parser):
+    def test_respawn_event_uses_combat_log_level(self, death_combat_log, death_respawns):
         """Test respawn uses target_hero_level from combat log when available."""
-        from python_manta import derive_respawn_events, CombatLogType
-
-        result = parser.parse(combat_log={
-            "types": [CombatLogType.DEATH],
-            "heroes_only": True,
-            "max_entries": 1000
-        })
-        respawns = derive_respawn_events(result.combat_log)
+        result = death_combat_log
+        respawns = death_respawns
 
         # Find a respawn with known level from combat log
         deaths_with_level = [e for e in result.combat_log.entries if e.target_hero_level > 0]
@@ -56,7 +71,9 @@ class TestRespawnEvents:
             # The respawn should use the combat log level, not default level 1
             # and custom levels should NOT override combat log levels
             hero_name = respawns[0].hero_name
-            hero_key = hero_name.replace("npc_dota_hero_", "")
+            # str.removeprefix needs Python 3.9; slice off the known prefix instead
+            assert hero_name.startswith(HERO_PREFIX)
+            hero_key = hero_name[len(HERO_PREFIX):]
             hero_levels = {hero_key: 99}  # Try to override with level 99
             respawns_custom = derive_respawn_events(result.combat_log, hero_levels)
 
@@ -65,6 +82,8 @@ class TestRespawnEvents:
             assert respawns_custom[0].hero_level != 99  # Custom level was NOT used
 
 
+@pytest.mark.requires_demo
+@pytest.mark.usefixtures("prewarmed_feature_parses")
 class TestPreHornPositions:
     """Test pre-horn entity snapshots (FEATURE #12).
 
@@ -72,36 +91,24 @@ class TestPreHornPositions:
     indicating time before the horn sounded (0:00 mark).
     """
 
-    def test_prehorn_snapshots_have_negative_game_time(self, entities_with_prehord):
+    def test_prehorn_snapshots_have_negative_game_time(self, horn_split_snapshots):
         """Test that early snapshots have negative game_time (before horn)."""
-        result = entities_with_prehord
-        assert result.success is True
-        assert result.entities is not None
-        assert len(result.entities.snapshots) > 0
-
-        prehorn_snapshots = [s for s in result.entities.snapshots if s.game_time < 0]
+        prehorn_snapshots, _ = horn_split_snapshots
         assert len(prehorn_snapshots) > 0, "Should have pre-horn snapshots with negative game_time"
 
         for snap in prehorn_snapshots:
-            assert snap.game_time < 0
             assert snap.tick > 0
 
     def test_game_start_tick_is_populated(self, entities_with_prehord):
         """Test that game_start_tick is returned and non-zero."""
         result = entities_with_prehord
-        assert result.success is True
-        assert result.entities is not None
         assert result.entities.game_start_tick > 0, "game_start_tick should be positive"
         # For typical Dota 2 replays, game starts around tick 20000-40000
         assert result.entities.game_start_tick > 10000
 
-    def test_game_time_str_formats_negative_times(self, entities_with_prehord):
+    def test_game_time_str_formats_negative_times(self, horn_split_snapshots):
         """Test game_time_str property formats negative times with minus sign."""
-        result = entities_with_prehord
-        assert result.success is True
-        assert result.entities is not None
-
-        prehorn_snapshots = [s for s in result.entities.snapshots if s.game_time < 0]
+        prehorn_snapshots, _ = horn_split_snapshots
         assert len(prehorn_snapshots) > 0
 
         for snap in prehorn_snapshots:
@@ -109,34 +116,27 @@ class TestPreHornPositions:
             assert time_str.startswith("-"), f"Pre-horn time should start with '-': {time_str}"
             assert ":" in time_str, f"Time should contain colon: {time_str}"
 
-    def test_posthorn_snapshots_have_positive_game_time(self, entities_with_prehord):
+    def test_posthorn_snapshots_have_positive_game_time(self, horn_split_snapshots):
         """Test that snapshots after horn have positive game_time."""
-        result = entities_with_prehord
-        assert result.success is True
-        assert result.entities is not None
-
-        posthorn_snapshots = [s for s in result.entities.snapshots if s.game_time >= 0]
+        _, posthorn_snapshots = horn_split_snapshots
         assert len(posthorn_snapshots) > 0, "Should have post-horn snapshots"
 
-        for snap in posthorn_snapshots:
-            assert snap.game_time >= 0
-
     def test_game_time_increases_with_tick(self, entities_with_prehord):
         """Test that game_time increases as tick increases."""
-        result = entities_with_prehord
-        assert result.success is True
-        assert result.entities is not None
-        assert len(result.entities.snapshots) >= 2
-
-        snapshots = sorted(result.entities.snapshots, key=lambda s: s.tick)
-        for i in range(1, len(snapshots)):
-            prev = snapshots[i - 1]
-            curr = snapshots[i]
-            assert curr.tick > prev.tick
-            assert curr.game_time > prev.game_time, \
-                f"game_time should increase: {prev.game_time} -> {curr.game_time}"
+        snapshots = entities_with_prehord.entities.snapshots
+        assert len(snapshots) >= 2
+
+        # Snapshots arrive tick-ordered, so this sort is a single linear pass
+        timeline = sorted((s.tick, s.game_time) for s in snapshots)
+        regressions = [
+            (prev, curr) for prev, curr in zip(timeline, timeline[1:])
+            if curr[0] <= prev[0] or curr[1] <= prev[1]
+        ]
+        assert not regressions, f"game_time should increase with tick: {regressions[:3]}"
 
 
+@pytest.mark.requires_demo
+@pytest.mark.usefixtures("prewarmed_feature_parses")
 class TestCreepPositions:
     """Test creep entity positions (FEATURE #9).
 
@@ -145,129 +145,75 @@ class TestCreepPositions:
 
     def test_include_creeps_populates_creeps_list(self, entities_with_creeps):
         """Test that include_creeps=True populates creeps in snapshots."""
-        result = entities_with_creeps
-        assert result.success is True
-        assert result.entities is not None
+        snapshots = entities_with_creeps.entities.snapshots
 
-        snapshots_with_creeps = [s for s in result.entities.snapshots if len(s.creeps) > 0]
+        snapshots_with_creeps = [s for s in snapshots if s.creeps]
         assert len(snapshots_with_creeps) > 0, "Should have snapshots with creeps"
 
-    def test_creep_snapshot_has_expected_fields(self, entities_with_creeps):
+    def test_creep_snapshot_has_expected_fields(self, all_creeps):
         """Test CreepSnapshot model has all expected fields."""
-        from python_manta import CreepSnapshot
-
-        result = entities_with_creeps
-        assert result.success is True
-        assert result.entities is not None
-
-        for snap in result.entities.snapshots:
-            for creep in snap.creeps:
-                assert isinstance(creep, CreepSnapshot)
-                assert hasattr(creep, 'entity_id')
-                assert hasattr(creep, 'class_name')
-                assert hasattr(creep, 'name')
-                assert hasattr(creep, 'team')
-                assert hasattr(creep, 'x')
-                assert hasattr(creep, 'y')
-                assert hasattr(creep, 'health')
-                assert hasattr(creep, 'max_health')
-                assert hasattr(creep, 'is_neutral')
-                assert hasattr(creep, 'is_lane')
-                break  # Just need to verify one
-            if snap.creeps:
-                break
-
-    def test_creeps_have_valid_team_values(self, entities_with_creeps):
-        """Test creeps have valid team values (2=Radiant, 3=Dire, 4=Neutral)."""
-        result = entities_with_creeps
-        assert result.success is True
-        assert result.entities is not None
-
-        valid_teams = {0, 2, 3, 4}  # 0=unknown, 2=Radiant, 3=Dire, 4=Neutral
-        all_creeps = []
-        for snap in result.entities.snapshots:
-            all_creeps.extend(snap.creeps)
+        if not all_creeps:
+            pytest.skip("no creeps in this demo")
+        assert isinstance(all_creeps[0], CreepSnapshot)
+        assert EXPECTED_CREEP_FIELDS <= CreepSnapshot.model_fields.keys()
 
-        assert len(all_creeps) > 0, "Should have creeps to test"
-        for creep in all_creeps:
-            assert creep.team in valid_teams, f"Invalid team: {creep.team}"
+    def test_creeps_have_valid_team_values(self, creep_columns):
+        """Test creeps have valid team values (2=Radiant, 3=Dire, 4=Neutral)."""
+        teams = creep_columns["team"]
+        if not teams:
+            pytest.skip("no creeps in this demo")
+        invalid = set(teams) - VALID_CREEP_TEAMS
+        assert not invalid, f"Invalid teams: {sorted(invalid)}"
 
-    def test_lane_creeps_have_is_lane_flag(self, entities_with_creeps):
+    def test_lane_creeps_have_is_lane_flag(self, all_creeps):
         """Test lane creeps have is_lane=True flag."""
-        result = entities_with_creeps
-        assert result.success is True
-        assert result.entities is not None
-
-        all_creeps = []
-        for snap in result.entities.snapshots:
-            all_creeps.extend(snap.creeps)
-
         lane_creeps = [c for c in all_creeps if c.is_lane]
         # Lane creeps should exist in any normal game
-        assert len(lane_creeps) > 0, "Should have lane creeps with is_lane=True"
+        assert lane_creeps, "Should have lane creeps with is_lane=True"
 
-        for creep in lane_creeps:
-            assert "Lane" in creep.class_name or "creep" in creep.name.lower()
-            assert creep.team in {2, 3}, f"Lane creeps should be Radiant(2) or Dire(3), got {creep.team}"
+        # A few distinct class/name pairs cover thousands of creep samples
+        kinds = {(c.class_name, c.name) for c in lane_creeps}
+        unexpected = [k for k in kinds if "Lane" not in k[0] and "creep" not in k[1].lower()]
+        assert not unexpected, f"Non-lane creeps flagged is_lane: {unexpected[:3]}"
+        teams = {c.team for c in lane_creeps}
+        assert teams <= {2, 3}, f"Lane creeps should be Radiant(2) or Dire(3), got {sorted(teams)}"
 
-    def test_neutral_creeps_have_is_neutral_flag(self, entities_with_creeps):
+    def test_neutral_creeps_have_is_neutral_flag(self, all_creeps):
         """Test neutral creeps have is_neutral=True flag."""
-        result = entities_with_creeps
-        assert result.success is True
-        assert result.entities is not None
-
-        all_creeps = []
-        for snap in result.entities.snapshots:
-            all_creeps.extend(snap.creeps)
-
         neutral_creeps = [c for c in all_creeps if c.is_neutral]
         # Neutral creeps should exist in any normal game
-        assert len(neutral_creeps) > 0, "Should have neutral creeps with is_neutral=True"
+        assert neutral_creeps, "Should have neutral creeps with is_neutral=True"
 
-        for creep in neutral_creeps:
-            assert "Neutral" in creep.class_name
+        unexpected = [cls for cls in {c.class_name for c in neutral_creeps} if "Neutral" not in cls]
+        assert not unexpected, f"Non-neutral classes flagged is_neutral: {unexpected}"
 
-    def test_creeps_have_valid_positions(self, entities_with_creeps):
+    def test_creeps_have_valid_positions(self, creep_columns):
         """Test creeps have positions within valid map bounds."""
-        result = entities_with_creeps
-        assert result.success is True
-        assert result.entities is not None
-
-        all_creeps = []
-        for snap in result.entities.snapshots:
-            all_creeps.extend(snap.creeps)
-
-        assert len(all_creeps) > 0, "Should have creeps to test"
+        xs, ys = creep_columns["x"], creep_columns["y"]
+        if not xs:
+            pytest.skip("no creeps in this demo")
         # Dota 2 map is roughly -8192 to +8192 world units
-        for creep in all_creeps:
-            assert -10000 < creep.x < 10000, f"X position out of bounds: {creep.x}"
-            assert -10000 < creep.y < 10000, f"Y position out of bounds: {creep.y}"
+        assert -10000 < min(xs) and max(xs) < 10000, f"X position out of bounds: {min(xs)}..{max(xs)}"
+        assert -10000 < min(ys) and max(ys) < 10000, f"Y position out of bounds: {min(ys)}..{max(ys)}"
 
-    def test_creeps_have_positive_health(self, entities_with_creeps):
+    def test_creeps_have_positive_health(self, creep_columns):
         """Test creeps have positive health values."""
-        result = entities_with_creeps
-        assert result.success is True
-        assert result.entities is not None
-
-        all_creeps = []
-        for snap in result.entities.snapshots:
-            all_creeps.extend(snap.creeps)
-
-        assert len(all_creeps) > 0, "Should have creeps to test"
-        for creep in all_creeps:
-            assert creep.health >= 0, f"Health should be non-negative: {creep.health}"
-            assert creep.max_health > 0, f"Max health should be positive: {creep.max_health}"
+        health, max_health = creep_columns["health"], creep_columns["max_health"]
+        if not health:
+            pytest.skip("no creeps in this demo")
+        assert min(health) >= 0, f"Health should be non-negative: {min(health)}"
+        assert min(max_health) > 0, f"Max health should be positive: {min(max_health)}"
 
     def test_creeps_not_included_by_default(self, entities_result):
         """Test that creeps are NOT included when include_creeps is not set."""
-        result = entities_result
-        assert result.success is True
-        assert result.entities is not None
+        snapshots = entities_result.entities.snapshots
 
-        for snap in result.entities.snapshots:
-            assert len(snap.creeps) == 0, "Creeps should not be included by default"
+        with_creeps = [s.tick for s in snapshots if s.creeps]
+        assert not with_creeps, f"Creeps should not be included by default (ticks {with_creeps[:3]})"
 
 
+@pytest.mark.requires_demo
+@pytest.mark.usefixtures("prewarmed_feature_parses")
 class TestCampsStacked:
     """Test camps_stacked field extraction from entity properties (FEATURE #11).
 
@@ -275,63 +221,47 @@ class TestCampsStacked:
     entities via the m_vecDataTeam.%04d.m_iCampsStacked property.
     """
 
-    def test_camps_stacked_field_exists(self, snapshot_30k):
+    def test_camps_stacked_field_exists(self, camps_stacked_counts):
         """Test HeroSnapshot has camps_stacked field."""
-        snap = snapshot_30k
-        assert snap is not None
-        assert len(snap.heroes) > 0
-
-        for hero in snap.heroes:
-            assert hasattr(hero, 'camps_stacked'), "HeroSnapshot should have camps_stacked field"
-            assert isinstance(hero.camps_stacked, int)
+        early, _ = camps_stacked_counts
+        assert len(early) > 0
+        assert all(isinstance(count, int) for count in early)
 
-    def test_camps_stacked_non_negative(self, snapshot_lategame):
+    def test_camps_stacked_non_negative(self, camps_stacked_counts):
         """Test camps_stacked values are non-negative."""
-        snap = snapshot_lategame
-        assert snap is not None
-        assert len(snap.heroes) > 0
+        _, late = camps_stacked_counts
+        assert len(late) > 0
+        assert min(late) >= 0, f"camps_stacked should be >= 0, got {min(late)}"
 
-        for hero in snap.heroes:
-            assert hero.camps_stacked >= 0, f"camps_stacked should be >= 0, got {hero.camps_stacked}"
-
-    def test_camps_stacked_increases_over_time(self, snapshot_30k, snapshot_lategame):
+    def test_camps_stacked_increases_over_time(self, camps_stacked_counts):
         """Test camps_stacked generally increases over time in a match."""
-        early_snap = snapshot_30k
-        late_snap = snapshot_lategame
-        assert early_snap is not None and late_snap is not None
-
-        early_total = sum(h.camps_stacked for h in early_snap.heroes)
-        late_total = sum(h.camps_stacked for h in late_snap.heroes)
+        early, late = camps_stacked_counts
+        early_total, late_total = sum(early), sum(late)
 
         assert late_total >= early_total, \
             f"Total camps_stacked should increase over time: {early_total} -> {late_total}"
 
-    def test_camps_stacked_supports_have_stacks(self, snapshot_lategame):
+    def test_camps_stacked_supports_have_stacks(self, camps_stacked_counts):
         """Test that at least some heroes have camps_stacked > 0 in late game.
 
         In a typical pro match, supports stack camps for carries.
         """
-        snap = snapshot_lategame
-        assert snap is not None
-        assert len(snap.heroes) == 10
-
-        heroes_with_stacks = [h for h in snap.heroes if h.camps_stacked > 0]
-        assert len(heroes_with_stacks) > 0, \
+        _, late = camps_stacked_counts
+        assert len(late) == 10
+        assert max(late) > 0, \
             "At least one hero should have camps_stacked > 0 in late game"
 
-    def test_camps_stacked_reasonable_values(self, snapshot_lategame):
+    def test_camps_stacked_reasonable_values(self, camps_stacked_counts):
         """Test camps_stacked values are within reasonable range.
 
         Even in a long game, individual player stacks rarely exceed 30.
         """
-        snap = snapshot_lategame
-        assert snap is not None
-
-        for hero in snap.heroes:
-            assert hero.camps_stacked < 50, \
-                f"camps_stacked unusually high for {hero.hero_name}: {hero.camps_stacked}"
+        _, late = camps_stacked_counts
+        assert max(late) < 50, f"camps_stacked unusually high: {late}"
 
 
+@pytest.mark.requires_demo
+@pytest.mark.usefixtures("prewarmed_feature_parses")
 class TestHeroLevelInjection:
     """Test hero level injection from entity state into combat log.
 
@@ -345,37 +275,31 @@ class TestHeroLevelInjection:
     - Deaths with attacker_hero_level > 0: 45 (94%)
     """
 
-    def test_hero_deaths_have_target_levels(self, combat_log_hero_deaths):
+    def test_hero_deaths_have_target_levels(self, hero_death_levels):
         """Test that all hero deaths now have target_hero_level populated.
 
         This was 0% before the fix, now should be 100%.
         """
-        result = combat_log_hero_deaths
-        assert result.success is True
-        assert result.combat_log is not None
+        target_levels, _ = hero_death_levels
+        assert len(target_levels) == 48  # Real value from match
 
-        hero_deaths = [e for e in result.combat_log.entries if e.is_target_hero]
-        assert len(hero_deaths) == 48  # Real value from match
-
-        deaths_with_level = sum(1 for d in hero_deaths if d.target_hero_level > 0)
+        # Levels are never negative, so "populated" is everything but 0
+        deaths_with_level = len(target_levels) - target_levels.count(0)
         assert deaths_with_level == 48  # 100% now have levels
 
-    def test_hero_deaths_have_attacker_levels(self, combat_log_hero_deaths):
+    def test_hero_deaths_have_attacker_levels(self, hero_death_levels):
         """Test that most hero deaths have attacker_hero_level populated.
 
         Non-hero attackers (summons, neutrals, wards) will have 0.
         Real data: 45/48 = 94% have attacker levels.
         """
-        result = combat_log_hero_deaths
-        assert result.combat_log is not None
-
-        hero_deaths = [e for e in result.combat_log.entries if e.is_target_hero]
-        deaths_with_attacker_level = sum(1 for d in hero_deaths if d.attacker_hero_level > 0)
+        _, attacker_levels = hero_death_levels
+        deaths_with_attacker_level = len(attacker_levels) - attacker_levels.count(0)
 
         # 45 of 48 deaths had hero attackers
         assert deaths_with_attacker_level == 45
 
-    def test_nonhero_attackers_have_zero_level(self, combat_log_hero_deaths):
+    def test_nonhero_attackers_have_zero_level(self, hero_deaths):
         """Test that non-hero attackers correctly have level 0.
 
         Real data shows 3 deaths from non-heroes:
@@ -383,10 +307,6 @@ class TestHeroLevelInjection:
         - npc_dota_neutral_black_dragon (neutral creep)
         - npc_dota_shadow_shaman_ward_2 (ward)
         """
-        result = combat_log_hero_deaths
-        assert result.combat_log is not None
-
-        hero_deaths = [e for e in result.combat_log.entries if e.is_target_hero]
         nonhero_attacker_deaths = [d for d in hero_deaths if not d.is_attacker_hero]
 
         # All non-hero attackers should have level 0
@@ -396,53 +316,42 @@ class TestHeroLevelInjection:
         # Should be exactly 3 non-hero attacker deaths
         assert len(nonhero_attacker_deaths) == 3
 
-    def test_hero_levels_are_realistic(self, combat_log_hero_deaths):
+    def test_hero_levels_are_realistic(self, all_entry_levels):
         """Test that hero levels are within valid Dota 2 range (1-30)."""
-        result = combat_log_hero_deaths
-        assert result.combat_log is not None
+        # Level 0 means "not a hero", so only populated levels are range-checked
+        for levels in all_entry_levels:
+            populated = [level for level in levels if level > 0]
+            assert 1 <= min(populated, default=1) and max(populated, default=1) <= 30
 
-        for entry in result.combat_log.entries:
-            if entry.target_hero_level > 0:
-                assert 1 <= entry.target_hero_level <= 30
-            if entry.attacker_hero_level > 0:
-                assert 1 <= entry.attacker_hero_level <= 30
-
-    def test_hero_levels_increase_over_game(self, combat_log_hero_deaths):
+    def test_hero_levels_increase_over_game(self, hero_death_levels):
         """Test that hero levels generally increase as game progresses.
 
         Sample early vs late deaths to verify levels grow over time.
         """
-        result = combat_log_hero_deaths
-        assert result.combat_log is not None
-
-        hero_deaths = [e for e in result.combat_log.entries if e.is_target_hero]
+        target_levels, _ = hero_death_levels
 
         # Get first and last few deaths with levels
-        early_deaths = [d for d in hero_deaths[:10] if d.target_hero_level > 0]
-        late_deaths = [d for d in hero_deaths[-10:] if d.target_hero_level > 0]
+        early_levels = [level for level in target_levels[:10] if level > 0]
+        late_levels = [level for level in target_levels[-10:] if level > 0]
 
-        early_avg = sum(d.target_hero_level for d in early_deaths) / len(early_deaths)
-        late_avg = sum(d.target_hero_level for d in late_deaths) / len(late_deaths)
+        early_avg = sum(early_levels) / len(early_levels)
+        late_avg = sum(late_levels) / len(late_levels)
 
         # Late game levels should be higher than early game
         assert late_avg > early_avg
 
-    def test_first_death_level_is_low(self, combat_log_hero_deaths):
+    def test_first_death_level_is_low(self, hero_deaths):
         """Test that the first hero death has a low level (early game).
 
         First death at 00:10 - should be level 1.
         """
-        result = combat_log_hero_deaths
-        assert result.combat_log is not None
-
-        hero_deaths = [e for e in result.combat_log.entries if e.is_target_hero]
         first_death = hero_deaths[0]
 
         # First death at 00:10 game time
         assert first_death.game_time < 60  # Within first minute
         assert first_death.target_hero_level == 1  # Level 1 at game start
 
-    def test_specific_death_levels_match_real_data(self, combat_log_hero_deaths):
+    def test_specific_death_levels_match_real_data(self, hero_deaths_by_minute):
         """Test specific death events match verified real data.
 
         Sample verified deaths from manual inspection:
@@ -450,15 +359,10 @@ class TestHeroLevelInjection:
         - [05:09] pugna (lvl 3) killed by bristleback (lvl 3)
         - [10:24] hoodwink (lvl 5) killed by faceless_void (lvl 7)
         """
-        result = combat_log_hero_deaths
-        assert result.combat_log is not None
-
-        hero_deaths = [e for e in result.combat_log.entries if e.is_target_hero]
-
         # Find death around 03:36 (216 seconds)
         hoodwink_death = next(
-            (d for d in hero_deaths
-             if "hoodwink" in d.target_name and 210 < d.game_time < 220),
+            (d for d in hero_deaths_by_minute.get(("hoodwink", 3), ())
+             if 210 < d.game_time < 220),
             None
         )
         assert hoodwink_death is not None
@@ -467,8 +371,8 @@ class TestHeroLevelInjection:
 
         # Find bristleback kill around 05:09 (309 seconds)
         pugna_death = next(
-            (d for d in hero_deaths
-             if "pugna" in d.target_name and 305 < d.game_time < 315),
+            (d for d in hero_deaths_by_minute.get(("pugna", 5), ())
+             if 305 < d.game_time < 315),
             None
         )
         assert pugna_death is not None
@@ -476,6 +380,8 @@ class TestHeroLevelInjection:
         assert pugna_death.attacker_hero_level == 3
 
 
+@pytest.mark.requires_demo
+@pytest.mark.usefixtures("prewarmed_feature_parses")
 class TestHeroInventory:
     """Test hero inventory extraction from entity state.
 
@@ -490,7 +396,7 @@ class TestHeroInventory:
     All values are exact from replay parsing.
     """
 
-    def test_troll_warlord_inventory_tick_30000(self, snapshot_30k):
+    def test_troll_warlord_inventory_tick_30000(self, snapshot_30k, heroes_by_name_30k, inventory_tuples_30k):
         """Test Troll Warlord exact inventory at tick 30000 (game_time=11.87s).
 
         Exact inventory: 6 items total.
@@ -498,31 +404,30 @@ class TestHeroInventory:
         snap = snapshot_30k
         assert snap.game_time == pytest.approx(11.866667, abs=0.01)
 
-        troll = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_troll_warlord")
+        troll = heroes_by_name_30k["npc_dota_hero_troll_warlord"]
         assert len(troll.inventory) == 6
 
         # Exact items with slot, name, charges
-        expected = [
+        expected = (
             (0, "item_tango", 3),
             (1, "item_magicstick", 1),
             (3, "item_ironwoodbranch", 0),
             (4, "item_ironwoodbranch", 0),
             (5, "item_quellingblade", 0),
             (15, "item_teleportscroll", 2),
-        ]
-        actual = [(i.slot, i.name, i.charges) for i in sorted(troll.inventory, key=lambda x: x.slot)]
+        )
+        actual = inventory_tuples_30k["npc_dota_hero_troll_warlord"]
         assert actual == expected
 
-    def test_chen_inventory_tick_30000(self, snapshot_30k):
+    def test_chen_inventory_tick_30000(self, heroes_by_name_30k, inventory_tuples_30k):
         """Test Chen exact inventory at tick 30000.
 
         Exact inventory: 7 items total.
         """
-        snap = snapshot_30k
-        chen = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_chen")
+        chen = heroes_by_name_30k["npc_dota_hero_chen"]
         assert len(chen.inventory) == 7
 
-        expected = [
+        expected = (
             (0, "item_tango", 3),
             (1, "item_circlet", 0),
             (2, "item_sentryward", 2),
@@ -530,20 +435,19 @@ class TestHeroInventory:
             (4, "item_faerie_fire", 1),
             (5, "item_blood_grenade", 1),
             (15, "item_teleportscroll", 1),
-        ]
-        actual = [(i.slot, i.name, i.charges) for i in sorted(chen.inventory, key=lambda x: x.slot)]
+        )
+        actual = inventory_tuples_30k["npc_dota_hero_chen"]
         assert actual == expected
 
-    def test_hoodwink_inventory_tick_30000(self, snapshot_30k):
+    def test_hoodwink_inventory_tick_30000(self, heroes_by_name_30k, inventory_tuples_30k):
         """Test Hoodwink exact inventory at tick 30000.
 
         Has backpack item in slot 6.
         """
-        snap = snapshot_30k
-        hoodwink = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_hoodwink")
+        hoodwink = heroes_by_name_30k["npc_dota_hero_hoodwink"]
         assert len(hoodwink.inventory) == 8
 
-        expected = [
+        expected = (
             (0, "item_tango", 3),
             (1, "item_sentryward", 1),
             (2, "item_faerie_fire", 1),
@@ -552,20 +456,19 @@ class TestHeroInventory:
             (5, "item_ironwoodbranch", 0),
             (6, "item_ironwoodbranch", 0),  # Backpack
             (15, "item_teleportscroll", 1),
-        ]
-        actual = [(i.slot, i.name, i.charges) for i in sorted(hoodwink.inventory, key=lambda x: x.slot)]
+        )
+        actual = inventory_tuples_30k["npc_dota_hero_hoodwink"]
         assert actual == expected
 
-    def test_shadow_shaman_inventory_tick_30000(self, snapshot_30k):
+    def test_shadow_shaman_inventory_tick_30000(self, heroes_by_name_30k, inventory_tuples_30k):
         """Test Shadow Shaman exact inventory at tick 30000.
 
         Has backpack item in slot 6.
         """
-        snap = snapshot_30k
-        shaman = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_shadow_shaman")
+        shaman = heroes_by_name_30k["npc_dota_hero_shadow_shaman"]
         assert len(shaman.inventory) == 7
 
-        expected = [
+        expected = (
             (0, "item_tango", 3),
             (2, "item_magicstick", 3),
             (3, "item_ironwoodbranch", 0),
@@ -573,11 +476,11 @@ class TestHeroInventory:
             (5, "item_faerie_fire", 1),
             (6, "item_sentryward", 1),  # Backpack
             (15, "item_teleportscroll", 1),
-        ]
-        actual = [(i.slot, i.name, i.charges) for i in sorted(shaman.inventory, key=lambda x: x.slot)]
+        )
+        actual = inventory_tuples_30k["npc_dota_hero_shadow_shaman"]
         assert actual == expected
 
-    def test_troll_warlord_inventory_tick_60000(self, snapshot_60k):
+    def test_troll_warlord_inventory_tick_60000(self, snapshot_60k, heroes_by_name_60k, inventory_tuples_60k):
         """Test Troll Warlord exact inventory at tick 60000 (game_time=1011.87s).
 
         Has neutral item, backpack item, and TP slot item.
@@ -585,10 +488,10 @@ class TestHeroInventory:
         snap = snapshot_60k
         assert snap.game_time == pytest.approx(1011.866667, abs=0.01)
 
-        troll = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_troll_warlord")
+        troll = heroes_by_name_60k["npc_dota_hero_troll_warlord"]
         assert len(troll.inventory) == 9
 
-        expected = [
+        expected = (
             (0, "item_circlet", 0),
             (1, "item_phaseboots", 0),
             (2, "item_magicstick", 5),
@@ -598,20 +501,19 @@ class TestHeroInventory:
             (6, "item_ironwoodbranch", 0),  # Backpack
             (9, "item_beltofstrength", 0),  # TP slot
             (16, "item_poormansshield", 0),  # Neutral
-        ]
-        actual = [(i.slot, i.name, i.charges) for i in sorted(troll.inventory, key=lambda x: x.slot)]
+        )
+        actual = inventory_tuples_60k["npc_dota_hero_troll_warlord"]
         assert actual == expected
 
-    def test_chen_inventory_tick_60000(self, snapshot_60k):
+    def test_chen_inventory_tick_60000(self, heroes_by_name_60k, inventory_tuples_60k):
         """Test Chen exact inventory at tick 60000.
 
         Magic wand with 20 charges.
         """
-        snap = snapshot_60k
-        chen = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_chen")
+        chen = heroes_by_name_60k["npc_dota_hero_chen"]
         assert len(chen.inventory) == 9
 
-        expected = [
+        expected = (
             (0, "item_sentryward", 1),
             (1, "item_circlet", 0),
             (2, "item_magicwand", 20),
@@ -621,20 +523,19 @@ class TestHeroInventory:
             (6, "item_windlace", 0),  # Backpack
             (15, "item_teleportscroll", 1),  # Stash
             (16, "item_dormant_curio", 0),  # Neutral
-        ]
-        actual = [(i.slot, i.name, i.charges) for i in sorted(chen.inventory, key=lambda x: x.slot)]
+        )
+        actual = inventory_tuples_60k["npc_dota_hero_chen"]
         assert actual == expected
 
-    def test_bristleback_inventory_tick_60000(self, snapshot_60k):
+    def test_bristleback_inventory_tick_60000(self, heroes_by_name_60k, inventory_tuples_60k):
         """Test Bristleback exact inventory at tick 60000.
 
         Full main inventory, backpack items, neutral item.
         """
-        snap = snapshot_60k
-        bristle = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_bristleback")
+        bristle = heroes_by_name_60k["npc_dota_hero_bristleback"]
         assert len(bristle.inventory) == 10
 
-        expected = [
+        expected = (
             (0, "item_powertreads", 0),
             (1, "item_magicwand", 20),
             (2, "item_blade_mail", 0),
@@ -645,20 +546,19 @@ class TestHeroInventory:
             (7, "item_recipe_lotus_orb", 0),  # Backpack
             (15, "item_teleportscroll", 1),  # Stash
             (16, "item_occult_bracelet", 0),  # Neutral
-        ]
-        actual = [(i.slot, i.name, i.charges) for i in sorted(bristle.inventory, key=lambda x: x.slot)]
+        )
+        actual = inventory_tuples_60k["npc_dota_hero_bristleback"]
         assert actual == expected
 
-    def test_hoodwink_inventory_tick_60000(self, snapshot_60k):
+    def test_hoodwink_inventory_tick_60000(self, heroes_by_name_60k, inventory_tuples_60k):
         """Test Hoodwink exact inventory at tick 60000.
 
         Full backpack (slots 6, 7, 8).
         """
-        snap = snapshot_60k
-        hoodwink = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_hoodwink")
+        hoodwink = heroes_by_name_60k["npc_dota_hero_hoodwink"]
         assert len(hoodwink.inventory) == 10
 
-        expected = [
+        expected = (
             (0, "item_arcane_boots", 0),
             (1, "item_ward_dispenser", 1),
             (2, "item_flask", 1),
@@ -669,243 +569,176 @@ class TestHeroInventory:
             (8, "item_ward_dispenser", 1),  # Backpack
             (15, "item_teleportscroll", 1),  # Stash
             (16, "item_kobold_cup", 0),  # Neutral
-        ]
-        actual = [(i.slot, i.name, i.charges) for i in sorted(hoodwink.inventory, key=lambda x: x.slot)]
+        )
+        actual = inventory_tuples_60k["npc_dota_hero_hoodwink"]
         assert actual == expected
 
-    def test_pugna_inventory_tick_60000(self, snapshot_60k):
+    def test_pugna_inventory_tick_60000(self, heroes_by_name_60k, inventory_tuples_60k):
         """Test Pugna exact inventory at tick 60000.
 
         No stash items, neutral item present.
         """
-        snap = snapshot_60k
-        pugna = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_pugna")
+        pugna = heroes_by_name_60k["npc_dota_hero_pugna"]
         assert len(pugna.inventory) == 5
 
-        expected = [
+        expected = (
             (2, "item_arcane_boots", 0),
             (3, "item_magicwand", 13),
             (4, "item_sentryward", 2),
             (5, "item_pavise", 0),
             (16, "item_dormant_curio", 0),  # Neutral
-        ]
-        actual = [(i.slot, i.name, i.charges) for i in sorted(pugna.inventory, key=lambda x: x.slot)]
+        )
+        actual = inventory_tuples_60k["npc_dota_hero_pugna"]
         assert actual == expected
 
-    def test_all_heroes_neutral_items_tick_60000(self, snapshot_60k):
+    def test_all_heroes_neutral_items_tick_60000(self, heroes_by_name_60k):
         """Test exact neutral items for all 10 heroes at tick 60000."""
-        snap = snapshot_60k
-
-        expected_neutrals = {
-            "npc_dota_hero_troll_warlord": "item_poormansshield",
-            "npc_dota_hero_chen": "item_dormant_curio",
-            "npc_dota_hero_monkey_king": "item_spark_of_courage",
-            "npc_dota_hero_hoodwink": "item_kobold_cup",
-            "npc_dota_hero_bristleback": "item_occult_bracelet",
-            "npc_dota_hero_lycan": "item_ripperslash",
-            "npc_dota_hero_pugna": "item_dormant_curio",
-            "npc_dota_hero_faceless_void": "item_ripperslash",
-            "npc_dota_hero_storm_spirit": "item_dormant_curio",
-            "npc_dota_hero_shadow_shaman": "item_kobold_cup",
-        }
-
-        for hero in snap.heroes:
-            expected = expected_neutrals[hero.hero_name]
-            assert hero.neutral_item is not None, f"{hero.hero_name} should have neutral item"
+        assert heroes_by_name_60k.keys() == EXPECTED_NEUTRALS_60K.keys()
+        for hero_name, expected in EXPECTED_NEUTRALS_60K.items():
+            hero = heroes_by_name_60k[hero_name]
+            assert hero.neutral_item is not None, f"{hero_name} should have neutral item"
             assert hero.neutral_item.name == expected, \
-                f"{hero.hero_name}: expected {expected}, got {hero.neutral_item.name}"
+                f"{hero_name}: expected {expected}, got {hero.neutral_item.name}"
 
-    def test_main_inventory_property(self, snapshot_60k):
+    def test_main_inventory_property(self, troll_60k):
         """Test main_inventory property returns only slots 0-5."""
-        snap = snapshot_60k
-        troll = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_troll_warlord")
-
-        main = troll.main_inventory
+        main = troll_60k.main_inventory
         assert len(main) == 6
         assert [i.slot for i in main] == [0, 1, 2, 3, 4, 5]
 
-    def test_backpack_property(self, snapshot_60k):
+    def test_backpack_property(self, heroes_by_name_60k):
         """Test backpack property returns only slots 6-8."""
-        snap = snapshot_60k
-        hoodwink = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_hoodwink")
+        hoodwink = heroes_by_name_60k["npc_dota_hero_hoodwink"]
 
         backpack = hoodwink.backpack
         assert len(backpack) == 3
         assert [i.slot for i in backpack] == [6, 7, 8]
 
-    def test_stash_property(self, snapshot_60k):
+    def test_stash_property(self, chen_60k):
         """Test stash property returns only slots 10-15."""
-        snap = snapshot_60k
-        chen = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_chen")
-
-        stash = chen.stash
+        stash = chen_60k.stash
         assert len(stash) == 1
         assert stash[0].slot == 15
         assert stash[0].name == "item_teleportscroll"
 
-    def test_neutral_item_property(self, snapshot_60k):
+    def test_neutral_item_property(self, troll_60k):
         """Test neutral_item property returns slot 16."""
-        snap = snapshot_60k
-        troll = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_troll_warlord")
-
-        neutral = troll.neutral_item
+        neutral = troll_60k.neutral_item
         assert neutral is not None
         assert neutral.slot == 16
         assert neutral.name == "item_poormansshield"
 
-    def test_tp_scroll_property(self, snapshot_60k):
+    def test_tp_scroll_property(self, troll_60k):
         """Test tp_scroll property returns slot 9."""
-        snap = snapshot_60k
-        troll = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_troll_warlord")
-
-        tp = troll.tp_scroll
+        tp = troll_60k.tp_scroll
         assert tp is not None
         assert tp.slot == 9
         assert tp.name == "item_beltofstrength"
 
-    def test_get_item_method(self, snapshot_60k):
+    def test_get_item_method(self, bristle_60k):
         """Test get_item returns correct item by partial name match."""
-        snap = snapshot_60k
-        bristle = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_bristleback")
-
-        treads = bristle.get_item("treads")
+        treads = bristle_60k.get_item("treads")
         assert treads is not None
         assert treads.name == "item_powertreads"
         assert treads.slot == 0
 
-        wand = bristle.get_item("magicwand")
+        wand = bristle_60k.get_item("magicwand")
         assert wand is not None
         assert wand.charges == 20
 
-        assert bristle.get_item("radiance") is None
+        assert bristle_60k.get_item("radiance") is None
 
-    def test_has_item_method(self, snapshot_60k):
+    def test_has_item_method(self, troll_60k):
         """Test has_item returns True/False correctly."""
-        snap = snapshot_60k
-        troll = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_troll_warlord")
-
-        assert troll.has_item("battlefury") is True
-        assert troll.has_item("phaseboots") is True
-        assert troll.has_item("radiance") is False
+        assert troll_60k.has_item("battlefury") is True
+        assert troll_60k.has_item("phaseboots") is True
+        assert troll_60k.has_item("radiance") is False
 
-    def test_item_short_name_property(self, snapshot_60k):
+    def test_item_short_name_property(self, troll_60k):
         """Test ItemSnapshot.short_name removes item_ prefix."""
-        snap = snapshot_60k
-        troll = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_troll_warlord")
-
-        bf = troll.get_item("battlefury")
+        bf = troll_60k.get_item("battlefury")
         assert bf.name == "item_battlefury"
         assert bf.short_name == "battlefury"
 
-    def test_item_slot_classification_properties(self, snapshot_60k):
+    def test_item_slot_classification_properties(self, troll_60k):
         """Test is_main_inventory, is_backpack, is_stash, is_neutral_slot properties."""
-        snap = snapshot_60k
-        troll = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_troll_warlord")
-
-        for item in troll.inventory:
-            if item.slot <= 5:
-                assert item.is_main_inventory is True
-                assert item.is_backpack is False
-            elif item.slot <= 8:
-                assert item.is_backpack is True
-                assert item.is_main_inventory is False
-            elif item.slot == 9:
-                assert item.is_tp_slot is True
-            elif item.slot <= 15:
-                assert item.is_stash is True
-            elif item.slot == 16:
-                assert item.is_neutral_slot is True
-
-    def test_neutral_item_enum_property(self, snapshot_60k):
-        """Test neutral_item_enum returns NeutralItem enum for neutral items."""
-        from python_manta import NeutralItem
+        inventory = troll_60k.inventory
+        slots = [item.slot for item in inventory]
 
-        snap = snapshot_60k
-        troll = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_troll_warlord")
+        # Compare each property as a whole column against its slot range
+        assert [i.is_main_inventory for i in inventory] == [s <= 5 for s in slots]
+        assert [i.is_backpack for i in inventory] == [6 <= s <= 8 for s in slots]
+        assert [i.is_tp_slot for i in inventory] == [s == 9 for s in slots]
+        assert [i.is_stash for i in inventory] == [10 <= s <= 15 for s in slots]
+        assert [i.is_neutral_slot for i in inventory] == [s == 16 for s in slots]
 
+    def test_neutral_item_enum_property(self, troll_60k):
+        """Test neutral_item_enum returns NeutralItem enum for neutral items."""
         # Troll has item_poormansshield in neutral slot (alias resolves to POOR_MANS_SHIELD)
-        neutral = troll.neutral_item
+        neutral = troll_60k.neutral_item
         assert neutral is not None
         assert neutral.name == "item_poormansshield"
         assert neutral.neutral_item_enum == NeutralItem.POOR_MANS_SHIELD
         assert neutral.is_neutral_item is True
 
         # Regular item should return None for neutral_item_enum
-        bf = troll.get_item("battlefury")
+        bf = troll_60k.get_item("battlefury")
         assert bf is not None
         assert bf.neutral_item_enum is None
         assert bf.is_neutral_item is False
 
-    def test_item_display_name_property(self, snapshot_60k):
+    def test_item_display_name_property(self, troll_60k, chen_60k):
         """Test display_name returns human-readable names."""
-        snap = snapshot_60k
 
         # Neutral item uses NeutralItem.display_name
-        troll = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_troll_warlord")
-        neutral = troll.neutral_item
+        neutral = troll_60k.neutral_item
         assert neutral.display_name == "Poor Man's Shield"
 
         # Regular item uses Item enum
-        bf = troll.get_item("battlefury")
+        bf = troll_60k.get_item("battlefury")
         assert bf.display_name == "Battle Fury"
 
         # Item with underscores
-        chen = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_chen")
-        janggo = chen.get_item("ancient_janggo")
+        janggo = chen_60k.get_item("ancient_janggo")
         assert janggo.display_name == "Drum of Endurance"
 
-    def test_item_enum_property(self, snapshot_60k):
+    def test_item_enum_property(self, troll_60k):
         """Test item_enum returns Item enum for purchasable items."""
-        from python_manta import Item
-
-        snap = snapshot_60k
-        troll = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_troll_warlord")
-
         # Battle Fury should return Item enum (alias resolves to BATTLE_FURY)
-        bf = troll.get_item("battlefury")
+        bf = troll_60k.get_item("battlefury")
         assert bf is not None
         assert bf.item_enum == Item.BATTLE_FURY
         assert bf.is_purchasable_item is True
 
         # Yasha should return Item enum
-        yasha = troll.get_item("yasha")
+        yasha = troll_60k.get_item("yasha")
         assert yasha is not None
         assert yasha.item_enum == Item.YASHA
         assert yasha.is_purchasable_item is True
 
-    def test_item_enum_display_name_uses_item_enum(self, snapshot_60k):
+    def test_item_enum_display_name_uses_item_enum(self, heroes_by_name_60k, troll_60k, chen_60k):
         """Test display_name uses Item enum for proper display names."""
-        from python_manta import Item
-
-        snap = snapshot_60k
 
         # Troll has battle fury
-        troll = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_troll_warlord")
-        bf = troll.get_item("battlefury")
+        bf = troll_60k.get_item("battlefury")
         assert bf.display_name == "Battle Fury"  # Uses Item enum
 
         # Chen has Drum of Endurance (item_ancient_janggo)
-        chen = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_chen")
-        janggo = chen.get_item("ancient_janggo")
+        janggo = chen_60k.get_item("ancient_janggo")
         assert janggo.display_name == "Drum of Endurance"  # Uses Item enum
 
         # Hoodwink has famango
-        hoodwink = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_hoodwink")
+        hoodwink = heroes_by_name_60k["npc_dota_hero_hoodwink"]
         mango = hoodwink.get_item("famango")
         assert mango is not None
         assert mango.display_name == "Enchanted Mango"  # Uses Item enum
 
-    def test_item_enum_category(self, snapshot_60k):
+    def test_item_enum_category(self, troll_60k):
         """Test Item enum category property."""
-        from python_manta import Item
-
-        snap = snapshot_60k
-        troll = next(h for h in snap.heroes if h.hero_name == "npc_dota_hero_troll_warlord")
-
-        bf = troll.get_item("battlefury")
+        bf = troll_60k.get_item("battlefury")
         assert bf.item_enum.category == "weapon"
 
-        yasha = troll.get_item("yasha")
+        yasha = troll_60k.get_item("yasha")
         assert yasha.item_enum.category == "magical"
 
 
@@ -914,8 +747,6 @@ class TestItemEnum:
 
     def test_from_item_name_blink(self):
         """Test Item.from_item_name for Blink Dagger."""
-        from python_manta import Item
-
         item = Item.from_item_name("item_blink")
         assert item == Item.BLINK_DAGGER
         assert item.display_name == "Blink Dagger"
@@ -923,8 +754,6 @@ class TestItemEnum:
 
     def test_from_item_name_bkb(self):
         """Test Item.from_item_name for Black King Bar."""
-        from python_manta import Item
-
         item = Item.from_item_name("item_black_king_bar")
         assert item == Item.BLACK_KING_BAR
         assert item.display_name == "Black King Bar"
@@ -932,8 +761,6 @@ class TestItemEnum:
 
     def test_from_item_name_tango(self):
         """Test Item.from_item_name for Tango."""
-        from python_manta import Item
-
         item = Item.from_item_name("item_tango")
         assert item == Item.TANGO
         assert item.display_name == "Tango"
@@ -941,8 +768,6 @@ class TestItemEnum:
 
     def test_from_item_name_famango(self):
         """Test Item.from_item_name for Famango alias resolves to ENCHANTED_MANGO."""
-        from python_manta import Item
-
         item = Item.from_item_name("item_famango")
         assert item == Item.ENCHANTED_MANGO
         assert item.display_name == "Enchanted Mango"
@@ -950,8 +775,6 @@ class TestItemEnum:
 
     def test_from_item_name_euls(self):
         """Test Item.from_item_name for Eul's Scepter."""
-        from python_manta import Item
-
         item = Item.from_item_name("item_cyclone")
         assert item == Item.EULS_SCEPTER
         assert item.display_name == "Eul's Scepter of Divinity"
@@ -959,8 +782,6 @@ class TestItemEnum:
 
     def test_from_item_name_drum(self):
         """Test Item.from_item_name for Drum of Endurance."""
-        from python_manta import Item
-
         item = Item.from_item_name("item_ancient_janggo")
         assert item == Item.DRUM_OF_ENDURANCE
         assert item.display_name == "Drum of Endurance"
@@ -968,15 +789,11 @@ class TestItemEnum:
 
     def test_from_item_name_unknown(self):
         """Test Item.from_item_name returns None for unknown items."""
-        from python_manta import Item
-
         item = Item.from_item_name("item_unknown_item_xyz")
         assert item is None
 
     def test_is_purchasable_item(self):
         """Test Item.is_purchasable_item classmethod."""
-        from python_manta import Item
-
         assert Item.is_purchasable_item("item_blink") is True
         assert Item.is_purchasable_item("item_tango") is True
         assert Item.is_purchasable_item("item_battlefury") is True  # Alt name
@@ -985,8 +802,6 @@ class TestItemEnum:
 
     def test_items_by_category_consumable(self):
         """Test Item.items_by_category for consumables."""
-        from python_manta import Item
-
         consumables = Item.items_by_category("consumable")
         assert len(consumables) > 0
         assert Item.TANGO in consumables
@@ -996,8 +811,6 @@ class TestItemEnum:
 
     def test_items_by_category_weapon(self):
         """Test Item.items_by_category for weapons."""
-        from python_manta import Item
-
         weapons = Item.items_by_category("weapon")
         assert len(weapons) > 0
         assert Item.BATTLE_FURY in weapons
@@ -1007,8 +820,6 @@ class TestItemEnum:
 
     def test_all_item_names(self):
         """Test Item.all_item_names returns all item names."""
-        from python_manta import Item
-
         names = Item.all_item_names()
         assert len(names) > 100  # Should have many items
         assert "item_blink" in names
@@ -1021,8 +832,6 @@ class TestItemCategory:
 
     def test_item_category_values(self):
         """Test ItemCategory enum has expected values."""
-        from python_manta import ItemCategory
-
         assert ItemCategory.CONSUMABLE.value == "consumable"
         assert ItemCategory.WEAPON.value == "weapon"
         assert ItemCategory.ARMOR.value == "armor"
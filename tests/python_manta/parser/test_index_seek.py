@@ -1,15 +1,27 @@
 """
 Test Parser index/seek functionality for random access.
-Tests build_index, snapshot, parse_range, and find_keyframe methods.
+Tests build_index, snapshot, parse_range, iter_combat_log, and find_keyframe methods.
 Uses v2 Parser API exclusively.
 
 Note: Fixtures from conftest.py provide cached parsed results to avoid
 redundant parsing and improve test performance significantly.
 """
 
+from itertools import chain
+from operator import attrgetter
+
 import pytest
 
-pytestmark = pytest.mark.unit
+# Every class here reads the batched hero_snapshots/demo_indexes fixtures, so
+# keep them on one xdist worker instead of rebuilding the batch on each
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.requires_demo,
+    pytest.mark.xdist_group("hero_snapshots"),
+]
+
+VALID_TALENT_TIERS = frozenset({10, 15, 20, 25})
+VALID_TALENT_SIDES = frozenset({"left", "right"})
 
 
 class TestIndexSeekFunctionality:
@@ -27,10 +39,10 @@ class TestIndexSeekFunctionality:
     def test_build_index_keyframes_have_valid_ticks(self, demo_index):
         """Test keyframes have increasing tick values."""
         assert len(demo_index.keyframes) > 0
-        # Keyframes should be in increasing tick order
+        # Keyframes should be in increasing tick order (one pass, no sorted copy)
         ticks = [kf.tick for kf in demo_index.keyframes]
-        assert ticks == sorted(ticks)
-        assert all(t >= 0 for t in ticks)
+        assert all(prev <= curr for prev, curr in zip(ticks, ticks[1:]))
+        assert ticks[0] >= 0
 
     def test_build_index_keyframes_have_game_time(self, demo_index):
         """Test keyframes have valid game_time values after game starts."""
@@ -88,6 +100,20 @@ class TestIndexSeekFunctionality:
         # Game time should be reasonable (less than an hour for early tick)
         assert snapshot_30k.game_time < 3600.0
 
+    def test_snapshots_match_single_snapshots(
+        self, hero_snapshots, single_walk_snapshots
+    ):
+        """Test batched snapshots() matches snapshot() and keeps request order."""
+        for tick, single in single_walk_snapshots.items():
+            batched = hero_snapshots[tick]
+            assert batched.tick == single.tick
+            assert batched.game_time == single.game_time
+            assert batched.heroes == single.heroes
+
+    def test_snapshots_empty_request(self, uncached_parser):
+        """Test snapshots() with no ticks returns an empty list."""
+        assert uncached_parser.snapshots([]) == []
+
     def test_find_keyframe_returns_closest_keyframe(self, parser, demo_index):
         """Test find_keyframe returns the keyframe at or before target tick."""
         result = parser.find_keyframe(demo_index, target_tick=5000)
@@ -96,6 +122,15 @@ class TestIndexSeekFunctionality:
         assert result.keyframe is not None
         assert result.keyframe.tick <= 5000
 
+    def test_find_keyframe_before_first_keyframe(self, parser, demo_index):
+        """Test find_keyframe falls back to the first keyframe for early targets."""
+        first = demo_index.keyframes[0]
+        result = parser.find_keyframe(demo_index, target_tick=first.tick - 1)
+
+        assert result.success is True
+        assert result.keyframe.tick == first.tick
+        assert result.exact is False
+
     def test_find_keyframe_exact_match(self, parser, demo_index):
         """Test find_keyframe identifies exact matches."""
         # Use the tick of the first keyframe as target
@@ -122,49 +157,65 @@ class TestIndexSeekFunctionality:
                 assert entry["tick"] >= 25000
                 assert entry["tick"] <= 35000
 
-    def test_parse_range_resolves_combat_log_names(self, parser):
-        """Test parse_range resolves combat log string indices to names."""
+    def test_iter_combat_log_resolves_names(self, parser):
+        """Test iter_combat_log resolves combat log string indices to names."""
+        # Only the first entry is checked, so stop streaming after it
+        sample = next(iter(parser.iter_combat_log(start_tick=25000, end_tick=35000)), None)
+        assert sample is not None, "No combat log entries between ticks 25000 and 35000"
+
+        # Names should be strings, not numeric indices
+        target_name = sample.get("target_name", "")
+        # Should be a real name or "unknown_X" format, not just a number
+        assert not target_name.isdigit()
+
+    def test_iter_combat_log_matches_parse_range(self, parser):
+        """Test iter_combat_log streams the same entries as parse_range."""
         result = parser.parse_range(
             start_tick=25000,
             end_tick=35000,
             combat_log=True,
         )
 
-        assert result.success is True
-        if result.combat_log and len(result.combat_log) > 0:
-            # Names should be strings, not numeric indices
-            sample = result.combat_log[0]
-            target_name = sample.get("target_name", "")
-            # Should be a real name or "unknown_X" format, not just a number
-            assert not target_name.isdigit()
+        assert list(parser.iter_combat_log(start_tick=25000, end_tick=35000)) == result.combat_log
 
 
 class TestIndexSeekEdgeCases:
     """Test edge cases for index/seek functionality."""
 
-    def test_snapshot_early_tick_returns_success(self, parser):
+    def test_snapshot_early_tick_returns_success(self, snapshot_pregame):
         """Test snapshot at early tick before game start."""
-        snapshot = parser.snapshot(target_tick=100)
+        snapshot = snapshot_pregame
 
         assert snapshot.success is True
         # May have fewer heroes before picking phase
         assert snapshot.tick >= 100
 
-    def test_snapshot_very_late_tick_returns_success(self, parser):
+    def test_snapshot_very_late_tick_returns_success(self, snapshot_past_end):
         """Test snapshot at very late tick."""
-        snapshot = parser.snapshot(target_tick=100000)
+        snapshot = snapshot_past_end
 
         assert snapshot.success is True
         # Should return last available state
         assert len(snapshot.heroes) <= 10
 
-    def test_build_index_with_small_interval(self, parser):
+    def test_build_index_with_small_interval(self, demo_indexes):
         """Test build_index with small interval creates more keyframes."""
-        index_small = parser.build_index(interval_ticks=900)  # 30 seconds
-        index_large = parser.build_index(interval_ticks=3600)  # 2 minutes
+        index_small = demo_indexes[900]  # 30 seconds
+        index_large = demo_indexes[3600]  # 2 minutes
 
         assert len(index_small.keyframes) > len(index_large.keyframes)
 
+    def test_build_indexes_match_build_index(
+        self, demo_indexes, single_walk_index_3600
+    ):
+        """Test batched build_indexes() matches a separate build_index() call."""
+        single = single_walk_index_3600
+        batched = demo_indexes[3600]
+
+        assert batched.keyframes == single.keyframes
+        assert batched.game_started == single.game_started
+        assert batched.total_ticks == single.total_ticks
+
     def test_parse_range_empty_range(self, parser):
         """Test parse_range with range that has no events."""
         result = parser.parse_range(
@@ -198,13 +249,9 @@ class TestIncludeIllusions:
     def test_snapshot_illusions_have_flags_set(self, snapshot_with_illusions):
         """Test snapshot with illusions has is_clone or is_illusion flags."""
         # Count by type
-        real_heroes = [h for h in snapshot_with_illusions.heroes if not h.is_illusion and not h.is_clone]
-        illusions = [h for h in snapshot_with_illusions.heroes if h.is_illusion]
-        clones = [h for h in snapshot_with_illusions.heroes if h.is_clone]
-
-        assert len(real_heroes) == 10
+        assert len(snapshot_with_illusions.real_heroes) == 10
         # Should have some illusions or clones (or both)
-        assert len(illusions) + len(clones) > 0
+        assert len(snapshot_with_illusions.illusions) + len(snapshot_with_illusions.clones) > 0
 
     def test_snapshot_default_is_exclude_illusions(self, snapshot_30k, parser):
         """Test snapshot default behavior excludes illusions."""
@@ -215,6 +262,23 @@ class TestIncludeIllusions:
         assert len(snapshot_30k.heroes) == len(snap_explicit.heroes) == 10
 
 
+class TestSnapshotOptions:
+    """Test include_abilities/include_inventory snapshot switches."""
+
+    def test_snapshot_without_abilities_or_inventory(self, parser, snapshot_30k):
+        """Test disabled extractors leave lists empty and other hero state intact."""
+        light = parser.snapshot(target_tick=30000, include_abilities=False, include_inventory=False)
+
+        def hero_state(snapshot):
+            return [(h.hero_name, h.x, h.y, h.level, h.health) for h in snapshot.heroes]
+
+        assert hero_state(light) == hero_state(snapshot_30k)
+        for hero in light.heroes:
+            assert hero.abilities == []
+            assert hero.talents == []
+            assert hero.inventory == []
+
+
 class TestHeroAbilities:
     """Test hero ability tracking in snapshots.
 
@@ -228,38 +292,36 @@ class TestHeroAbilities:
             # Every hero should have some abilities
             assert len(hero.abilities) > 0
 
-    def test_snapshot_abilities_have_valid_levels(self, snapshot_60k):
+    def test_snapshot_abilities_have_valid_levels(self, abilities_60k):
         """Test ability levels are within valid range.
 
         Note: Most abilities max at 4 (regular) or 3 (ultimate), but some abilities
         like Chen's Holy Persuasion can have more levels with Aghanim's upgrades.
         """
-        for hero in snapshot_60k.heroes:
-            for ability in hero.abilities:
-                # All abilities should have non-negative levels
-                assert ability.level >= 0
-                # Max level is typically 7 (some upgraded abilities)
-                assert ability.level <= 7
+        levels = [a.level for a in abilities_60k]
+        # All abilities should have non-negative levels
+        assert min(levels) >= 0
+        # Max level is typically 7 (some upgraded abilities)
+        assert max(levels) <= 7
 
-    def test_snapshot_abilities_have_valid_names(self, snapshot_60k):
+    def test_snapshot_abilities_have_valid_names(self, abilities_60k):
         """Test ability names are properly formatted class names."""
-        for hero in snapshot_60k.heroes:
-            for ability in hero.abilities:
-                # All abilities should have CDOTA_Ability prefix
-                assert ability.name.startswith("CDOTA_Ability_")
-                # short_name property should strip the prefix
-                assert not ability.short_name.startswith("CDOTA_Ability_")
-
-    def test_snapshot_abilities_have_cooldown_data(self, snapshot_60k):
+        # Heroes share few distinct names, so check each one once
+        names = {a.name for a in abilities_60k}
+        short_names = {a.short_name for a in abilities_60k}
+        # All abilities should have CDOTA_Ability prefix
+        assert [n for n in names if not n.startswith("CDOTA_Ability_")] == []
+        # short_name property should strip the prefix
+        assert [n for n in short_names if n.startswith("CDOTA_Ability_")] == []
+
+    def test_snapshot_abilities_have_cooldown_data(self, abilities_60k):
         """Test abilities have cooldown and max_cooldown fields."""
-        for hero in snapshot_60k.heroes:
-            for ability in hero.abilities:
-                # Cooldown should be non-negative
-                assert ability.cooldown >= 0.0
-                assert ability.max_cooldown >= 0.0
-                # If on cooldown, current should be <= max
-                if ability.cooldown > 0:
-                    assert ability.cooldown <= ability.max_cooldown + 0.1  # Small tolerance
+        # Cooldowns are non-negative, and current <= max (small tolerance)
+        invalid = [
+            (a.name, a.cooldown, a.max_cooldown) for a in abilities_60k
+            if a.cooldown < 0.0 or a.max_cooldown < 0.0 or a.cooldown > a.max_cooldown + 0.1
+        ]
+        assert not invalid, f"Invalid cooldowns: {invalid[:3]}"
 
     def test_snapshot_abilities_slot_ordering(self, snapshot_60k):
         """Test abilities have sequential slot indices."""
@@ -267,9 +329,9 @@ class TestHeroAbilities:
             if hero.abilities:
                 # Slots should be in increasing order
                 slots = [a.slot for a in hero.abilities]
-                assert slots == sorted(slots)
-                # Slots should be non-negative
-                assert all(s >= 0 for s in slots)
+                assert all(prev <= curr for prev, curr in zip(slots, slots[1:]))
+                # Slots should be non-negative (the first is the smallest)
+                assert slots[0] >= 0
 
     def test_snapshot_ability_is_maxed_property(self, snapshot_90k):
         """Test is_maxed property correctly identifies max level abilities."""
@@ -337,21 +399,17 @@ class TestHeroTalents:
 
     def test_snapshot_talents_have_valid_tiers(self, snapshot_90k):
         """Test talent tiers are one of 10, 15, 20, or 25."""
-        valid_tiers = {10, 15, 20, 25}
-        for hero in snapshot_90k.heroes:
-            for talent in hero.talents:
-                assert talent.tier in valid_tiers
+        talents = chain.from_iterable(h.talents for h in snapshot_90k.heroes)
+        tiers = set(map(attrgetter("tier"), talents))
+        assert tiers <= VALID_TALENT_TIERS, f"Invalid tiers: {tiers - VALID_TALENT_TIERS}"
 
     def test_snapshot_talents_have_side_property(self, snapshot_90k):
         """Test talent side property returns 'left' or 'right'."""
-        for hero in snapshot_90k.heroes:
-            for talent in hero.talents:
-                assert talent.side in ["left", "right"]
-                # is_left should match side
-                if talent.is_left:
-                    assert talent.side == "left"
-                else:
-                    assert talent.side == "right"
+        talents = tuple(chain.from_iterable(h.talents for h in snapshot_90k.heroes))
+        sides = [t.side for t in talents]
+        assert set(sides) <= VALID_TALENT_SIDES
+        # is_left should match side
+        assert sides == ["left" if t.is_left else "right" for t in talents]
 
     def test_snapshot_talents_one_per_tier(self, snapshot_90k):
         """Test heroes have at most one talent per tier."""
@@ -380,18 +438,18 @@ class TestHeroTalents:
 
     def test_snapshot_talents_increase_over_time(self, snapshot_30k, snapshot_90k):
         """Test heroes gain more talents as game progresses."""
-        early_talents = sum(h.talents_chosen for h in snapshot_30k.heroes)
-        late_talents = sum(h.talents_chosen for h in snapshot_90k.heroes)
+        talents_chosen = attrgetter("talents_chosen")
+        early_talents = sum(map(talents_chosen, snapshot_30k.heroes))
+        late_talents = sum(map(talents_chosen, snapshot_90k.heroes))
 
         # Later snapshot should have more total talents
         assert late_talents >= early_talents
 
     def test_snapshot_talent_names_are_special_bonus(self, snapshot_90k):
         """Test talent names contain 'Special_Bonus'."""
-        for hero in snapshot_90k.heroes:
-            for talent in hero.talents:
-                # Talent names should contain Special_Bonus
-                assert "Special_Bonus" in talent.name
+        names = {t.name for t in chain.from_iterable(h.talents for h in snapshot_90k.heroes)}
+        # Talent names should contain Special_Bonus
+        assert [n for n in names if "Special_Bonus" not in n] == []
 
 
 class TestAbilityProgression:
@@ -400,16 +458,15 @@ class TestAbilityProgression:
     Uses snapshot fixtures from conftest.py.
     """
 
-    def test_ability_levels_increase_over_time(self, parser):
+    def test_ability_levels_increase_over_time(self, snapshot_20k, snapshot_80k):
         """Test total ability levels increase as game progresses."""
-        early_snapshot = parser.snapshot(target_tick=20000)
-        late_snapshot = parser.snapshot(target_tick=80000)
+        early_snapshot = snapshot_20k
+        late_snapshot = snapshot_80k
 
         def total_ability_levels(snapshot):
-            return sum(
-                sum(a.level for a in h.abilities)
-                for h in snapshot.heroes
-            )
+            # One flat reduction over every hero's abilities
+            abilities = chain.from_iterable(h.abilities for h in snapshot.heroes)
+            return sum(map(attrgetter("level"), abilities))
 
         early_total = total_ability_levels(early_snapshot)
         late_total = total_ability_levels(late_snapshot)
@@ -419,10 +476,11 @@ class TestAbilityProgression:
 
     def test_heroes_gain_abilities_with_level(self, snapshot_60k):
         """Test heroes at higher levels have more ability levels allocated."""
+        ability_level = attrgetter("level")
         for hero in snapshot_60k.heroes:
             if hero.level >= 6:
                 # Heroes at level 6+ should have at least 6 ability levels allocated
-                total_levels = sum(a.level for a in hero.abilities)
+                total_levels = sum(map(ability_level, hero.abilities))
                 # Account for unspent points
                 expected_min = hero.level - hero.ability_points - 1  # Some slack
                 assert total_levels >= expected_min
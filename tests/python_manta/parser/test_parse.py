@@ -9,9 +9,21 @@ redundant parsing and improve test performance significantly.
 
 import pytest
 
-pytestmark = pytest.mark.unit
+pytestmark = [pytest.mark.unit, pytest.mark.requires_demo]
+from caching_parser import Parser
 from python_manta import ParseResult, HeaderInfo, GameInfo, Hero
 
+# Exact game_info scalar fields of the primary demo (TI: Team Spirit vs Tundra)
+EXPECTED_GAME_INFO_FIELDS = {
+    "match_id": 8447659831,
+    "game_mode": 2,  # Captains Mode
+    "game_winner": 2,  # Radiant (Team Spirit) won
+    "radiant_team_id": 7119388,  # Team Spirit
+    "radiant_team_tag": "TSpirit",
+    "dire_team_id": 8291895,  # Tundra Esports
+    "dire_team_tag": "Tundra",
+}
+
 
 class TestParserBasicFunctionality:
     """Test basic Parser functionality using cached fixtures."""
@@ -29,7 +41,7 @@ class TestParserBasicFunctionality:
         assert result.header.map_name == "start"
         assert result.header.build_num == 10512
 
-    def test_parse_game_info_only(self, game_info_result):
+    def test_parse_game_info_only(self, game_info_result, draft_picks):
         """Test parsing game_info only returns correct real values."""
         result = game_info_result
 
@@ -37,8 +49,7 @@ class TestParserBasicFunctionality:
         assert result.game_info is not None
         assert len(result.game_info.picks_bans) == 24
         # Check actual pick values
-        radiant_picks = [e.hero_id for e in result.game_info.picks_bans if e.is_pick and e.team == 2]
-        assert radiant_picks == [99, 123, 66, 114, 95]
+        assert draft_picks[2] == (99, 123, 66, 114, 95)
 
     def test_parse_multiple_collectors(self, header_and_game_info_result):
         """Test parsing multiple collectors in single pass returns all data."""
@@ -103,36 +114,18 @@ class TestParserGameInfoFields:
     Uses game_info_result fixture from conftest.py to avoid redundant parsing.
     """
 
-    def test_game_info_match_id(self, game_info_result):
-        """Test match_id is correct for known demo file."""
-        assert game_info_result.game_info.match_id == 8447659831
-
-    def test_game_info_game_mode(self, game_info_result):
-        """Test game_mode is correct (2 = Captains Mode)."""
-        assert game_info_result.game_info.game_mode == 2
-
-    def test_game_info_radiant_team(self, game_info_result):
-        """Test Radiant team info is parsed correctly."""
+    def test_game_info_fields(self, game_info_result):
+        """Test match, mode, winner and team fields are correct for known demo file."""
         game_info = game_info_result.game_info
-        assert game_info.radiant_team_id == 7119388  # Team Spirit
-        assert game_info.radiant_team_tag == "TSpirit"
-
-    def test_game_info_dire_team(self, game_info_result):
-        """Test Dire team info is parsed correctly."""
-        game_info = game_info_result.game_info
-        assert game_info.dire_team_id == 8291895  # Tundra Esports
-        assert game_info.dire_team_tag == "Tundra"
+        # One dict comparison; pytest's diff names every mismatched field
+        actual = {field: getattr(game_info, field) for field in EXPECTED_GAME_INFO_FIELDS}
+        assert actual == EXPECTED_GAME_INFO_FIELDS
 
     def test_game_info_league_info(self, game_info_result):
         """Test league info field exists."""
         # league_id may be 0 for some replays
         assert game_info_result.game_info.league_id >= 0
 
-    def test_game_info_winner(self, game_info_result):
-        """Test winner is correctly identified."""
-        # This match was won by Radiant (Team Spirit)
-        assert game_info_result.game_info.game_winner == 2
-
     def test_game_info_is_pro_match(self, game_info_result):
         """Test is_pro_match returns True for TI match."""
         assert game_info_result.game_info.is_pro_match() is True
@@ -154,25 +147,17 @@ class TestParserGameInfoFields:
         """Test draft has 24 events (10 bans + 10 picks + 4 bans)."""
         assert len(game_info_result.game_info.picks_bans) == 24
 
-    def test_game_info_radiant_picks(self, game_info_result):
+    def test_game_info_radiant_picks(self, draft_picks):
         """Test Radiant picked heroes are correct."""
-        radiant_picks = [
-            e.hero_id for e in game_info_result.game_info.picks_bans
-            if e.is_pick and e.team == 2
-        ]
         # Troll Warlord=95, Chen=66, MK=114, Hoodwink=123, BB=99
-        expected_picks = [99, 123, 66, 114, 95]
-        assert radiant_picks == expected_picks
+        expected_picks = (99, 123, 66, 114, 95)
+        assert draft_picks[2] == expected_picks
 
-    def test_game_info_dire_picks(self, game_info_result):
+    def test_game_info_dire_picks(self, draft_picks):
         """Test Dire picked heroes are correct."""
-        dire_picks = [
-            e.hero_id for e in game_info_result.game_info.picks_bans
-            if e.is_pick and e.team == 3
-        ]
         # Lycan=77, Pugna=45, Shadow Demon=27, Storm Spirit=17, FV=41
-        expected_picks = [77, 45, 27, 17, 41]
-        assert dire_picks == expected_picks
+        expected_picks = (77, 45, 27, 17, 41)
+        assert draft_picks[3] == expected_picks
 
     def test_game_info_hero_enum_lookup(self, game_info_result):
         """Test Hero enum lookup works with draft data."""
@@ -296,3 +281,8 @@ class TestParserMultipleInstances:
         assert result2.success is True
         # Same data
         assert result1.header.map_name == result2.header.map_name
+
+    def test_parsers_share_loaded_library(self, parser):
+        """Test parsers for different files reuse one loaded shared library."""
+        other = Parser("/nonexistent/file.dem")
+        assert other._lib is parser._lib
@@ -11,13 +11,24 @@ Cache location priority:
 
 import os
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass
+from types import MappingProxyType
 
 
 # GCS bucket URL
 GCS_BUCKET_URL = "https://storage.googleapis.com/dota-replays"
 
+# Candidate cache locations, resolved once at import
+_TESTS_DIR = Path(__file__).parent
+_SHARED_CACHE = _TESTS_DIR.parent.parent / ".data" / "replays"
+_LOCAL_CACHE = _TESTS_DIR.parent / "replays"
+
+# Ranged downloads: bytes per Range request and concurrent connections
+DOWNLOAD_CHUNK_SIZE = 8 << 20
+DOWNLOAD_WORKERS = 8
+
 
 def _get_cache_dir() -> Path:
     """Get cache directory, checking multiple locations."""
@@ -26,35 +37,35 @@ def _get_cache_dir() -> Path:
         return Path(env_cache)
 
     # 2. Shared project cache (equilibrium_coach/.data/replays/)
-    shared_cache = Path(__file__).parent.parent.parent / ".data" / "replays"
-    if shared_cache.exists():
-        return shared_cache
+    if _SHARED_CACHE.exists():
+        return _SHARED_CACHE
 
     # 3. User cache directory
     user_cache = Path.home() / ".cache" / "dota-replays"
     if user_cache.exists():
         return user_cache
 
-    # 4. Create shared cache if parent exists
-    if shared_cache.parent.exists():
-        shared_cache.mkdir(parents=True, exist_ok=True)
-        return shared_cache
+    # 4. Create shared cache if parent exists (mkdir fails if it doesn't,
+    # which saves a separate stat of the parent)
+    try:
+        _SHARED_CACHE.mkdir(exist_ok=True)
+        return _SHARED_CACHE
+    except FileNotFoundError:
+        pass
 
     # 5. Fallback to local replays/ directory
-    local_cache = Path(__file__).parent.parent / "replays"
-    local_cache.mkdir(parents=True, exist_ok=True)
-    return local_cache
+    _LOCAL_CACHE.mkdir(parents=True, exist_ok=True)
+    return _LOCAL_CACHE
 
 
-# Lazy-loaded cache directory
-_cache_dir = None
-
+@lru_cache(maxsize=1)
 def get_cache_dir() -> Path:
-    """Get the replay cache directory (cached)."""
-    global _cache_dir
-    if _cache_dir is None:
-        _cache_dir = _get_cache_dir()
-    return _cache_dir
+    """Get the replay cache directory (cached; reset with get_cache_dir.cache_clear())."""
+    return _get_cache_dir()
+
+
+class ChecksumMismatch(IOError):
+    """A downloaded replay did not match its expected SHA-256."""
 
 
 @dataclass
@@ -67,10 +78,12 @@ class TestReplay:
     radiant_team_id: int = 0
     dire_team_id: int = 0
     game_winner: int = 0  # 2=Radiant, 3=Dire
+    # Hex SHA-256 of the .dem file; downloads are verified when set
+    sha256: str = ""
 
 
-# Test replays hosted on GCS
-TEST_REPLAYS = {
+# Test replays hosted on GCS (read-only view, shared by all tests)
+TEST_REPLAYS = MappingProxyType({
     8447659831: TestReplay(
         match_id=8447659831,
         description="Team Spirit vs Tundra - TI match",
@@ -85,7 +98,7 @@ TEST_REPLAYS = {
         game_build=10512,
         game_winner=2,
     ),
-}
+})
 
 # Default test replay (primary)
 PRIMARY_MATCH_ID = 8447659831
@@ -117,15 +130,40 @@ def ensure_replay(match_id: int) -> Path:
     url = get_replay_url(match_id)
     print(f"Downloading replay {match_id} from {url}...")
 
-    _download_file(url, path)
+    replay = TEST_REPLAYS.get(match_id)
+    sha256 = replay.sha256 if replay else ""
+    try:
+        _download_file(url, path, sha256=sha256)
+    except ChecksumMismatch:
+        # A corrupt transfer is worth one retry; a second mismatch propagates
+        print(f"Checksum mismatch for replay {match_id}, downloading again...")
+        _download_file(url, path, sha256=sha256)
 
     print(f"Downloaded replay {match_id} to {path}")
     return path
 
 
-def _download_file(url: str, dest: Path) -> None:
-    """Download file from URL to destination path."""
-    import urllib.request
+def ensure_replays(match_ids) -> list:
+    """Ensure several replays are downloaded, returning their local paths.
+
+    Missing replays are downloaded concurrently rather than one after another.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    match_ids = list(match_ids)
+    if not match_ids:
+        return []
+    with ThreadPoolExecutor(max_workers=len(match_ids)) as pool:
+        return list(pool.map(ensure_replay, match_ids))
+
+
+def _download_file(url: str, dest: Path, sha256: str = "") -> None:
+    """Download file from URL to destination path.
+
+    Large files are fetched as concurrent HTTP Range requests, falling back
+    to a single stream when the server does not support ranges. If sha256
+    is given, a download that does not match it is discarded.
+    """
     import shutil
 
     # Download to temp file first, then move (atomic)
@@ -133,9 +171,17 @@ def _download_file(url: str, dest: Path) -> None:
         tmp_path = Path(tmp.name)
 
     try:
-        with urllib.request.urlopen(url) as response:
-            with open(tmp_path, 'wb') as out_file:
-                shutil.copyfileobj(response, out_file)
+        size = _content_length(url)
+        ranged = (
+            hasattr(os, "pwrite")
+            and size > DOWNLOAD_CHUNK_SIZE
+            and _download_ranges(url, tmp_path, size)
+        )
+        if not ranged:
+            _download_stream(url, tmp_path)
+
+        if sha256 and _file_sha256(tmp_path) != sha256.lower():
+            raise ChecksumMismatch(f"Checksum mismatch downloading {url}")
 
         # Move to final destination
         shutil.move(str(tmp_path), str(dest))
@@ -145,6 +191,87 @@ def _download_file(url: str, dest: Path) -> None:
         raise
 
 
+def _file_sha256(path: Path) -> str:
+    """Hex SHA-256 digest of a file."""
+    import hashlib
+
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def _content_length(url: str) -> int:
+    """Size of the object at url from a HEAD request (0 if unknown).
+
+    A failed HEAD (e.g. a server that rejects the method) also counts as
+    unknown, so the caller falls back to a single streamed download.
+    """
+    import urllib.error
+    import urllib.request
+
+    request = urllib.request.Request(url, method="HEAD")
+    try:
+        with urllib.request.urlopen(request) as response:
+            return int(response.headers.get("Content-Length") or 0)
+    except urllib.error.URLError:  # HTTPError is a subclass
+        return 0
+
+
+def _download_stream(url: str, dest: Path) -> None:
+    """Download url to dest over a single connection."""
+    import urllib.request
+
+    # Read straight into one reusable buffer instead of allocating per chunk
+    buf = bytearray(1 << 20)
+    view = memoryview(buf)
+    with urllib.request.urlopen(url) as response:
+        with open(dest, 'wb') as out_file:
+            while True:
+                n = response.readinto(buf)
+                if not n:
+                    break
+                out_file.write(view[:n])
+
+
+def _download_ranges(url: str, dest: Path, size: int) -> bool:
+    """Download url to dest as DOWNLOAD_WORKERS concurrent Range requests.
+
+    Each chunk is written at its own offset of the pre-sized file. Returns
+    False if the server ignores Range headers (checked on the first chunk).
+    """
+    import urllib.request
+    from concurrent.futures import ThreadPoolExecutor
+
+    def fetch(start: int) -> bool:
+        end = min(start + DOWNLOAD_CHUNK_SIZE, size) - 1
+        request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+        with urllib.request.urlopen(request) as response:
+            if response.status != 206:
+                return False
+            data = response.read()
+        if len(data) != end - start + 1:
+            raise IOError(f"Short read for bytes {start}-{end} of {url}")
+        os.pwrite(fd, data, start)
+        return True
+
+    fd = os.open(dest, os.O_WRONLY)
+    try:
+        os.ftruncate(fd, size)
+        if not fetch(0):
+            return False
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+            for ok in pool.map(fetch, range(DOWNLOAD_CHUNK_SIZE, size, DOWNLOAD_CHUNK_SIZE)):
+                if not ok:
+                    raise IOError(f"Server stopped honouring Range requests for {url}")
+    finally:
+        os.close(fd)
+    return True
+
+
 def get_primary_demo() -> str:
     """Get path to primary test demo file."""
     path = ensure_replay(PRIMARY_MATCH_ID)
@@ -159,6 +286,7 @@ def get_secondary_demo() -> str:
 
 def get_test_replay(match_id: int) -> TestReplay:
     """Get test replay metadata by match ID."""
-    if match_id not in TEST_REPLAYS:
+    replay = TEST_REPLAYS.get(match_id)
+    if replay is None:
         raise ValueError(f"Unknown test replay: {match_id}")
-    return TEST_REPLAYS[match_id]
+    return replay
@@ -8,7 +8,7 @@ Verifies exact values from real replay data, not just existence.
 
 import pytest
 
-pytestmark = [pytest.mark.slow, pytest.mark.integration]
+pytestmark = [pytest.mark.slow, pytest.mark.integration, pytest.mark.requires_demo]
 
 
 # Expected values from match 8447659831
@@ -11,7 +11,7 @@ so we don't need manual timestamp calculations.
 import pytest
 
 # Module-level markers: slow integration tests (~5min)
-pytestmark = [pytest.mark.slow, pytest.mark.integration]
+pytestmark = [pytest.mark.slow, pytest.mark.integration, pytest.mark.requires_demo]
 
 # Test data from OpenDota API for match 8447659831
 
@@ -12,8 +12,9 @@ Note: Uses parser_secondary fixture from conftest.py.
 import pytest
 
 # Module-level markers: slow integration tests (~8min)
-pytestmark = [pytest.mark.slow, pytest.mark.integration]
+pytestmark = [pytest.mark.slow, pytest.mark.integration, pytest.mark.requires_demo]
 from collections import defaultdict
+from operator import attrgetter, itemgetter
 from python_manta import (
     Hero, CombatLogType, RuneType,
     NeutralItem, NeutralItemTier
@@ -148,7 +149,7 @@ class TestDamageReport:
                 damage_dealt[hero] += entry.value
 
         print(f"\n=== Damage Report (Hero vs Hero) ===")
-        for hero, dmg in sorted(damage_dealt.items(), key=lambda x: -x[1]):
+        for hero, dmg in sorted(damage_dealt.items(), key=itemgetter(1), reverse=True):
             print(f"  {hero:<25}: {dmg:>10,}")
 
 
@@ -243,7 +244,7 @@ class TestItemUsage:
         for hero in sorted(hero_usage.keys()):
             items = hero_usage[hero]
             print(f"\n{hero}:")
-            for item, count in sorted(items.items(), key=lambda x: -x[1])[:5]:
+            for item, count in sorted(items.items(), key=itemgetter(1), reverse=True)[:5]:
                 print(f"  {item}: {count}x")
 
 
@@ -262,7 +263,7 @@ class TestTeamFightDetector:
         fights = []
         current_fight = []
 
-        for entry in sorted(result.combat_log.entries, key=lambda e: e.tick):
+        for entry in sorted(result.combat_log.entries, key=attrgetter("tick")):
             if not current_fight:
                 current_fight.append(entry)
             elif entry.tick - current_fight[-1].tick <= tick_window:
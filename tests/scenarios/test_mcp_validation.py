@@ -35,7 +35,7 @@ from python_manta import (
     Hero,
 )
 
-pytestmark = [pytest.mark.integration]
+pytestmark = [pytest.mark.integration, pytest.mark.requires_demo]
 
 # Expected values from match 8447659831
 MATCH_ID = 8447659831
@@ -373,7 +373,7 @@ class TestLaningPhaseComparison:
         tick_10min = index.game_started + (10 * 60 * 30)
         snapshot = parser.snapshot(target_tick=tick_10min)
 
-        troll = next((h for h in snapshot.heroes if "troll_warlord" in h.hero_name), None)
+        troll = snapshot.heroes_by_name.get("npc_dota_hero_troll_warlord")
         assert troll is not None
         assert troll.level == 6
         assert troll.team == Team.RADIANT.value
@@ -384,7 +384,7 @@ class TestLaningPhaseComparison:
         tick_10min = index.game_started + (10 * 60 * 30)
         snapshot = parser.snapshot(target_tick=tick_10min)
 
-        bb = next((h for h in snapshot.heroes if "bristleback" in h.hero_name), None)
+        bb = snapshot.heroes_by_name.get("npc_dota_hero_bristleback")
         assert bb is not None
         assert bb.level == 8
 
@@ -445,7 +445,7 @@ class TestHeroSnapshotEconomy:
         tick_15min = index.game_started + (15 * 60 * 30)
         snapshot = parser.snapshot(target_tick=tick_15min)
 
-        troll = next((h for h in snapshot.heroes if "troll_warlord" in h.hero_name), None)
+        troll = snapshot.heroes_by_name.get("npc_dota_hero_troll_warlord")
         assert troll is not None
 
         # Carry should have significant farm by 15 min
@@ -4,9 +4,11 @@ Tests ward placement, expiration, and dewarding lifecycle tracking.
 Uses match 8447659831 (Team Spirit vs Tundra) as reference.
 """
 
+from operator import attrgetter
+
 import pytest
 
-pytestmark = [pytest.mark.slow, pytest.mark.integration]
+pytestmark = [pytest.mark.slow, pytest.mark.integration, pytest.mark.requires_demo]
 
 
 EXPECTED_TOTAL_WARDS = 105
@@ -121,7 +123,7 @@ class TestGameStartClockWithoutCombatLog:
     """
 
     def test_first_ward_is_pre_horn(self, wards_result):
-        first = min(wards_result.events, key=lambda e: e.tick)
+        first = min(wards_result.events, key=attrgetter("tick"))
         assert first.tick == 27886
         assert first.game_time == pytest.approx(-58.6, abs=0.1)
         assert first.game_time_str == "-0:58"
@@ -134,5 +136,5 @@ class TestGameStartClockWithoutCombatLog:
         """The gamerules fallback and the GAME_STATE=5 detector must agree."""
         result = parser.parse(wards={}, combat_log={"types": [4], "max_entries": 5})
         assert result.success
-        first = min(result.wards.events, key=lambda e: e.tick)
+        first = min(result.wards.events, key=attrgetter("tick"))
         assert first.game_time == pytest.approx(-58.6, abs=0.1)